@@ -16,6 +16,13 @@ class EntityCreateException(APIException):
     default_code = "create_failed"
 
 
+# ❌ Exception raised when a bulk insert-or-update fails
+class EntityUpsertException(APIException):
+    status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+    default_detail = "Failed to upsert entities."
+    default_code = "upsert_failed"
+
+
 # ❌ Exception raised when entity update fails
 class EntityUpdateException(APIException):
     status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
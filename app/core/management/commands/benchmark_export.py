@@ -0,0 +1,46 @@
+# 🔄 Import required libraries
+from django.core.management.base import BaseCommand
+from django.test import RequestFactory
+from core.utils.benchmark import measure, synthetic_catalog
+from part.views import PartExportView
+
+
+def consume(view, request):
+    # 🚰 Reads a streamed export to the end, like a client would
+    response = view(request)
+    for _ in response.streaming_content:
+        pass
+
+
+# 🛠️ Command class for measuring export throughput
+class Command(BaseCommand):
+    # 💡 Command description
+    help = (
+        'Measures rows/sec and peak memory of GET /api/v1/parts/export in '
+        'each format. Synthetic parts are inserted and rolled back afterwards.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows', default='10000,50000,100000',
+            help='Comma-separated catalog sizes to measure.',
+        )
+
+    # ⚙️ Main handler method
+    def handle(self, *args, **options):
+        sizes = sorted(int(size) for size in options['rows'].split(','))
+        view = PartExportView.as_view()
+        factory = RequestFactory()
+        self.stdout.write(
+            f"{'rows':>10} {'format':>8} {'rows/s':>12} {'peak KiB':>10}"
+        )
+        for size in synthetic_catalog(sizes):
+            for export_format in ('ndjson', 'csv'):
+                request = factory.get(
+                    '/api/v1/parts/export', {'format': export_format}
+                )
+                peak, elapsed = measure(lambda: consume(view, request))
+                self.stdout.write(
+                    f"{size:>10} {export_format:>8} "
+                    f"{size / elapsed:>12.0f} {peak // 1024:>10}"
+                )
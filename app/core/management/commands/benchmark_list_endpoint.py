@@ -0,0 +1,74 @@
+# 🔄 Import required libraries
+from django.core.management.base import BaseCommand
+from django.http import JsonResponse
+from django.test import RequestFactory
+from rest_framework.views import APIView
+from core.utils.benchmark import requests_per_second, synthetic_catalog
+from core.utils.pagination import MAX_PAGE_SIZE, parse_limit
+from core.utils.redis import bump_model_version
+from core.utils.response import success_response
+from part.views import PartListView, part_service
+
+
+# 🐢 Previous list view: cached rows are decoded, wrapped and re-encoded
+class DecodingPartListView(APIView):
+    def get(self, request):
+        page = part_service.find_page(parse_limit(request.GET.get("limit")))
+        return JsonResponse(
+            success_response(page, "Parts retrieved"), status=200
+        )
+
+
+# 🛠️ Command class for comparing warm-cache list throughput
+class Command(BaseCommand):
+    # 💡 Command description
+    help = (
+        'Compares warm-cache requests/sec of GET /api/v1/parts?limit= with '
+        'decoded and pre-rendered cache entries. Synthetic parts are inserted '
+        'and rolled back afterwards.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows', default=f'100,250,{MAX_PAGE_SIZE}',
+            help=(
+                'Comma-separated page sizes to measure (at most '
+                f'{MAX_PAGE_SIZE}); the catalog holds one full page each.'
+            ),
+        )
+        parser.add_argument(
+            '--seconds', type=float, default=2.0,
+            help='Time spent measuring each view at each size.',
+        )
+
+    # ⚙️ Main handler method
+    def handle(self, *args, **options):
+        sizes = sorted(
+            min(int(size), MAX_PAGE_SIZE) for size in options['rows'].split(',')
+        )
+        factory = RequestFactory()
+        decoding = DecodingPartListView.as_view()
+        rendered = PartListView.as_view()
+        self.stdout.write(
+            f"{'rows':>10} {'decoded req/s':>14} {'rendered req/s':>15} "
+            f"{'speedup':>8}"
+        )
+        try:
+            for size in synthetic_catalog(sizes):
+                # 🔄 Fresh cache version so both views fill from these rows
+                bump_model_version("part")
+
+                request = factory.get('/api/v1/parts', {'limit': size})
+                before = requests_per_second(
+                    decoding, request, options['seconds']
+                )
+                after = requests_per_second(
+                    rendered, request, options['seconds']
+                )
+                self.stdout.write(
+                    f"{size:>10} {before:>14.0f} {after:>15.0f} "
+                    f"{after / before:>7.1f}x"
+                )
+        finally:
+            # 🔄 Cached entries built from the rolled-back rows are discarded
+            bump_model_version("part")
@@ -0,0 +1,69 @@
+# 🔄 Import required libraries
+import re
+from collections import Counter
+from django.core.management.base import BaseCommand
+from core.models import Part
+from core.repositories.part_repository import PartRepository
+from core.utils.benchmark import measure, synthetic_catalog, synthetic_part
+
+# 📝 Synthetic description vocabulary (about 30 words each)
+SAMPLE_WORDS = (
+    "steel bolt nut washer gear spring bracket hinge valve seal gasket "
+    "flange coupling bearing shaft pulley sprocket rivet screw anchor"
+).split()
+
+
+def joined_most_common_words(top_n):
+    # 🐢 Previous implementation: one giant string plus one full token list
+    descriptions = Part.objects.values_list("description", flat=True)
+    all_text = " ".join(filter(None, descriptions)).lower()
+    words = re.findall(r'\b\w+\b', all_text)
+    return Counter(words).most_common(top_n)
+
+
+# 🛠️ Command class for comparing word counting memory use
+class Command(BaseCommand):
+    # 💡 Command description
+    help = (
+        'Compares peak memory of the joined and streaming word counters. '
+        'Synthetic parts are inserted and rolled back afterwards.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows', default='1000,10000,50000',
+            help='Comma-separated catalog sizes to measure.',
+        )
+        parser.add_argument('--chunk-size', type=int, default=2000)
+        parser.add_argument('--top-n', type=int, default=5)
+
+    # ⚙️ Main handler method
+    def handle(self, *args, **options):
+        sizes = sorted(int(size) for size in options['rows'].split(','))
+        repository = PartRepository()
+        self.stdout.write(
+            f"{'rows':>10} {'joined KiB':>12} {'stream KiB':>12} "
+            f"{'joined s':>10} {'stream s':>10}"
+        )
+        for size in synthetic_catalog(sizes, self._part):
+            joined_peak, joined_time = measure(
+                lambda: joined_most_common_words(options['top_n'])
+            )
+            stream_peak, stream_time = measure(
+                lambda: repository.most_common_words_streaming(
+                    options['top_n'], options['chunk_size']
+                )
+            )
+            self.stdout.write(
+                f"{size:>10} {joined_peak // 1024:>12} "
+                f"{stream_peak // 1024:>12} "
+                f"{joined_time:>10.3f} {stream_time:>10.3f}"
+            )
+
+    @staticmethod
+    def _part(i):
+        # 🧪 Synthetic part with a varied description, so counts differ
+        words = [
+            SAMPLE_WORDS[(i * 7 + j * 3) % len(SAMPLE_WORDS)] for j in range(30)
+        ]
+        return synthetic_part(i, " ".join(words) + f" lot{i % 500}")
@@ -0,0 +1,33 @@
+# 🔄 Import required libraries
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from core.repositories.part_repository import PartRepository
+from core.utils.parallel import reset_process_pool
+
+
+# 🛠️ Command class for counting description words across processes
+class Command(BaseCommand):
+    # 💡 Command description
+    help = 'Counts the most common description words using worker processes.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top-n', type=int, default=10)
+        parser.add_argument(
+            '--workers', type=int, default=None,
+            help='Worker processes (defaults to WORD_STATS_WORKERS).',
+        )
+
+    # ⚙️ Main handler method
+    def handle(self, *args, **options):
+        workers = options['workers'] or getattr(settings, 'WORD_STATS_WORKERS', 4)
+        self.stdout.write(f'Counting words with {workers} workers...')
+        try:
+            words = PartRepository().most_common_words_parallel(
+                options['top_n'], workers=workers
+            )
+        finally:
+            # 🧹 Do not leave worker processes behind after a one-off run
+            reset_process_pool()
+        for word, count in words:
+            self.stdout.write(f'{count:>10}  {word}')
+        self.stdout.write(self.style.SUCCESS('Done.'))
@@ -0,0 +1,130 @@
+# 🔄 Import required libraries
+import csv
+import json
+import sys
+import time
+from django.core.management.base import BaseCommand, CommandError
+from core.services.part_service import PartService
+from part.serializers import PartBulkSerializer, validate_many
+
+# 📄 Input formats read by the command
+IMPORT_FORMATS = ("ndjson", "csv")
+
+
+# 🛠️ Command class for bulk-loading a vendor catalog
+class Command(BaseCommand):
+    # 💡 Command description
+    help = (
+        'Streams parts from an NDJSON or CSV file (or stdin) into the catalog, '
+        'validating in batches and upserting by SKU (COPY + merge on '
+        'PostgreSQL). Invalid rows are skipped and reported.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'path', nargs='?', default='-',
+            help='File to read, or - for stdin (default).',
+        )
+        parser.add_argument(
+            '--format', choices=IMPORT_FORMATS,
+            help='Input format (default: from the file extension, else ndjson).',
+        )
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument(
+            '--show-errors', type=int, default=20,
+            help='Rejected rows printed in full; the rest are only counted.',
+        )
+
+    # ⚙️ Main handler method
+    def handle(self, *args, **options):
+        path = options['path']
+        input_format = options['format'] or (
+            'csv' if path.lower().endswith('.csv') else 'ndjson'
+        )
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be a positive integer.')
+        self.show_errors = options['show_errors']
+        self.rejected = 0
+
+        started = time.perf_counter()
+        if path == '-':
+            summary = self._import(sys.stdin, input_format, options)
+        else:
+            try:
+                stream = open(path, newline='', encoding='utf-8')
+            except OSError as e:
+                raise CommandError(f'Cannot read {path}: {e}')
+            with stream:
+                summary = self._import(stream, input_format, options)
+        elapsed = time.perf_counter() - started
+
+        # ✅ Print the summary with throughput and rejections
+        rate = summary['rows'] / elapsed if elapsed else 0
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {summary['rows']} rows in {elapsed:.1f}s "
+            f"({rate:.0f} rows/s): {summary['created']} created, "
+            f"{summary['updated']} updated, {summary['unchanged']} unchanged, "
+            f"{self.rejected} rejected."
+        ))
+
+    def _import(self, stream, input_format, options):
+        records = (
+            self._read_csv(stream) if input_format == 'csv'
+            else self._read_ndjson(stream)
+        )
+        return PartService().import_parts(
+            self._valid_batches(records, options['batch_size'])
+        )
+
+    def _valid_batches(self, records, batch_size):
+        # 📦 Validates batch_size records at a time, yielding the valid rows
+        batch = []
+        for line, record in records:
+            batch.append((line, record))
+            if len(batch) >= batch_size:
+                yield self._validate(batch)
+                batch = []
+        if batch:
+            yield self._validate(batch)
+
+    def _validate(self, batch):
+        # ✅ One serializer pass per batch; non-object records are rejected
+        records = [
+            (line, record) for line, record in batch
+            if isinstance(record, dict) or self._reject(line, record)
+        ]
+        valid, errors = validate_many(
+            PartBulkSerializer, [record for _, record in records]
+        )
+        for error in errors:
+            self._reject(records[error['index']][0], error['errors'])
+        return [data for _, data in valid]
+
+    def _reject(self, line, errors):
+        # 🚫 Counts a rejected record, printing the first few in full
+        self.rejected += 1
+        if self.rejected <= self.show_errors:
+            self.stderr.write(f'line {line}: {errors}')
+        return False
+
+    @staticmethod
+    def _read_ndjson(stream):
+        # 📝 (line number, object) per non-blank line; bad JSON is passed on
+        # as an error message so the validator rejects it
+        for line, text in enumerate(stream, start=1):
+            if not text.strip():
+                continue
+            try:
+                yield line, json.loads(text)
+            except ValueError as e:
+                yield line, f'invalid JSON: {e}'
+
+    @staticmethod
+    def _read_csv(stream):
+        # 🧾 (line number, dict) per row; a blank is_active takes the default
+        reader = csv.DictReader(stream)
+        for record in reader:
+            record.pop(None, None)  # 🧹 Extra, unnamed columns
+            if record.get('is_active') == '':
+                del record['is_active']
+            yield reader.line_num, record
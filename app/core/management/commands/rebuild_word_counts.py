@@ -0,0 +1,18 @@
+# 🔄 Import required libraries
+from django.core.management.base import BaseCommand
+from core.services.part_service import PartService
+
+
+# 🛠️ Command class for rebuilding the word-frequency index
+class Command(BaseCommand):
+    # 💡 Command description
+    help = 'Recomputes the description word counts from every part.'
+
+    # ⚙️ Main handler method
+    def handle(self, *args, **options):
+        self.stdout.write('Rebuilding word counts...')
+        words = PartService().rebuild_word_counts()
+        # ✅ Print success message with the number of distinct words
+        self.stdout.write(
+            self.style.SUCCESS(f'Word counts rebuilt ({words} distinct words).')
+        )
@@ -0,0 +1,28 @@
+# Generated by Django 3.2.25 on 2026-10-18 12:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Part',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=150)),
+                ('sku', models.CharField(max_length=30)),
+                ('description', models.TextField(max_length=1024)),
+                ('weight_ounces', models.PositiveIntegerField()),
+                ('is_active', models.BooleanField(default=True)),
+            ],
+            options={
+                'db_table': 'part',
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 3.2.25 on 2026-10-18 12:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='part',
+            name='sku',
+            field=models.CharField(max_length=30, unique=True),
+        ),
+    ]
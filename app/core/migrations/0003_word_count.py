@@ -0,0 +1,47 @@
+# Generated by Django 3.2.25 on 2026-10-18 12:08
+
+from collections import Counter
+import re
+
+from django.db import migrations, models
+
+
+def backfill_word_counts(apps, schema_editor):
+    # Seed the index from the parts that already exist
+    Part = apps.get_model('core', 'Part')
+    WordCount = apps.get_model('core', 'WordCount')
+    counts = Counter()
+    descriptions = Part.objects.values_list('description', flat=True)
+    for description in descriptions.iterator(chunk_size=2000):
+        if description:
+            counts.update(re.findall(r'\b\w+\b', description.lower()))
+    WordCount.objects.bulk_create(
+        [WordCount(word=word, count=n) for word, n in counts.items()],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_part_sku_unique'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WordCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('word', models.CharField(max_length=1024, unique=True)),
+                ('count', models.IntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'word_count',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='wordcount',
+            index=models.Index(fields=['-count', 'word'], name='word_count_top_idx'),
+        ),
+        migrations.RunPython(backfill_word_counts, migrations.RunPython.noop),
+    ]
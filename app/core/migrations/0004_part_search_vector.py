@@ -0,0 +1,40 @@
+from django.db import migrations
+
+# Weighted search document: name matches (A) outrank description matches (B).
+# The column is generated by PostgreSQL and kept outside the Django model,
+# so the ORM never tries to write it.
+ADD_SEARCH_VECTOR_SQL = """
+    ALTER TABLE part ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(name, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'B')
+    ) STORED;
+    CREATE INDEX part_search_vector_idx ON part USING GIN (search_vector);
+"""
+
+DROP_SEARCH_VECTOR_SQL = """
+    DROP INDEX IF EXISTS part_search_vector_idx;
+    ALTER TABLE part DROP COLUMN IF EXISTS search_vector;
+"""
+
+
+def add_search_vector(apps, schema_editor):
+    # Other backends search with the LIKE fallback instead
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(ADD_SEARCH_VECTOR_SQL)
+
+
+def drop_search_vector(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(DROP_SEARCH_VECTOR_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_word_count'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_search_vector, drop_search_vector),
+    ]
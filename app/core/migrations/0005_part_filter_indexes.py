@@ -0,0 +1,29 @@
+# Generated by Django 3.2.25 on 2026-10-18 12:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_part_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='part',
+            index=models.Index(fields=['is_active', 'id'], name='part_active_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='part',
+            index=models.Index(fields=['is_active', 'weight_ounces', 'id'], name='part_active_weight_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='part',
+            index=models.Index(fields=['weight_ounces', 'id'], name='part_weight_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='part',
+            index=models.Index(fields=['name', 'id'], name='part_name_idx'),
+        ),
+    ]
@@ -5,7 +5,9 @@ from django.db import models
 class Part(models.Model):
     # 📝 Basic part information
     name = models.CharField(max_length=150)  # Part name/title
-    sku = models.CharField(max_length=30)    # Stock keeping unit identifier
+    sku = models.CharField(
+        max_length=30, unique=True
+    )  # Stock keeping unit identifier (unique, upsert key)
     description = models.TextField(
         max_length=1024
     )  # Detailed part description
@@ -24,3 +26,35 @@ class Part(models.Model):
     class Meta:
         # 🗃️ Database configuration
         db_table = "part"
+        # ⚡ Indexes behind the list filters and orderings (ID breaks ties
+        # so keyset pages walk the index)
+        indexes = [
+            models.Index(fields=["is_active", "id"], name="part_active_id_idx"),
+            models.Index(
+                fields=["is_active", "weight_ounces", "id"],
+                name="part_active_weight_idx",
+            ),
+            models.Index(fields=["weight_ounces", "id"], name="part_weight_idx"),
+            models.Index(fields=["name", "id"], name="part_name_idx"),
+            # 🔤 sku LIKE 'prefix%' uses the varchar_pattern_ops index that
+            # PostgreSQL gets automatically for the unique sku (part_sku_*_like)
+        ]
+
+
+class WordCount(models.Model):
+    # 🔢 Number of times a word appears across all part descriptions
+    # 📝 Maintained incrementally by PartService on every write
+    word = models.CharField(max_length=1024, unique=True)
+    count = models.IntegerField(default=0)
+
+    def __str__(self):
+        # 🔤 String representation of a word count
+        return f"{self.word}: {self.count}"
+
+    class Meta:
+        # 🗃️ Database configuration
+        db_table = "word_count"
+        # ⚡ Top-N reads walk this index instead of sorting the table
+        indexes = [
+            models.Index(fields=["-count", "word"], name="word_count_top_idx"),
+        ]
@@ -1,5 +1,7 @@
 # 🔄 Import required Django and custom exceptions
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import transaction
+from django.db.models import Max, Q
 from ..utils.logger import get_logger
 from ..exceptions.custom_exceptions import (
     EntityNotFoundException,
@@ -18,6 +20,11 @@ class BaseRepository:
         self.model = model_class
         self.logger = get_logger(f"{model_class.__name__}Repository")
 
+    # 🏷️ Column names a full row dict carries, in model order
+    @property
+    def field_names(self):
+        return tuple(field.name for field in self.model._meta.concrete_fields)
+
     # ➕ Create new entity
     def create(self, data: dict):
         try:
@@ -36,6 +43,28 @@ class BaseRepository:
             )
             raise EntityCreateException()
 
+    # 📦 Create many entities in batched INSERTs inside one transaction
+    def bulk_create(self, rows: list, batch_size: int = 500):
+        try:
+            with transaction.atomic():
+                instances = self.model.objects.bulk_create(
+                    [self.model(**data) for data in rows],
+                    batch_size=batch_size,
+                )
+            # ✅ Log success (row count only; payloads can be huge)
+            self.logger.info(
+                "🟢 Entities bulk created successfully",
+                extra={"count": len(instances)}
+            )
+            return instances
+        except Exception as e:
+            # ❌ Log failure
+            self.logger.error(
+                "❌ Failed to bulk create entities",
+                extra={"count": len(rows), "error": str(e)}
+            )
+            raise EntityCreateException()
+
     # 📝 Update existing entity
     def update(self, instance, data: dict):
         try:
@@ -78,10 +107,57 @@ class BaseRepository:
             )
             raise EntityFetchException()
 
-    # 📋 Get all entities
-    def find_all(self):
+    # 🧾 Find one entity as a row dict of the given fields (no instance)
+    def find_row_by_id(self, pk, fields=None):
+        try:
+            row = (
+                self.model.objects.filter(pk=pk)
+                .values(*(fields or self.field_names))
+                .first()
+            )
+        except Exception as e:
+            # ❌ Log failure
+            self.logger.error(
+                "❌ Error retrieving entity",
+                extra={"id": pk, "error": str(e)}
+            )
+            raise EntityFetchException()
+        if row is None:
+            # ⚠️ Not found
+            self.logger.warning("⚠️ Entity not found", extra={"id": pk})
+            raise EntityNotFoundException()
+        # ✅ Log success
+        self.logger.info("🟢 Entity retrieved", extra={"id": pk})
+        return row
+
+    # 🧾 Find many entities as row dicts with one id__in query
+    def find_rows_by_ids(self, ids, fields=None):
+        ids = list(ids)
+        try:
+            rows = list(
+                self.model.objects.filter(pk__in=ids)
+                .values(*(fields or self.field_names))
+            )
+            # ✅ Log success
+            self.logger.info(
+                "🟢 Entities retrieved by ID",
+                extra={"requested": len(ids), "count": len(rows)},
+            )
+            return rows
+        except Exception as e:
+            # ❌ Log failure
+            self.logger.error(
+                "❌ Failed to retrieve entities by ID",
+                extra={"requested": len(ids), "error": str(e)},
+            )
+            raise EntityFetchException()
+
+    # 📋 Get all entities (row dicts of the given fields when fields is set)
+    def find_all(self, fields=None):
         try:
             instances = self.model.objects.all()
+            if fields:
+                instances = instances.values(*fields)
             # ✅ Log success
             self.logger.info("🟢 All entities retrieved successfully")
             return instances
@@ -93,6 +169,115 @@ class BaseRepository:
             )
             raise EntityFetchAllException()
 
+    # 🚰 Stream row dicts in ID order through a server-side cursor
+    def iter_rows(self, after_id=None, fields=None, chunk_size: int = 2000):
+        """
+        🚰 Lazily yields every row after after_id as a dict, chunk_size rows
+        per fetch, so memory stays flat whatever the table size.
+
+        Args:
+            after_id (int): 📌 Last ID already consumed (resume point)
+            fields (tuple): 🏷️ Columns to select (all when omitted)
+            chunk_size (int): 📦 Rows fetched per round trip
+
+        Returns:
+            iterator: 📝 Row dicts; the query runs on first iteration
+        """
+        queryset = self.model.objects.order_by("id")
+        if after_id is not None:
+            queryset = queryset.filter(id__gt=after_id)
+        return queryset.values(*(fields or self.field_names)).iterator(
+            chunk_size=chunk_size
+        )
+
+    # 🔢 Get the highest existing ID (0 when the table is empty)
+    def find_max_id(self):
+        try:
+            return self.model.objects.aggregate(max_id=Max("id"))["max_id"] or 0
+        except Exception as e:
+            # ❌ Log failure
+            self.logger.error(
+                "❌ Failed to retrieve max entity ID",
+                extra={"error": str(e)},
+            )
+            raise EntityFetchException()
+
+    # 📄 Get one keyset page of entities ordered by ID
+    def find_page(self, limit: int, after_id=None, fields=None):
+        try:
+            queryset = self.model.objects.order_by("id")
+            if after_id is not None:
+                queryset = queryset.filter(id__gt=after_id)
+            if fields:
+                queryset = queryset.values(*fields)
+            instances = list(queryset[:limit])
+            # ✅ Log success
+            self.logger.info(
+                "🟢 Entity page retrieved",
+                extra={"after_id": after_id, "count": len(instances)},
+            )
+            return instances
+        except Exception as e:
+            # ❌ Log failure
+            self.logger.error(
+                "❌ Failed to retrieve entity page",
+                extra={"after_id": after_id, "error": str(e)},
+            )
+            raise EntityFetchAllException()
+
+    # 🔎 Get one keyset page of filtered entities in the given ordering
+    def find_filtered_page(self, filters: dict, ordering: str, limit: int,
+                           after=None, fields=None):
+        """
+        🔎 Pushes filters and ordering into one indexed query.
+
+        Args:
+            filters (dict): 🧹 ORM lookups, e.g. {"weight_ounces__gte": 5}
+            ordering (str): ↕️ Field name, "-" prefixed for descending; ties
+                are broken by ID in the same direction
+            limit (int): 📏 Maximum number of rows to return
+            after (tuple): 📌 (value, id) of the last row already returned,
+                or (id,) when ordering by ID
+            fields (tuple): 🏷️ Columns to select; rows come back as dicts
+                instead of model instances when given
+
+        Returns:
+            list: 📝 Model instances, or row dicts when fields is given
+        """
+        field = ordering.lstrip("-")
+        descending = ordering.startswith("-")
+        op = "lt" if descending else "gt"
+        try:
+            queryset = self.model.objects.filter(**filters)
+            if field == "id":
+                queryset = queryset.order_by(ordering)
+                if after is not None:
+                    queryset = queryset.filter(**{f"id__{op}": after[-1]})
+            else:
+                queryset = queryset.order_by(ordering, "-id" if descending else "id")
+                if after is not None:
+                    value, pk = after
+                    queryset = queryset.filter(
+                        Q(**{f"{field}__{op}": value})
+                        | Q(**{field: value, f"id__{op}": pk})
+                    )
+            if fields:
+                queryset = queryset.values(*fields)
+            instances = list(queryset[:limit])
+            # ✅ Log success
+            self.logger.info(
+                "🟢 Filtered entity page retrieved",
+                extra={"ordering": ordering, "count": len(instances)},
+            )
+            return instances
+        except Exception as e:
+            # ❌ Log failure
+            self.logger.error(
+                "❌ Failed to retrieve filtered entity page",
+                extra={"ordering": ordering, "error": str(e)},
+            )
+            raise EntityFetchAllException()
+
     # 🗑️ Delete entity
     def delete(self, instance):
         try:
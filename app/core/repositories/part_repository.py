@@ -2,8 +2,120 @@
 # Inherits from BaseRepository to provide CRUD operations
 from .base_repository import BaseRepository
 from ..models import Part
-from collections import Counter  # 🔢 For counting word frequencies
-import re  # 🔍 For text pattern matching
+from ..exceptions.custom_exceptions import EntityUpsertException
+from ..utils.parallel import run_in_process_pool
+from ..utils.text import count_words_in_chunks, top_words
+from collections import Counter  # 🔢 For merging partial word counts
+import csv  # 📥 COPY payloads are written as CSV
+import io
+from django.db import connection, connections, transaction
+from django.db.models import Case, IntegerField, Max, Min, Q, Value, When
+
+# 🔁 Columns written by a SKU-keyed upsert (sku is the conflict key)
+UPSERT_FIELDS = ("name", "sku", "description", "weight_ounces", "is_active")
+UPSERT_UPDATE_FIELDS = tuple(f for f in UPSERT_FIELDS if f != "sku")
+
+# 🐘 One INSERT ... ON CONFLICT per batch; the WHERE clause skips rows whose
+# content is unchanged, and xmax = 0 tells inserted rows from updated ones
+POSTGRES_UPSERT_SQL = """
+    INSERT INTO part ({columns}) VALUES %s
+    ON CONFLICT (sku) DO UPDATE SET {assignments}
+    WHERE ({current}) IS DISTINCT FROM ({excluded})
+    RETURNING id, (xmax = 0) AS inserted
+""".format(
+    columns=", ".join(UPSERT_FIELDS),
+    assignments=", ".join(f"{f} = EXCLUDED.{f}" for f in UPSERT_UPDATE_FIELDS),
+    current=", ".join(f"part.{f}" for f in UPSERT_UPDATE_FIELDS),
+    excluded=", ".join(f"EXCLUDED.{f}" for f in UPSERT_UPDATE_FIELDS),
+)
+
+# 🐘 Imports COPY into a session-local staging table with part's column
+# types, plus the input order so a repeated SKU keeps its last occurrence,
+# then merge into part with one upsert over the distinct SKUs
+POSTGRES_IMPORT_STAGING_SQL = """
+    CREATE TEMP TABLE part_import ON COMMIT DROP AS
+        SELECT {columns} FROM part WITH NO DATA;
+    ALTER TABLE part_import ADD COLUMN seq bigserial;
+""".format(columns=", ".join(UPSERT_FIELDS))
+POSTGRES_IMPORT_COPY_SQL = (
+    "COPY part_import ({columns}) FROM STDIN WITH (FORMAT csv)"
+).format(columns=", ".join(UPSERT_FIELDS))
+POSTGRES_IMPORT_MERGE_SQL = """
+    INSERT INTO part ({columns})
+    SELECT DISTINCT ON (sku) {columns} FROM part_import
+    ORDER BY sku, seq DESC
+    ON CONFLICT (sku) DO UPDATE SET {assignments}
+    WHERE ({current}) IS DISTINCT FROM ({excluded})
+    RETURNING id, (xmax = 0) AS inserted
+""".format(
+    columns=", ".join(UPSERT_FIELDS),
+    assignments=", ".join(f"{f} = EXCLUDED.{f}" for f in UPSERT_UPDATE_FIELDS),
+    current=", ".join(f"part.{f}" for f in UPSERT_UPDATE_FIELDS),
+    excluded=", ".join(f"EXCLUDED.{f}" for f in UPSERT_UPDATE_FIELDS),
+)
+
+
+# 🐘 Tokenize and count inside PostgreSQL; (\w+) on lower() matches the
+# Python \b\w+\b tokenizer, and COLLATE "C" breaks ties by code point.
+# ORDER BY repeats the expression: an output alias is only resolved there
+# when it stands alone, not inside `word COLLATE "C"`.
+POSTGRES_MOST_COMMON_WORDS_SQL = r"""
+    SELECT m.tokens[1] AS word, COUNT(*) AS occurrences
+    FROM part
+    CROSS JOIN LATERAL regexp_matches(lower(description), '(\w+)', 'g')
+        AS m(tokens)
+    GROUP BY m.tokens[1]
+    ORDER BY occurrences DESC, m.tokens[1] COLLATE "C"
+    LIMIT %s
+"""
+
+# 🔎 Ranked full-text search over the generated search_vector column (GIN);
+# rank is cast to float8 so keyset cursors compare it exactly
+POSTGRES_SEARCH_SQL = """
+    SELECT id, name, sku, description, weight_ounces, is_active, rank
+    FROM (
+        SELECT part.*, ts_rank_cd(search_vector, query)::float8 AS rank
+        FROM part, plainto_tsquery('english', %s) AS query
+        WHERE search_vector @@ query
+    ) AS ranked
+    {after}
+    ORDER BY rank DESC, id
+    LIMIT %s
+"""
+SEARCH_COLUMNS = (
+    "id", "name", "sku", "description", "weight_ounces", "is_active", "rank"
+)
+
+# 🧩 ID ranges per worker, so one slow range does not idle the others
+RANGES_PER_WORKER = 4
+
+
+def split_id_range(low, high, parts):
+    # ✂️ Splits [low, high] into at most `parts` contiguous [start, stop) ranges
+    span = high - low + 1
+    step = max(1, -(-span // parts))
+    return [
+        (start, min(start + step, high + 1))
+        for start in range(low, high + 1, step)
+    ]
+
+
+def count_words_in_id_range(start, stop, chunk_size=2000):
+    # 🔢 Counts description words for parts with start <= id < stop
+    descriptions = Part.objects.filter(id__gte=start, id__lt=stop).values_list(
+        "description", flat=True
+    )
+    return count_words_in_chunks(
+        descriptions.iterator(chunk_size=chunk_size), chunk_size
+    )
+
+
+def _count_words_in_id_range_worker(start, stop, chunk_size):
+    # 🧵 Pool entry point: count one range, then release the DB connection
+    try:
+        return count_words_in_id_range(start, stop, chunk_size)
+    finally:
+        connections.close_all()
 
 
 class PartRepository(BaseRepository):
@@ -20,9 +132,296 @@ class PartRepository(BaseRepository):
         # 🔄 Initialize repository with Part model
         super().__init__(Part)
 
+    def find_existing_skus(self, skus):
+        """
+        🔎 Returns the subset of the given SKUs that already exist.
+
+        Args:
+            skus (iterable): 🏷️ SKUs to look up (one query)
+
+        Returns:
+            set: 🏷️ SKUs present in the database
+        """
+        return set(
+            self.model.objects.filter(sku__in=list(skus)).values_list(
+                "sku", flat=True
+            )
+        )
+
+    def find_descriptions_by_sku(self, skus):
+        """
+        📝 Returns the current descriptions of the given SKUs, row-locked.
+
+        Args:
+            skus (iterable): 🏷️ SKUs about to be overwritten
+
+        Returns:
+            dict: 🏷️ sku -> description for the SKUs that exist
+        """
+        return dict(
+            self.model.objects.select_for_update()
+            .filter(sku__in=list(skus))
+            .values_list("sku", "description")
+        )
+
+    def count_description_words(self, chunk_size=2000):
+        """
+        🔢 Counts every word across all descriptions, streaming the rows.
+
+        Args:
+            chunk_size (int): 🚰 Descriptions fetched and tokenized at a time
+
+        Returns:
+            Counter: 📊 word -> number of occurrences
+        """
+        descriptions = self.model.objects.values_list("description", flat=True)
+        return count_words_in_chunks(
+            descriptions.iterator(chunk_size=chunk_size), chunk_size
+        )
+
+    def bulk_upsert(self, rows, batch_size=1000):
+        """
+        🔁 Inserts or updates parts keyed by SKU, writing only changed rows.
+
+        Args:
+            rows (list): 📝 Validated part dicts; a repeated SKU keeps its
+                last occurrence
+            batch_size (int): 📦 Rows per statement
+
+        Returns:
+            dict: 📊 created/updated/unchanged counts and the updated IDs
+        """
+        # 🧹 One row per SKU; missing is_active takes the model default
+        by_sku = {}
+        for row in rows:
+            by_sku[row["sku"]] = {"is_active": True, **row}
+        unique_rows = list(by_sku.values())
+
+        summary = {"created": 0, "updated": 0, "unchanged": 0, "updated_ids": []}
+        try:
+            with transaction.atomic():
+                for start in range(0, len(unique_rows), batch_size):
+                    batch = unique_rows[start:start + batch_size]
+                    if connection.vendor == "postgresql":
+                        created, updated_ids = self._upsert_batch_postgres(batch)
+                    else:
+                        created, updated_ids = self._upsert_batch_orm(batch)
+                    summary["created"] += created
+                    summary["updated"] += len(updated_ids)
+                    summary["updated_ids"].extend(updated_ids)
+            summary["unchanged"] = (
+                len(unique_rows) - summary["created"] - summary["updated"]
+            )
+            # ✅ Log success (counts only; payloads can be huge)
+            self.logger.info(
+                "🟢 Entities upserted successfully",
+                extra={
+                    "created_rows": summary["created"],
+                    "updated_rows": summary["updated"],
+                    "unchanged_rows": summary["unchanged"],
+                },
+            )
+            return summary
+        except Exception as e:
+            # ❌ Log failure
+            self.logger.error(
+                "❌ Failed to upsert entities",
+                extra={"count": len(unique_rows), "error": str(e)},
+            )
+            raise EntityUpsertException()
+
+    def _upsert_batch_postgres(self, batch):
+        # 🐘 Single INSERT ... ON CONFLICT (sku) DO UPDATE statement
+        from psycopg2.extras import execute_values
+
+        values = [tuple(row[f] for f in UPSERT_FIELDS) for row in batch]
+        with connection.cursor() as cursor:
+            returned = execute_values(
+                cursor.cursor,
+                POSTGRES_UPSERT_SQL,
+                values,
+                page_size=len(values),
+                fetch=True,
+            )
+        created = sum(1 for _, inserted in returned if inserted)
+        updated_ids = [pk for pk, inserted in returned if not inserted]
+        return created, updated_ids
+
+    def _upsert_batch_orm(self, batch):
+        # 🗃️ Portable fallback: one SELECT, one bulk INSERT, one bulk UPDATE
+        existing = {
+            part.sku: part
+            for part in self.model.objects.select_for_update().filter(
+                sku__in=[row["sku"] for row in batch]
+            )
+        }
+        to_create, to_update = [], []
+        for row in batch:
+            current = existing.get(row["sku"])
+            if current is None:
+                to_create.append(self.model(**row))
+            elif any(getattr(current, f) != row[f] for f in UPSERT_UPDATE_FIELDS):
+                for f in UPSERT_UPDATE_FIELDS:
+                    setattr(current, f, row[f])
+                to_update.append(current)
+        self.model.objects.bulk_create(to_create)
+        self.model.objects.bulk_update(to_update, UPSERT_UPDATE_FIELDS)
+        return len(to_create), [part.id for part in to_update]
+
+    def import_batches(self, batches):
+        """
+        📥 Loads batches of validated part dicts keyed by SKU: new SKUs are
+        inserted, changed ones updated. Call inside a transaction.
+
+        Args:
+            batches (iterable): 📦 Lists of validated part dicts, consumed
+                lazily so the whole input never sits in memory
+
+        Returns:
+            dict: 📊 rows read, created/updated/unchanged counts and the
+                updated IDs
+        """
+        try:
+            if connection.vendor == "postgresql":
+                summary = self._import_postgres(batches)
+            else:
+                summary = self._import_orm(batches)
+            # ✅ Log success (counts only; payloads can be huge)
+            self.logger.info(
+                "🟢 Entities imported successfully",
+                extra={
+                    "imported_rows": summary["rows"],
+                    "created_rows": summary["created"],
+                    "updated_rows": summary["updated"],
+                    "unchanged_rows": summary["unchanged"],
+                },
+            )
+            return summary
+        except Exception as e:
+            # ❌ Log failure
+            self.logger.error(
+                "❌ Failed to import entities", extra={"error": str(e)}
+            )
+            raise EntityUpsertException()
+
+    def _import_postgres(self, batches):
+        # 🐘 COPY every batch into the staging table, then merge once
+        rows = 0
+        with connection.cursor() as cursor:
+            cursor.execute(POSTGRES_IMPORT_STAGING_SQL)
+            for batch in batches:
+                buffer = io.StringIO()
+                writer = csv.writer(buffer, quoting=csv.QUOTE_ALL)
+                for row in batch:
+                    row = {"is_active": True, **row}
+                    writer.writerow([
+                        ("t" if row[f] else "f") if f == "is_active" else row[f]
+                        for f in UPSERT_FIELDS
+                    ])
+                buffer.seek(0)
+                cursor.copy_expert(POSTGRES_IMPORT_COPY_SQL, buffer)
+                rows += len(batch)
+            cursor.execute("SELECT COUNT(DISTINCT sku) FROM part_import")
+            distinct = cursor.fetchone()[0]
+            cursor.execute(POSTGRES_IMPORT_MERGE_SQL)
+            returned = cursor.fetchall()
+        created = sum(1 for _, inserted in returned if inserted)
+        updated_ids = [pk for pk, inserted in returned if not inserted]
+        return {
+            "rows": rows,
+            "created": created,
+            "updated": len(updated_ids),
+            "unchanged": distinct - created - len(updated_ids),
+            "updated_ids": updated_ids,
+        }
+
+    def _import_orm(self, batches):
+        # 🗃️ Portable fallback: the bulk_create / bulk_update upsert per batch.
+        # Counts are per distinct SKU, as in the single merge on PostgreSQL: a
+        # SKU created by an earlier batch and changed by a later one is only
+        # "created", and one changed by several batches is updated once.
+        rows, seen, created_skus, updated_ids = 0, set(), set(), {}
+        for batch in batches:
+            skus = {row["sku"] for row in batch}
+            ids = dict(
+                self.model.objects.filter(sku__in=skus).values_list("sku", "id")
+            )
+            created_skus |= skus - ids.keys()
+            created_here = {ids[sku] for sku in created_skus & ids.keys()}
+            seen |= skus
+            rows += len(batch)
+            for pk in self.bulk_upsert(batch)["updated_ids"]:
+                if pk not in created_here:
+                    updated_ids[pk] = None  # 📌 Ordered set
+        return {
+            "rows": rows,
+            "created": len(created_skus),
+            "updated": len(updated_ids),
+            "unchanged": len(seen) - len(created_skus) - len(updated_ids),
+            "updated_ids": list(updated_ids),
+        }
+
+    def search(self, terms, limit, after=None):
+        """
+        🔎 Returns parts matching every search term, best match first.
+
+        Args:
+            terms (list): 🔤 Normalized (lowercase) search words
+            limit (int): 📏 Maximum number of rows to return
+            after (tuple): 📌 (rank, id) of the last row already returned
+
+        Returns:
+            list: 📝 Part dicts with an extra "rank" key, ordered by rank
+                descending then ID
+        """
+        if connection.vendor == "postgresql":
+            return self._search_postgres(terms, limit, after)
+        return self._search_like(terms, limit, after)
+
+    def _search_postgres(self, terms, limit, after):
+        # 🐘 GIN-indexed tsvector match ranked by ts_rank_cd
+        params = [" ".join(terms)]
+        after_sql = ""
+        if after is not None:
+            after_sql = "WHERE rank < %s OR (rank = %s AND id > %s)"
+            params.extend([after[0], after[0], after[1]])
+        params.append(limit)
+        with connection.cursor() as cursor:
+            cursor.execute(POSTGRES_SEARCH_SQL.format(after=after_sql), params)
+            return [dict(zip(SEARCH_COLUMNS, row)) for row in cursor.fetchall()]
+
+    def _search_like(self, terms, limit, after):
+        # 🗃️ Portable fallback: every term in name or description; a name
+        # match scores 2 and a description match 1 per term
+        queryset = self.model.objects.all()
+        score = Value(0, output_field=IntegerField())
+        for term in terms:
+            queryset = queryset.filter(
+                Q(name__icontains=term) | Q(description__icontains=term)
+            )
+            score = score + Case(
+                When(name__icontains=term, then=Value(2)),
+                default=Value(0),
+                output_field=IntegerField(),
+            ) + Case(
+                When(description__icontains=term, then=Value(1)),
+                default=Value(0),
+                output_field=IntegerField(),
+            )
+        queryset = queryset.annotate(rank=score)
+        if after is not None:
+            queryset = queryset.filter(
+                Q(rank__lt=after[0]) | Q(rank=after[0], id__gt=after[1])
+            )
+        return list(
+            queryset.order_by("-rank", "id").values(*SEARCH_COLUMNS)[:limit]
+        )
+
     def most_common_words_in_descriptions(self, top_n=5):
         """
         🔍 Returns the top N most common words across all part descriptions.
+        On PostgreSQL the counting runs in the database; other backends
+        fall back to counting in Python. Ties are ordered by word.
 
         Args:
             top_n (int): 🔢 Number of most common words to return (default=5)
@@ -30,16 +429,78 @@ class PartRepository(BaseRepository):
         Returns:
             list: 📊 List of tuples containing (word, frequency) pairs
         """
-        # 📝 Get all descriptions from database
-        descriptions = self.model.objects.values_list("description", flat=True)
+        if top_n < 1:
+            return []
+        if connection.vendor == "postgresql":
+            return self._most_common_words_postgres(top_n)
+        return self._most_common_words_python(top_n)
+
+    def _most_common_words_postgres(self, top_n):
+        # 🐘 Only the top N (word, count) rows leave the database
+        # ⚠️ Matches Python's Unicode \w when the database ctype is UTF-8
+        with connection.cursor() as cursor:
+            cursor.execute(POSTGRES_MOST_COMMON_WORDS_SQL, [top_n])
+            return [(word, count) for word, count in cursor.fetchall()]
+
+    def most_common_words_streaming(self, top_n=5, chunk_size=2000):
+        """
+        🚰 Returns the top N words, counting descriptions chunk by chunk.
+        Peak memory is one chunk plus the vocabulary, whatever the row count.
+
+        Args:
+            top_n (int): 🔢 Number of most common words to return (default=5)
+            chunk_size (int): 🚰 Descriptions fetched and tokenized at a time
+
+        Returns:
+            list: 📊 List of tuples containing (word, frequency) pairs
+        """
+        if top_n < 1:
+            return []
+        return top_words(self.count_description_words(chunk_size), top_n)
+
+    def most_common_words_parallel(self, top_n=5, workers=4, chunk_size=2000):
+        """
+        🗺️ Returns the top N words, counting ID ranges in worker processes.
+        Each worker counts its ranges over its own DB connection and the
+        partial counts are merged here. SQLite databases (and workers <= 1)
+        are counted in-process, range by range.
+
+        Args:
+            top_n (int): 🔢 Number of most common words to return (default=5)
+            workers (int): ⚙️ Worker processes to spread the ranges over
+            chunk_size (int): 🚰 Descriptions fetched and tokenized at a time
 
-        # 🔄 Combine and normalize text to lowercase
-        all_text = " ".join(filter(None, descriptions)).lower()
+        Returns:
+            list: 📊 List of tuples containing (word, frequency) pairs
+        """
+        if top_n < 1:
+            return []
+        bounds = self.model.objects.aggregate(low=Min("id"), high=Max("id"))
+        if bounds["low"] is None:
+            return []
 
-        # ✂️ Tokenize text into individual words, ignoring punctuation
-        words = re.findall(r'\b\w+\b', all_text)
+        ranges = split_id_range(
+            bounds["low"], bounds["high"], max(workers, 1) * RANGES_PER_WORKER
+        )
+        if workers <= 1 or connection.vendor == "sqlite":
+            # 🗃️ Workers could not share an SQLite (or in-memory) database
+            partials = [
+                count_words_in_id_range(start, stop, chunk_size)
+                for start, stop in ranges
+            ]
+        else:
+            partials = run_in_process_pool(
+                _count_words_in_id_range_worker,
+                [(start, stop, chunk_size) for start, stop in ranges],
+                workers,
+            )
 
-        # 📊 Count frequencies and get top N most common words
-        common_words = Counter(words).most_common(top_n)
+        # 🔗 Reduce: merge the partial counts
+        counts = Counter()
+        for partial in partials:
+            counts.update(partial)
+        return top_words(counts, top_n)
 
-        return common_words
+    def _most_common_words_python(self, top_n):
+        # 🐍 Portable fallback for backends without SQL-side counting
+        return self.most_common_words_streaming(top_n)
@@ -0,0 +1,112 @@
+# 🔢 Repository for the persisted word-frequency index
+from .base_repository import BaseRepository
+from ..models import WordCount
+from django.db import connection, transaction
+
+# 📦 Words per INSERT/UPDATE statement when applying or rebuilding counts
+WORD_BATCH_SIZE = 500
+
+# ➕ Insert-or-increment in one statement (PostgreSQL and SQLite >= 3.24).
+# A row deleted by a concurrent writer is re-inserted instead of the
+# increment matching nothing, which separate INSERT/UPDATE statements allow
+# under READ COMMITTED.
+UPSERT_DELTA_SQL = """
+    INSERT INTO word_count (word, count) VALUES {values}
+    ON CONFLICT (word) DO UPDATE SET count = word_count.count + EXCLUDED.count
+"""
+
+
+class WordCountRepository(BaseRepository):
+    """
+    🔢 Word count repository backing the most-common-words endpoint.
+    - ➕ Applies per-write deltas with atomic insert-or-increment upserts
+    - 🏆 Reads the top N words from an index
+    - 🔄 Replaces the whole table on rebuild
+    """
+
+    def __init__(self):
+        # 🔄 Initialize repository with WordCount model
+        super().__init__(WordCount)
+
+    def apply_delta(self, delta):
+        """
+        ➕ Adds a signed count to each word, creating and pruning rows.
+
+        Args:
+            delta (dict): 🔢 word -> signed change in occurrences
+
+        Returns:
+            int: 📊 Number of words touched
+        """
+        # 🔐 Sorted so concurrent writers lock rows in the same order
+        words = sorted(word for word, n in delta.items() if n)
+        if not words:
+            return 0
+
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                for start in range(0, len(words), WORD_BATCH_SIZE):
+                    batch = words[start:start + WORD_BATCH_SIZE]
+                    cursor.execute(
+                        UPSERT_DELTA_SQL.format(
+                            values=", ".join(["(%s, %s)"] * len(batch))
+                        ),
+                        [value for word in batch for value in (word, delta[word])],
+                    )
+            # 🧹 Words that no longer appear anywhere are dropped (only rows
+            # still at or below zero, so a concurrent increment survives)
+            self.model.objects.filter(word__in=words, count__lte=0).delete()
+        return len(words)
+
+    def top(self, top_n=5):
+        """
+        🏆 Returns the top N words by count from the index.
+
+        Args:
+            top_n (int): 🔢 Number of words to return (default=5)
+
+        Returns:
+            list: 📊 List of tuples containing (word, frequency) pairs
+        """
+        if top_n < 1:
+            return []
+        rows = self.model.objects.order_by("-count", "word").values_list(
+            "word", "count"
+        )
+        return list(rows[:top_n])
+
+    def lock(self):
+        """
+        🔐 Blocks concurrent delta writes until the current transaction ends.
+        Reads are not blocked. SQLite already serializes writers, so this
+        only issues a statement on PostgreSQL.
+        """
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"LOCK TABLE {self.model._meta.db_table} IN EXCLUSIVE MODE"
+                )
+
+    def rebuild(self, counts):
+        """
+        🔄 Replaces every row with freshly computed counts.
+
+        Args:
+            counts (dict): 🔢 word -> number of occurrences
+
+        Returns:
+            int: 📊 Number of distinct words stored
+        """
+        with transaction.atomic():
+            self.model.objects.all().delete()
+            self.model.objects.bulk_create(
+                [
+                    self.model(word=word, count=n)
+                    for word, n in counts.items() if n > 0
+                ],
+                batch_size=WORD_BATCH_SIZE,
+            )
+        count = self.model.objects.count()
+        # ✅ Log success
+        self.logger.info("🟢 Word counts rebuilt", extra={"count": count})
+        return count
@@ -2,13 +2,37 @@
 from ..utils.redis import (
     set_cache,          # 💾 Store data in cache
     get_cache,          # 📖 Retrieve data from cache
+    get_many_cache,     # 📚 Retrieve many keys with one MGET
+    set_many_cache,     # 📦 Store many keys with one pipeline
+    get_versioned_cache,  # ⚡ Resolve version + read data in one round trip
     get_model_version,  # 🏷️ Get current model version
+    build_versioned_key,  # 🔑 Build a version-scoped key
     bump_model_version,  # ⬆️ Increment model version
+    admit_to_bounded_set,  # 🎟️ Cap the number of cached filter shapes
+    acquire_lock,       # 🔒 Take a single-flight fill lock
+    release_lock,       # 🔓 Release a single-flight fill lock
+    CacheCodec,         # 🗜️ Value serializer + compression
 )
 
+# ⚡ Pre-rendered JSON bodies for cached list reads
+from ..utils.response import render_json
+
+# 📄 Keyset pagination helpers
+from ..utils.pagination import DEFAULT_PAGE_SIZE, encode_cursor, decode_cursor
+
+# ⏱️ Polling while another worker fills a cache miss
+import time
+
+# 🔑 Canonical digests of filter sets for cache keys
+import hashlib
+import json
+
 # 📝 Django model utilities
 # 🔄 Convert model instance to dictionary
 from django.forms.models import model_to_dict
+from django.core.exceptions import ValidationError
+# 🔐 Writes and their derived data commit together
+from django.db import transaction
 
 # ⚠️ Custom exception classes
 from ..exceptions.custom_exceptions import (
@@ -20,78 +44,481 @@ from ..exceptions.custom_exceptions import (
     EntityFetchException,    # 🎯 When fetching one fails
 )
 
+# 🚰 Rows fetched per round trip when streaming querysets
+ITERATOR_CHUNK_SIZE = 2000
+
+# 📦 Rows per INSERT statement for bulk writes
+BULK_BATCH_SIZE = 500
+
+# 🪦 Cached in place of an entity that is known not to exist
+TOMBSTONE = {"__tombstone__": True}
+
+
+def is_tombstone(value):
+    # 🪦 True when a cached value marks a missing entity
+    return isinstance(value, dict) and value.get("__tombstone__") is True
+
+
+# 🛡️ Default cache-fill behaviour (single-flight + stale-while-revalidate)
+DEFAULT_CACHE_CONFIG = {
+    "lock_timeout_ms": 5000,  # 🔒 Lock expiry if the filling worker dies
+    "lock_wait": 2.0,  # ⏳ Seconds a waiter polls before filling itself
+    "lock_poll": 0.05,  # 🔁 Seconds between waiter polls
+    "stale_while_revalidate": False,  # 🥱 Serve the previous value on a miss
+    "stale_ttl": 600,  # ⏱️ How long previous values are kept around
+    "serializer": "json",  # 🗜️ json | orjson | msgpack
+    "compression": None,  # 🗜️ None | zlib | lz4
+    "compress_min_bytes": 4096,  # 📏 Compress values at least this large
+    "max_filter_shapes": 256,  # 🎟️ Distinct filter sets cached per version
+}
+
 
 # 🏗️ Base service class that handles common CRUD operations with caching
 class BaseService:
     # 🎯 Initialize service with repository and caching config
-    def __init__(self, repository, model_name: str, ttl_config=None):
+    def __init__(self, repository, model_name: str, ttl_config=None,
+                 cache_config=None):
         self.repository = repository  # 📦 Data access layer
         self.model_name = model_name.lower()  # 📝 Model name for cache keys
         self.ttl_config = ttl_config or {
             "all": 60,
             "by_id": 60,
         }  # ⏱️ Cache TTL settings
+        self.cache_config = {
+            **DEFAULT_CACHE_CONFIG, **(cache_config or {})
+        }  # 🛡️ Cache fill settings
+        self.codec = CacheCodec(
+            self.cache_config["serializer"],
+            self.cache_config["compression"],
+            self.cache_config["compress_min_bytes"],
+        )  # 🗜️ How this service's values are stored
 
     # 🔑 Generate cache key with version
     def _key(self, suffix: str):
         version = get_model_version(self.model_name)
-        return f"{self.model_name}:v{version}:{suffix}"
+        return build_versioned_key(self.model_name, version, suffix)
+
+    # 🔑 Per-entity cache key; not versioned so unrelated writes keep it warm
+    def _entity_key(self, pk):
+        return f"{self.model_name}:id:{pk}"
+
+    # 💾 Write an entity through to its own cache entry
+    def _write_through(self, instance):
+        set_cache(
+            self._entity_key(instance.pk),
+            model_to_dict(instance),
+            ttl=self.ttl_config.get("by_id", 60),
+            broadcast=True,
+            codec=self.codec,
+        )
+
+    # 💾 Write many changed entities through to their own entries (plain
+    # SET, one pipeline per chunk), so a read that loaded an old row before
+    # the commit cannot put it back with its SET NX fill
+    def _write_through_many(self, ids, chunk_size=1000):
+        ids = list(ids)
+        for start in range(0, len(ids), chunk_size):
+            rows = self.repository.find_rows_by_ids(ids[start:start + chunk_size])
+            set_many_cache(
+                {self._entity_key(row["id"]): row for row in rows},
+                ttl=self.ttl_config.get("by_id", 60),
+                broadcast=True,
+                codec=self.codec,
+            )
 
-    # 🔍 Find single entity by ID
-    def find_by_id(self, pk):
-        key = self._key(str(pk))
+    # 🏷️ Canonical sparse fieldset for a read
+    def resolve_fields(self, fields, required=("id",)):
+        """
+        🏷️ Validates requested field names and returns them in model order,
+        plus the required ones (the ID, which cursors are built from).
+        None means every field, so full reads keep their original keys.
+        """
+        if not fields:
+            return None
+        names = self.repository.field_names
+        unknown = sorted(set(fields) - set(names))
+        if unknown:
+            raise ValueError(f"Unknown fields: {unknown}")
+        wanted = set(fields) | set(required)
+        resolved = tuple(name for name in names if name in wanted)
+        return None if resolved == names else resolved
+
+    # 🔑 Cache key suffix for a read narrowed to a fieldset (and/or cached
+    # as a rendered JSON body)
+    @staticmethod
+    def _fieldset_suffix(suffix, fields, rendered=False):
+        if fields:
+            suffix = f"{suffix}:fields:{','.join(fields)}"
+        return f"{suffix}:json" if rendered else suffix
+
+    # ⚡ Wrap a loader so its value is cached as rendered JSON bytes
+    @staticmethod
+    def _rendering(loader, rendered):
+        return (lambda: render_json(loader())) if rendered else loader
+
+    # 🥱 Unversioned key holding the last value written for a versioned read
+    def _stale_key(self, suffix: str):
+        return f"{self.model_name}:stale:{suffix}"
+
+    # 🛡️ Fill a cache miss once across workers (single-flight)
+    def _load_once(self, key, loader, ttl, stale_key=None,
+                   only_if_missing=False):
+        """
+        🛡️ Runs loader() for a missed key while holding a short Redis lock.
+        Concurrent missers wait for the holder's value instead of querying
+        the database; with stale-while-revalidate they are served the
+        previous version's value straight away.
+        """
+        config = self.cache_config
+        swr = config["stale_while_revalidate"] and stale_key is not None
+        token = acquire_lock(key, config["lock_timeout_ms"])
+        try:
+            if token is None:
+                # 🥱 Serve the previous value while the lock holder refreshes
+                if swr:
+                    stale = get_cache(stale_key)
+                    if stale is not None:
+                        return stale
+                # ⏳ Wait for the lock holder to populate the key
+                deadline = time.monotonic() + config["lock_wait"]
+                while time.monotonic() < deadline:
+                    time.sleep(config["lock_poll"])
+                    cached = get_cache(key)
+                    if cached is not None:
+                        return cached
+            else:
+                # 🔁 Another worker may have filled it before we got the lock
+                cached = get_cache(key)
+                if cached is not None:
+                    return cached
+
+            # 🗄️ Lock holder (or a waiter that gave up) loads and caches
+            result = loader()
+            set_cache(
+                key,
+                result,
+                ttl=ttl,
+                only_if_missing=only_if_missing,
+                codec=self.codec,
+            )
+            if swr:
+                set_cache(
+                    stale_key, result, ttl=config["stale_ttl"], codec=self.codec
+                )
+            return result
+        finally:
+            if token is not None:
+                release_lock(key, token)
+
+    # 📦 Read a derived value cached per model version (writes bump it)
+    def _cached_versioned(self, suffix, loader, ttl):
+        """
+        📦 Returns the value for suffix under the current model version,
+        running loader() once across workers on a miss.
+        """
+        key, cached = get_versioned_cache(self.model_name, suffix)
+        if cached is not None:
+            return cached
+        return self._load_once(
+            key, loader, ttl=ttl, stale_key=self._stale_key(suffix)
+        )
+
+    # 🔍 Find single entity by ID (narrowed to fields when given)
+    def find_by_id(self, pk, fields=None):
+        fields = self.resolve_fields(fields)
+        key = self._entity_key(pk)
         try:
-            # 📖 Check cache first
+            # 📖 Check cache first (tombstones mean "known missing")
             cached = get_cache(key)
+            if is_tombstone(cached):
+                raise EntityNotFoundException()
             if cached:
-                return cached
+                return self._project(cached, fields)
 
-            # 🔍 Get from repository if not in cache
-            instance = self.repository.find_by_id(pk)
-            if not instance:
+            # 🚫 IDs above the current maximum cannot exist
+            if isinstance(pk, int) and pk > self._max_id():
                 raise EntityNotFoundException()
 
-            # 💾 Cache the result
-            result = model_to_dict(instance)
-            set_cache(key, result, ttl=self.ttl_config.get("by_id", 60))
-            return result
+            # 🔍 Get the full row from the repository if not in cache; the
+            # entity entry is shared by every fieldset
+            def load():
+                return self.repository.find_row_by_id(pk)
+
+            # 💾 Cache the result unless a write-through got there first
+            try:
+                result = self._load_once(
+                    key,
+                    load,
+                    ttl=self.ttl_config.get("by_id", 60),
+                    only_if_missing=True,
+                )
+            except EntityNotFoundException:
+                # 🪦 Remember the miss briefly so repeats skip the database
+                set_cache(
+                    key,
+                    TOMBSTONE,
+                    ttl=self.ttl_config.get("missing", 30),
+                    only_if_missing=True,
+                )
+                raise
+            if is_tombstone(result):
+                raise EntityNotFoundException()
+            return self._project(result, fields)
         except EntityNotFoundException:
             raise
         except Exception as e:
             raise EntityFetchException(detail=str(e))
 
-    # 📋 Get all entities
-    def find_all(self):
-        key = self._key("all")
+    # 📚 Find many entities by ID, in request order
+    def find_many_by_ids(self, ids, fields=None):
+        """
+        📚 Resolves every ID with one MGET; misses are fetched with one
+        id__in query and back-filled through a pipeline. Results keep the
+        request order (duplicates included); IDs that do not exist appear
+        inline as {"id": pk, "error": "not_found"}.
+        """
+        fields = self.resolve_fields(fields)
         try:
-            # 📖 Check cache first
-            cached = get_cache(key)
+            unique = list(dict.fromkeys(ids))
+            keys = {pk: self._entity_key(pk) for pk in unique}
+            cached = get_many_cache(keys.values())
+            rows = {
+                pk: cached[key] for pk, key in keys.items()
+                if cached[key] is not None and not is_tombstone(cached[key])
+            }
+
+            # 🚫 Skip known-missing IDs and those above the current maximum
+            misses = [pk for pk in unique if cached[keys[pk]] is None]
+            if misses:
+                max_id = self._max_id()
+                misses = [pk for pk in misses if pk <= max_id]
+            if misses:
+                loaded = {
+                    row["id"]: row
+                    for row in self.repository.find_rows_by_ids(misses)
+                }
+                rows.update(loaded)
+                # 💾 Back-fill rows unless a write-through got there first
+                set_many_cache(
+                    {keys[pk]: row for pk, row in loaded.items()},
+                    ttl=self.ttl_config.get("by_id", 60),
+                    only_if_missing=True,
+                    codec=self.codec,
+                )
+                # 🪦 Remember the misses briefly so repeats skip the database
+                set_many_cache(
+                    {keys[pk]: TOMBSTONE for pk in misses if pk not in loaded},
+                    ttl=self.ttl_config.get("missing", 30),
+                    only_if_missing=True,
+                )
+            return [
+                self._project(rows[pk], fields) if pk in rows
+                else {"id": pk, "error": "not_found"}
+                for pk in ids
+            ]
+        except Exception as e:
+            raise EntityFetchException(detail=str(e))
+
+    # ✂️ Narrow a full row dict to a fieldset
+    @staticmethod
+    def _project(row, fields):
+        return {name: row[name] for name in fields} if fields else row
+
+    # 🔢 Highest existing ID, cached per model version (writes bump it)
+    def _max_id(self):
+        key, cached = get_versioned_cache(self.model_name, "max_id")
+        if cached is not None:
+            return cached
+        return self._load_once(
+            key,
+            self.repository.find_max_id,
+            ttl=self.ttl_config.get("all", 60),
+        )
+
+    # 📋 Stream all entities in ID order (narrowed to fields when given).
+    # Never cached: no whole-table list is built in memory or stored as one
+    # value; clients that want caching page with find_page
+    def find_all(self, fields=None, chunk_size=ITERATOR_CHUNK_SIZE):
+        fields = self.resolve_fields(fields) or self.repository.field_names
+        return self.repository.iter_rows(None, fields, chunk_size)
+
+    # 📄 Get one keyset page of entities (cursor = last seen ID)
+    def find_page(self, limit=DEFAULT_PAGE_SIZE, cursor=None, fields=None,
+                  rendered=False):
+        after_id = self._decode_id_cursor(cursor)
+        fields = self.resolve_fields(fields)
+        suffix = self._fieldset_suffix(
+            f"page:{after_id or 0}:{limit}", fields, rendered
+        )
+        try:
+            # 📖 Check cache first (version + data in one round trip)
+            key, cached = get_versioned_cache(self.model_name, suffix)
             if cached:
                 return cached
 
-            # 📋 Get all from repository
-            queryset = self.repository.find_all()
-            result = [model_to_dict(obj) for obj in queryset]
-            # 💾 Cache the results
-            set_cache(key, result, ttl=self.ttl_config.get("all", 60))
-            return result
+            def load():
+                return self._page(self.repository.find_page(
+                    limit + 1, after_id, fields or self.repository.field_names
+                ), limit)
+
+            # 💾 Cache the page on its own key (one worker fills it)
+            return self._load_once(
+                key,
+                self._rendering(load, rendered),
+                ttl=self.ttl_config.get("page", 60),
+                stale_key=self._stale_key(suffix),
+            )
+        except Exception as e:
+            raise EntityFetchAllException(detail=str(e))
+
+    # 🚰 Stream every entity for an export (never cached)
+    def export_rows(self, since_id=None, fields=None,
+                    chunk_size=ITERATOR_CHUNK_SIZE):
+        """
+        🚰 Validates an export request and returns (fields, rows): the
+        column names and a lazy iterator of row dicts in ID order, resuming
+        after since_id. Raises ValueError for a bad since_id or field.
+        """
+        if since_id is not None and since_id < 0:
+            raise ValueError("since_id must not be negative")
+        fields = self.resolve_fields(fields) or self.repository.field_names
+        rows = self.repository.iter_rows(since_id, fields, chunk_size)
+        return fields, rows
+
+    # 📄 One keyset page from a query that fetched limit + 1 rows: the
+    # extra row only tells whether another page exists
+    @staticmethod
+    def _page(rows, limit, cursor_values=lambda row: (row["id"],)):
+        items = rows[:limit]
+        has_more = len(rows) > limit
+        return {
+            "results": items,
+            "next_cursor": (
+                encode_cursor(*cursor_values(items[-1])) if has_more else None
+            ),
+        }
+
+    # 🔓 Decode an ID cursor, raising ValueError for invalid tokens
+    @staticmethod
+    def _decode_id_cursor(cursor):
+        if not cursor:
+            return None
+        values = decode_cursor(cursor)
+        if len(values) != 1 or not isinstance(values[0], int):
+            raise ValueError("Invalid cursor")
+        return values[0]
+
+    # 🪝 Keep derived data in step with writes (runs inside the write's
+    # transaction); rows are model dicts before and after the change
+    def on_change(self, old_rows, new_rows):
+        pass
+
+    # 🔎 Get one keyset page of filtered entities in the given ordering
+    def find_filtered_page(self, filters, ordering="id", limit=DEFAULT_PAGE_SIZE,
+                           cursor=None, fields=None, rendered=False):
+        """
+        🔎 Filtered, ordered keyset page. Pages are cached per canonical
+        filter set and fieldset; only max_filter_shapes distinct shapes are
+        cached per model version, the rest are served straight from the
+        database. The ordering field is always selected for the cursor.
+        """
+        field = ordering.lstrip("-")
+        after = self._decode_filter_cursor(cursor, field)
+        fields = self.resolve_fields(fields, required=("id", field))
+        shape = hashlib.sha1(
+            json.dumps(
+                [filters, ordering, fields], sort_keys=True, default=str
+            ).encode()
+        ).hexdigest()[:16]
+        suffix = self._fieldset_suffix(
+            f"filter:{shape}:{cursor or 0}:{limit}", None, rendered
+        )
+
+        def load():
+            return self._page(
+                self.repository.find_filtered_page(
+                    filters, ordering, limit + 1, after,
+                    fields or self.repository.field_names,
+                ),
+                limit,
+                (lambda row: (row["id"],)) if field == "id"
+                else (lambda row: (row[field], row["id"])),
+            )
+
+        load = self._rendering(load, rendered)
+        try:
+            # 📖 Check cache first (version + data in one round trip)
+            key, cached = get_versioned_cache(self.model_name, suffix)
+            if cached is not None:
+                return cached
+            # 🎟️ Past the shape budget, skip caching to keep Redis bounded
+            ttl = self.ttl_config.get("page", 60)
+            if not admit_to_bounded_set(
+                self._key("filter_shapes"),
+                shape,
+                self.cache_config["max_filter_shapes"],
+                ttl,
+            ):
+                return load()
+            return self._load_once(key, load, ttl=ttl)
         except Exception as e:
             raise EntityFetchAllException(detail=str(e))
 
+    # 🔓 Decode a filtered-page cursor, raising ValueError for invalid tokens
+    def _decode_filter_cursor(self, cursor, field):
+        if not cursor:
+            return None
+        values = decode_cursor(cursor)
+        if field == "id":
+            return (self._decode_id_cursor(cursor),)
+        if (
+            len(values) != 2
+            or values[0] is None
+            or not isinstance(values[1], int)
+        ):
+            raise ValueError("Invalid cursor")
+        try:
+            value = self.repository.model._meta.get_field(field).to_python(
+                values[0]
+            )
+        except ValidationError:
+            raise ValueError("Invalid cursor")
+        return value, values[1]
+
     # ➕ Create new entity
     def create(self, data):
         try:
-            instance = self.repository.create(data)
-            bump_model_version(self.model_name)  # 🔄 Invalidate cache
+            with transaction.atomic():
+                instance = self.repository.create(data)
+                self.on_change([], [model_to_dict(instance)])
+            self._write_through(instance)  # 💾 Warm the entity entry
+            bump_model_version(self.model_name)  # 🔄 Invalidate list caches
             return instance
         except Exception as e:
             raise EntityCreateException(detail=str(e))
 
+    # 📦 Create many entities at once
+    def bulk_create(self, rows, batch_size=BULK_BATCH_SIZE):
+        try:
+            with transaction.atomic():
+                instances = self.repository.bulk_create(rows, batch_size)
+                self.on_change([], [model_to_dict(obj) for obj in instances])
+            # 🔄 One list-cache invalidation for the whole batch; entity
+            # entries are filled on first read
+            bump_model_version(self.model_name)
+            return instances
+        except Exception as e:
+            raise EntityCreateException(detail=str(e))
+
     # 🔄 Update existing entity
     def update(self, instance, data):
         try:
-            updated = self.repository.update(instance, data)
-            bump_model_version(self.model_name)  # 🔄 Invalidate cache
+            old = model_to_dict(instance)  # 📸 Snapshot before mutation
+            with transaction.atomic():
+                updated = self.repository.update(instance, data)
+                self.on_change([old], [model_to_dict(updated)])
+            self._write_through(updated)  # 💾 Refresh only this entity
+            bump_model_version(self.model_name)  # 🔄 Invalidate list caches
             return updated
         except Exception as e:
             raise EntityUpdateException(detail=str(e))
@@ -99,8 +526,21 @@ class BaseService:
     # 🗑️ Delete entity
     def delete(self, instance):
         try:
-            result = self.repository.delete(instance)
-            bump_model_version(self.model_name)  # 🔄 Invalidate cache
+            pk = instance.pk  # 📌 Django clears the pk on delete
+            old = model_to_dict(instance)
+            with transaction.atomic():
+                result = self.repository.delete(instance)
+                self.on_change([old], [])
+            # 🪦 Overwrite (plain SET) with a tombstone rather than DEL, so a
+            # reader that loaded the row before the commit cannot put it back
+            # with its SET NX fill
+            set_cache(
+                self._entity_key(pk),
+                TOMBSTONE,
+                ttl=self.ttl_config.get("by_id", 60),
+                broadcast=True,
+            )
+            bump_model_version(self.model_name)  # 🔄 Invalidate list caches
             return result
         except Exception as e:
             raise EntityDeleteException(detail=str(e))
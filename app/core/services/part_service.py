@@ -1,8 +1,42 @@
 # 🔧 Import required base classes and repositories
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
 from .base_service import BaseService
 from ..repositories.part_repository import PartRepository
+from ..repositories.word_count_repository import WordCountRepository
+from ..utils.redis import bump_model_version
+from ..utils.sketch import CountMinSketch
+from ..utils.pagination import DEFAULT_PAGE_SIZE, decode_cursor
+from ..utils.text import (
+    normalize_search_query,
+    search_query_digest,
+    word_delta,
+)
 from ..exceptions.custom_exceptions import (
     EntityFetchException,  # ❌ Exception for entity fetch failures
+    EntityFetchAllException,  # ❌ Exception for list/search failures
+    EntityUpsertException,  # ❌ Exception for bulk upsert failures
+)
+
+# 📊 How most-common-words is answered:
+# - "index": 🔢 maintained word_count table, updated on every write
+# - "database": 🐘 counted per request (in SQL on PostgreSQL), no upkeep
+# - "stream": 🚰 counted per request in Python, chunk by chunk, no upkeep
+# - "parallel": 🗺️ counted per request across a pool of worker processes
+WORD_STATS_ENGINES = ("index", "database", "stream", "parallel")
+
+# 🧹 List filters accepted over HTTP -> ORM lookups
+PART_FILTER_LOOKUPS = {
+    "is_active": "is_active",
+    "weight_ounces_min": "weight_ounces__gte",
+    "weight_ounces_max": "weight_ounces__lte",
+    "sku_prefix": "sku__startswith",
+}
+
+# ↕️ Orderings backed by an index (ties are broken by ID)
+PART_ORDERINGS = (
+    "id", "-id", "weight_ounces", "-weight_ounces", "name", "-name",
 )
 
 
@@ -12,14 +46,253 @@ class PartService(BaseService):
         # ⚙️ Configure cache TTL settings:
         # - 'all' parts cache expires in 120 seconds
         # - Individual part 'by_id' cache expires in 300 seconds
-        ttl_config = {"all": 120, "by_id": 300}  # ⏱️ Cache expiration times
+        # - Each keyset 'page' of parts expires in 120 seconds
+        # - Tombstones for 'missing' part IDs expire in 30 seconds
+        # - The precomputed top-K 'words' list expires in 300 seconds
+        # - Each page of 'search' results expires in 120 seconds
+        ttl_config = {
+            "all": 120,
+            "by_id": 300,
+            "page": 120,
+            "missing": 30,
+            "words": 300,
+            "search": 120,
+        }  # ⏱️ Cache expiration times
+        # 🥱 Optionally serve the previous list while one worker refreshes it
+        # 🗜️ Store parts with a compact codec; big lists are compressed
+        cache_config = {
+            "stale_while_revalidate": getattr(
+                settings, "CACHE_STALE_WHILE_REVALIDATE", False
+            ),
+            "serializer": getattr(settings, "PART_CACHE_SERIALIZER", "json"),
+            "compression": getattr(settings, "PART_CACHE_COMPRESSION", None),
+            "compress_min_bytes": getattr(
+                settings, "PART_CACHE_COMPRESS_MIN_BYTES", 4096
+            ),
+            "max_filter_shapes": getattr(
+                settings, "PART_CACHE_MAX_FILTER_SHAPES", 256
+            ),
+        }
         super().__init__(
-            PartRepository(), "part", ttl_config=ttl_config
+            PartRepository(),
+            "part",
+            ttl_config=ttl_config,
+            cache_config=cache_config,
         )  # 🔄 Initialize base service
+        # 🔢 Word-frequency index kept in step with description changes
+        self.word_counts = WordCountRepository()
+        self.word_stats_engine = getattr(settings, "WORD_STATS_ENGINE", "index")
+        if self.word_stats_engine not in WORD_STATS_ENGINES:
+            raise ImproperlyConfigured(
+                f"WORD_STATS_ENGINE must be one of {WORD_STATS_ENGINES}"
+            )
+        self.word_stats_workers = getattr(settings, "WORD_STATS_WORKERS", 4)
+        # 🏆 One cached top-K list answers every top_n <= K
+        self.word_stats_top_k = getattr(settings, "WORD_STATS_TOP_K", 1000)
+        # 📐 Optional Count-Min sketch answering mode=approx in bounded memory
+        self.word_sketch = None
+        if getattr(settings, "WORD_SKETCH_ENABLED", False):
+            self.word_sketch = CountMinSketch(
+                "part:words",
+                epsilon=getattr(settings, "WORD_SKETCH_EPSILON", 0.001),
+                delta=getattr(settings, "WORD_SKETCH_DELTA", 0.01),
+                capacity=getattr(settings, "WORD_SKETCH_CAPACITY", 1000),
+            )
+
+    def on_change(self, old_rows, new_rows):
+        """
+        🔢 Applies the description word delta of a write to the index.
+
+        Parameters:
+        - old_rows (list): 📝 Part dicts before the write
+        - new_rows (list): 📝 Part dicts after the write
+        """
+        maintain_index = self.word_stats_engine == "index"
+        if not maintain_index and self.word_sketch is None:
+            return  # 💤 Nothing to maintain
+        delta = word_delta(
+            [row.get("description") for row in old_rows],
+            [row.get("description") for row in new_rows],
+        )
+        if maintain_index:
+            self.word_counts.apply_delta(delta)
+        if self.word_sketch is not None and delta:
+            # 📐 Redis is outside the transaction: count committed writes only
+            sketch = self.word_sketch
+            transaction.on_commit(lambda: sketch.add(delta))
+
+    def filter_parts(self, criteria, ordering="id", limit=DEFAULT_PAGE_SIZE,
+                     cursor=None, fields=None, rendered=False):
+        """
+        🧹 Returns one keyset page of parts matching the given criteria.
+
+        Parameters:
+        - criteria (dict): 🧹 Keys of PART_FILTER_LOOKUPS with their values
+        - ordering (str): ↕️ One of PART_ORDERINGS
+        - limit (int): 📏 Page size
+        - cursor (str): 📌 next_cursor from the previous page
+        - fields (list): 🏷️ Part fields to return (all when omitted)
+        - rendered (bool): ⚡ Return the page as a cached RawJson body
+
+        Returns:
+        - dict: 📝 {"results": [...], "next_cursor": str | None}, or its
+          RawJson rendering
+
+        Raises:
+        - ValueError: ⚠️ If the ordering, a criterion, a field or the cursor
+          is invalid
+        - EntityFetchAllException: ❌ If the query fails
+        """
+        if ordering not in PART_ORDERINGS:
+            raise ValueError(f"ordering must be one of {PART_ORDERINGS}")
+        unknown = set(criteria) - set(PART_FILTER_LOOKUPS)
+        if unknown:
+            raise ValueError(f"Unknown filters: {sorted(unknown)}")
+        filters = {
+            PART_FILTER_LOOKUPS[name]: value
+            for name, value in criteria.items()
+        }
+        return self.find_filtered_page(
+            filters, ordering, limit, cursor, fields, rendered
+        )
+
+    def find_existing_skus(self, skus):
+        """
+        🔎 Returns which of the given SKUs already exist (one query).
+        """
+        try:
+            return self.repository.find_existing_skus(skus)
+        except Exception as e:
+            raise EntityFetchException(detail=str(e))
+
+    def bulk_upsert(self, rows):
+        """
+        🔁 Inserts or updates parts by SKU, touching only changed rows.
+
+        Parameters:
+        - rows (list): 📝 Validated part dicts
+
+        Returns:
+        - dict: 📊 created/updated/unchanged counts and the updated IDs
+
+        Raises:
+        - EntityUpsertException: ❌ If the upsert fails
+        """
+        try:
+            # 📝 Last occurrence of a SKU wins, as in the repository
+            new = {row["sku"]: row.get("description") for row in rows}
+            with transaction.atomic():
+                old = self.repository.find_descriptions_by_sku(new)
+                summary = self.repository.bulk_upsert(rows)
+                self.on_change(
+                    [{"description": text} for text in old.values()],
+                    [{"description": text} for text in new.values()],
+                )
+        except Exception as e:
+            raise EntityUpsertException(detail=str(e))
+
+        # 💾 Refresh only the entities that changed; lists go stale once
+        if summary["updated_ids"]:
+            self._write_through_many(summary["updated_ids"])
+        if summary["created"] or summary["updated"]:
+            bump_model_version(self.model_name)
+        return summary
+
+    def import_parts(self, batches):
+        """
+        📥 Bulk-loads batches of validated part dicts (upsert by SKU) in one
+        transaction, then invalidates the caches once.
+
+        The word index is rebuilt once afterwards instead of applying a
+        delta per row, which would need every replaced description.
+
+        Parameters:
+        - batches (iterable): 📦 Lists of validated part dicts
+
+        Returns:
+        - dict: 📊 rows read, created/updated/unchanged counts and the
+          updated IDs
+
+        Raises:
+        - EntityUpsertException: ❌ If the import fails (nothing is kept)
+        """
+        try:
+            with transaction.atomic():
+                summary = self.repository.import_batches(batches)
+        except Exception as e:
+            raise EntityUpsertException(detail=str(e))
+
+        # 💾 Refresh only the entities that changed; lists go stale once
+        if summary["updated_ids"]:
+            self._write_through_many(summary["updated_ids"])
+        if summary["created"] or summary["updated"]:
+            # 🔄 Rebuild before bumping: a stats read in between would cache
+            # the old index under the new version. The rebuild bumps itself.
+            if self.word_stats_engine == "index" or self.word_sketch is not None:
+                self.rebuild_word_counts()
+            else:
+                bump_model_version(self.model_name)
+        return summary
+
+    def search(self, query, limit=DEFAULT_PAGE_SIZE, cursor=None):
+        """
+        🔎 Full-text search over part name and description, best match
+        first, one keyset page at a time.
+
+        Parameters:
+        - query (str): 🔤 Free text; every word must match
+        - limit (int): 📏 Page size
+        - cursor (str): 📌 next_cursor from the previous page
+
+        Returns:
+        - dict: 📝 {"results": [...], "next_cursor": str | None}
+
+        Raises:
+        - ValueError: ⚠️ If the query has no words or the cursor is invalid
+        - EntityFetchAllException: ❌ If the search fails
+        """
+        terms = normalize_search_query(query)
+        if not terms:
+            raise ValueError("Search query must contain at least one word")
+        after = self._decode_search_cursor(cursor)
+        after_key = f"{after[0]}:{after[1]}" if after else "0"
+        suffix = f"search:{search_query_digest(terms)}:{after_key}:{limit}"
+
+        def load():
+            return self._page(
+                self.repository.search(terms, limit + 1, after),
+                limit,
+                lambda row: (row["rank"], row["id"]),
+            )
+
+        try:
+            # 💾 Cached per normalized query and model version
+            return self._cached_versioned(
+                suffix, load, ttl=self.ttl_config.get("search", 60)
+            )
+        except Exception as e:
+            raise EntityFetchAllException(detail=str(e))
+
+    @staticmethod
+    def _decode_search_cursor(cursor):
+        # 🔓 (rank, id) cursor; raises ValueError for invalid tokens
+        if not cursor:
+            return None
+        values = decode_cursor(cursor)
+        if (
+            len(values) != 2
+            or not isinstance(values[0], (int, float))
+            or isinstance(values[0], bool)
+            or not isinstance(values[1], int)
+        ):
+            raise ValueError("Invalid cursor")
+        return values[0], values[1]
 
     def find_most_common_words_in_descriptions(self, top_n=5):
         """
         🔍 Returns the top N most common words across all part descriptions.
+        A top-K list is computed once per model version and sliced for any
+        top_n <= K; larger requests are computed directly.
 
         Parameters:
         - top_n (int): 📊 Number of most common words to return (default: 5)
@@ -30,13 +303,97 @@ class PartService(BaseService):
         Raises:
         - EntityFetchException: ❌ If there's an error fetching the data
         """
+        if top_n < 1:
+            return []
         try:
-            # 🔎 Fetch the most common words using the repository method
-            common_words = self.repository.most_common_words_in_descriptions(
-                top_n
+            if top_n > self.word_stats_top_k:
+                return self._most_common_words(top_n)  # 🐢 Beyond the cache
+            # 💾 Cached under the model version; one worker recomputes
+            top_k = self._cached_versioned(
+                f"words:top:{self.word_stats_top_k}",
+                lambda: self._most_common_words(self.word_stats_top_k),
+                ttl=self.ttl_config.get("words", 60),
             )
-            return common_words  # ✅ Return successful result
+            return [tuple(item) for item in top_k[:top_n]]  # ✅ Slice
         except Exception as e:
             raise EntityFetchException(
                 detail=str(e)
             )  # 🚫 Handle and re-raise errors
+
+    def find_most_common_words_approx(self, top_n=5, max_error=None):
+        """
+        📐 Returns the top N words from the Count-Min sketch with its bound.
+        Falls back to the exact answer when the sketch is disabled or cannot
+        meet max_error.
+
+        Parameters:
+        - top_n (int): 📊 Number of most common words to return (default: 5)
+        - max_error (float): 📏 Largest tolerated overcount, as a fraction
+          of all counted words (default: whatever the sketch guarantees)
+
+        Returns:
+        - dict: 📝 words, approximate flag, error_bound (absolute count)
+          and the confidence that every count is within it
+
+        Raises:
+        - EntityFetchException: ❌ If there's an error fetching the data
+        """
+        sketch = self.word_sketch
+        if sketch is None or (max_error is not None and max_error < sketch.epsilon):
+            return {
+                "words": self.find_most_common_words_in_descriptions(top_n),
+                "approximate": False,
+                "error_bound": 0,
+                "confidence": 1.0,
+            }
+        try:
+            return {
+                "words": sketch.top(top_n),
+                "approximate": True,
+                "error_bound": sketch.error_bound(),
+                "confidence": 1 - sketch.delta,
+            }
+        except Exception as e:
+            raise EntityFetchException(detail=str(e))
+
+    def _most_common_words(self, top_n):
+        # 📊 Computes the top N words with the configured engine
+        if self.word_stats_engine == "database":
+            # 🐘 Counted where the descriptions live
+            return self.repository.most_common_words_in_descriptions(top_n)
+        if self.word_stats_engine == "stream":
+            # 🚰 Bounded memory regardless of catalog size
+            return self.repository.most_common_words_streaming(top_n)
+        if self.word_stats_engine == "parallel":
+            # 🗺️ CPU-bound tokenizing runs outside this worker
+            return self.repository.most_common_words_parallel(
+                top_n, workers=self.word_stats_workers
+            )
+        # ⚡ Read from the maintained index; no description scan
+        return self.word_counts.top(top_n)
+
+    def rebuild_word_counts(self):
+        """
+        🔄 Recomputes the word-frequency index from every description.
+
+        Returns:
+        - int: 📊 Number of distinct words stored
+
+        Raises:
+        - EntityFetchException: ❌ If the rebuild fails
+        """
+        try:
+            # 🔐 Lock out concurrent writes so no delta lands mid-rebuild
+            with transaction.atomic():
+                self.word_counts.lock()
+                counts = self.repository.count_description_words()
+                words = self.word_counts.rebuild(counts)
+            if self.word_sketch is not None:
+                # 📐 Reload the sketch from the same exact counts
+                self.word_sketch.reset()
+                self.word_sketch.add(counts)
+            # 🔄 Retire cached top-K answers, stats bodies and ETags
+            bump_model_version(self.model_name)
+            return words
+        except Exception as e:
+            raise EntityFetchException(detail=str(e))
@@ -46,6 +46,19 @@ class BaseRepositoryTests(TestCase):
             with self.assertRaises(EntityCreateException):
                 self.repo.create(get_part_data({"name": "fail"}))
 
+    # 📦 Test bulk creation inserts every row
+    def test_bulk_create_success(self):
+        rows = [get_part_data({"sku": f"SKU{i}"}) for i in range(5)]
+        created = self.repo.bulk_create(rows, batch_size=2)
+        self.assertEqual(len(created), 5)
+        self.assertEqual(Part.objects.count(), 5)
+
+    # ❌ Test bulk creation failure handling
+    def test_bulk_create_failure_raises_exception(self):
+        with patch.object(Part.objects, 'bulk_create', side_effect=Exception("DB error")):
+            with self.assertRaises(EntityCreateException):
+                self.repo.bulk_create([get_part_data()])
+
     # 🔄 Test successful update of a part
     def test_update_success(self):
         instance = Part.objects.create(**get_part_data({"name": "old"}))
@@ -83,12 +96,109 @@ class BaseRepositoryTests(TestCase):
         all_items = self.repo.find_all()
         self.assertEqual(len(all_items), 2)
 
+    # 🏷️ Test fields switch reads to values() row dicts
+    def test_reads_with_fields_return_row_dicts(self):
+        part = Part.objects.create(**get_part_data())
+        expected = {"id": part.id, "sku": part.sku}
+        self.assertEqual(list(self.repo.find_all(("id", "sku"))), [expected])
+        self.assertEqual(self.repo.find_page(5, fields=("id", "sku")), [expected])
+        self.assertEqual(
+            self.repo.find_filtered_page({}, "id", 5, fields=("id", "sku")),
+            [expected],
+        )
+        self.assertEqual(self.repo.find_row_by_id(part.id, ("id", "sku")), expected)
+        self.assertEqual(
+            set(self.repo.find_row_by_id(part.id)), set(self.repo.field_names)
+        )
+
+    # 📚 Test many rows come back from one query, unknown IDs omitted
+    def test_find_rows_by_ids(self):
+        a = Part.objects.create(**get_part_data())
+        b = Part.objects.create(**get_part_data({"sku": "SKU124"}))
+        with self.assertNumQueries(1):
+            rows = self.repo.find_rows_by_ids([b.id, 999, a.id], ("id", "sku"))
+        self.assertEqual(
+            sorted(rows, key=lambda row: row["id"]),
+            [{"id": a.id, "sku": a.sku}, {"id": b.id, "sku": b.sku}],
+        )
+
+    # 🚰 Test rows stream lazily in ID order after the resume point
+    def test_iter_rows(self):
+        ids = [
+            Part.objects.create(**get_part_data({"sku": f"SKU{i}"})).id
+            for i in range(4)
+        ]
+        rows = self.repo.iter_rows(ids[1], ("id", "sku"), chunk_size=2)
+        self.assertEqual(
+            list(rows), [{"id": pk, "sku": f"SKU{i + 2}"} for i, pk in enumerate(ids[2:])]
+        )
+        self.assertEqual(len(list(self.repo.iter_rows())), 4)
+
+    # 🔍 Test a missing row raises not found
+    def test_find_row_by_id_not_found(self):
+        with self.assertRaises(EntityNotFoundException):
+            self.repo.find_row_by_id(999)
+
     # 🚨 Test failure handling for find all
     def test_find_all_failure(self):
         with patch.object(Part.objects, 'all', side_effect=Exception("DB error")):
             with self.assertRaises(EntityFetchAllException):
                 self.repo.find_all()
 
+    # 🔢 Test the max ID is 0 for an empty table and the highest ID otherwise
+    def test_find_max_id(self):
+        self.assertEqual(self.repo.find_max_id(), 0)
+        Part.objects.create(**get_part_data())
+        last = Part.objects.create(**get_part_data({"sku": "SKU124"}))
+        self.assertEqual(self.repo.find_max_id(), last.id)
+
+    # 📄 Test keyset pagination returns rows after the given ID in order
+    def test_find_page_after_id(self):
+        ids = [
+            Part.objects.create(**get_part_data({"sku": f"SKU{i}"})).id
+            for i in range(5)
+        ]
+        first = self.repo.find_page(2)
+        self.assertEqual([p.id for p in first], ids[:2])
+        second = self.repo.find_page(2, after_id=first[-1].id)
+        self.assertEqual([p.id for p in second], ids[2:4])
+
+    # 🚨 Test failure handling for find page
+    def test_find_page_failure(self):
+        with patch.object(Part.objects, 'order_by', side_effect=Exception("DB error")):
+            with self.assertRaises(EntityFetchAllException):
+                self.repo.find_page(10)
+
+    # 🔎 Test filtered pages walk (value, id) keysets in both directions
+    def test_find_filtered_page(self):
+        parts = [
+            Part.objects.create(**get_part_data({
+                "sku": f"SKU{i}", "weight_ounces": i % 3, "is_active": i != 4,
+            }))
+            for i in range(6)
+        ]
+        filters = {"is_active": True}
+        first = self.repo.find_filtered_page(filters, "-weight_ounces", 3)
+        self.assertEqual(
+            [p.id for p in first], [parts[5].id, parts[2].id, parts[1].id]
+        )
+        rest = self.repo.find_filtered_page(
+            filters, "-weight_ounces", 3, after=(1, parts[1].id)
+        )
+        self.assertEqual([p.id for p in rest], [parts[3].id, parts[0].id])
+
+        by_id = self.repo.find_filtered_page(
+            {"weight_ounces__gte": 1}, "id", 10, after=(parts[1].id,)
+        )
+        self.assertEqual(
+            [p.id for p in by_id], [parts[2].id, parts[4].id, parts[5].id]
+        )
+
+    # 🚨 Test failure handling for filtered pages
+    def test_find_filtered_page_failure(self):
+        with self.assertRaises(EntityFetchAllException):
+            self.repo.find_filtered_page({"no_such_field": 1}, "id", 10)
+
     # 🗑️ Test successful deletion
     def test_delete_success(self):
         instance = Part.objects.create(**get_part_data({"name": "del"}))
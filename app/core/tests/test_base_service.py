@@ -1,7 +1,11 @@
 from django.test import TestCase
 from unittest.mock import MagicMock, patch
-from core.services.base_service import BaseService
+from core.services.base_service import BaseService, TOMBSTONE
+from core.models import Part
+from core.utils.redis import delete_cache
+from core.utils.pagination import encode_cursor, decode_cursor
 from core.exceptions.custom_exceptions import (
+    EntityNotFoundException,
     EntityCreateException,
     EntityUpdateException,
     EntityDeleteException,
@@ -10,11 +14,17 @@ from core.exceptions.custom_exceptions import (
 )
 
 
+# 🏷️ Every Part column, in model order
+PART_FIELDS = ("id", "name", "sku", "description", "weight_ounces", "is_active")
+
+
 # 🧪 Test suite for BaseService class
 class BaseServiceTests(TestCase):
     # 🔧 Setup test environment
     def setUp(self):
         self.repo_mock = MagicMock()
+        self.repo_mock.find_max_id.return_value = 100
+        self.repo_mock.field_names = PART_FIELDS
         self.service = BaseService(self.repo_mock, "Part")
 
     # 🔍 Test finding entity by ID from cache
@@ -23,42 +33,354 @@ class BaseServiceTests(TestCase):
         result = self.service.find_by_id(1)
         self.assertEqual(result["id"], 1)
         self.repo_mock.find_by_id.assert_not_called()
+        mock_cache.assert_called_once_with("part:id:1")
 
     # 🗄️ Test finding entity by ID from database
     @patch("core.services.base_service.get_cache", return_value=None)
     @patch("core.services.base_service.set_cache")
-    @patch("core.services.base_service.model_to_dict", return_value={"id": 1})
-    def test_find_by_id_from_db(self, mock_to_dict, mock_set, mock_get):
-        mock_instance = MagicMock()
-        self.repo_mock.find_by_id.return_value = mock_instance
+    def test_find_by_id_from_db(self, mock_set, mock_get):
+        self.repo_mock.find_row_by_id.return_value = {"id": 1}
         result = self.service.find_by_id(1)
         self.assertEqual(result["id"], 1)
+        self.repo_mock.find_row_by_id.assert_called_once_with(1)
+        mock_set.assert_called_once_with(
+            "part:id:1",
+            {"id": 1},
+            ttl=60,
+            only_if_missing=True,
+            codec=self.service.codec,
+        )
+
+    # ✂️ Test a fieldset is projected from the shared entity entry
+    @patch(
+        "core.services.base_service.get_cache",
+        return_value={"id": 1, "name": "n", "sku": "S1"},
+    )
+    def test_find_by_id_with_fields(self, mock_cache):
+        self.assertEqual(
+            self.service.find_by_id(1, ["sku"]), {"id": 1, "sku": "S1"}
+        )
+        mock_cache.assert_called_once_with("part:id:1")
+
+    # 📚 Test a batch read: cache hits, one query for misses, order kept
+    @patch("core.services.base_service.set_many_cache")
+    @patch("core.services.base_service.get_many_cache")
+    def test_find_many_by_ids(self, mock_get_many, mock_set_many):
+        mock_get_many.return_value = {
+            "part:id:1": {"id": 1, "sku": "S1"},
+            "part:id:2": None,
+            "part:id:3": TOMBSTONE,
+            "part:id:4": None,
+            "part:id:500": None,
+        }
+        self.repo_mock.find_rows_by_ids.return_value = [{"id": 2, "sku": "S2"}]
+        self.service._max_id = MagicMock(return_value=100)
+        result = self.service.find_many_by_ids([2, 1, 3, 4, 500, 2], ["sku"])
+        self.assertEqual(result, [
+            {"id": 2, "sku": "S2"},
+            {"id": 1, "sku": "S1"},
+            {"id": 3, "error": "not_found"},
+            {"id": 4, "error": "not_found"},
+            {"id": 500, "error": "not_found"},
+            {"id": 2, "sku": "S2"},
+        ])
+        mock_get_many.assert_called_once()
+        # 🗄️ Only live misses below the max ID reach the database
+        self.repo_mock.find_rows_by_ids.assert_called_once_with([2, 4])
+        backfill, tombstones = mock_set_many.call_args_list
+        self.assertEqual(backfill[0][0], {"part:id:2": {"id": 2, "sku": "S2"}})
+        self.assertEqual(tombstones[0][0], {"part:id:4": TOMBSTONE})
+
+    # 🪦 Test a cached tombstone answers 404 without the database
+    @patch("core.services.base_service.get_cache", return_value=TOMBSTONE)
+    def test_find_by_id_tombstone(self, mock_get):
+        with self.assertRaises(EntityNotFoundException):
+            self.service.find_by_id(5)
+        self.repo_mock.find_by_id.assert_not_called()
+
+    # 🚫 Test IDs above the cached maximum are rejected without a query
+    @patch("core.services.base_service.get_cache", return_value=None)
+    @patch(
+        "core.services.base_service.get_versioned_cache",
+        return_value=("part:v1:max_id", 10),
+    )
+    def test_find_by_id_above_max_id(self, mock_versioned, mock_get):
+        with self.assertRaises(EntityNotFoundException):
+            self.service.find_by_id(11)
+        self.repo_mock.find_by_id.assert_not_called()
+        self.repo_mock.find_max_id.assert_not_called()
+
+    # 🪦 Test a database miss stores a short-lived tombstone
+    @patch("core.services.base_service.get_cache", return_value=None)
+    @patch("core.services.base_service.set_cache")
+    def test_find_by_id_miss_writes_tombstone(self, mock_set, mock_get):
+        self.repo_mock.find_row_by_id.side_effect = EntityNotFoundException()
+        with self.assertRaises(EntityNotFoundException):
+            self.service.find_by_id(7)
+        mock_set.assert_called_with(
+            "part:id:7", TOMBSTONE, ttl=30, only_if_missing=True
+        )
 
     # ❌ Test failure scenario for find by ID
     def test_find_by_id_failure(self):
-        self.repo_mock.find_by_id.side_effect = Exception("fail")
+        self.repo_mock.find_row_by_id.side_effect = Exception("fail")
         with self.assertRaises(EntityFetchException):
             self.service.find_by_id(99)
 
-    # 📋 Test successful retrieval of all entities
-    @patch("core.services.base_service.get_cache", return_value=None)
+    # 📋 Test all entities are streamed lazily and never cached
+    @patch("core.services.base_service.get_versioned_cache")
     @patch("core.services.base_service.set_cache")
-    @patch("core.services.base_service.model_to_dict", return_value={"id": 1})
-    def test_find_all_success(self, mock_to_dict, mock_set, mock_get):
-        self.repo_mock.find_all.return_value = [MagicMock()]
-        result = self.service.find_all()
-        self.assertEqual(result, [{"id": 1}])
+    def test_find_all_streams(self, mock_set, mock_get):
+        self.repo_mock.iter_rows.return_value = iter([{"id": 1}])
+        rows = self.service.find_all()
+        self.repo_mock.iter_rows.assert_called_once_with(None, PART_FIELDS, 2000)
+        self.assertEqual(list(rows), [{"id": 1}])
+        mock_get.assert_not_called()
+        mock_set.assert_not_called()
+
+    # 🏷️ Test a sparse fieldset narrows the streamed query
+    def test_find_all_with_fields(self):
+        self.service.find_all(["sku", "id", "sku"], chunk_size=10)
+        self.repo_mock.iter_rows.assert_called_once_with(None, ("id", "sku"), 10)
+        with self.assertRaises(ValueError):
+            self.service.find_all(["price"])
+
+    # 🚰 Test exports validate eagerly and hand back a lazy row iterator
+    def test_export_rows(self):
+        self.repo_mock.iter_rows.return_value = iter([{"id": 1}])
+        fields, rows = self.service.export_rows(5, ["sku"], chunk_size=10)
+        self.assertEqual(fields, ("id", "sku"))
+        self.repo_mock.iter_rows.assert_called_once_with(5, ("id", "sku"), 10)
+        self.assertEqual(list(rows), [{"id": 1}])
+
+        fields, _ = self.service.export_rows()
+        self.assertEqual(fields, PART_FIELDS)
+        for since_id, names in ((-1, None), (None, ["price"])):
+            with self.assertRaises(ValueError):
+                self.service.export_rows(since_id, names)
 
-    # ❌ Test failure scenario for find all
-    def test_find_all_failure(self):
-        self.repo_mock.find_all.side_effect = Exception("fail")
+    # ❌ Test failure scenario for a page read
+    @patch(
+        "core.services.base_service.get_versioned_cache",
+        return_value=("part:v1:key", None),
+    )
+    def test_find_page_failure(self, mock_get):
+        self.repo_mock.find_page.side_effect = Exception("fail")
         with self.assertRaises(EntityFetchAllException):
-            self.service.find_all()
+            self.service.find_page(10)
+
+    # 📄 Test the extra row only decides whether a next cursor is built
+    def test_page_helper(self):
+        rows = [{"id": 1, "rank": 0.5}, {"id": 2, "rank": 0.4}]
+        self.assertEqual(
+            BaseService._page(rows, 2), {"results": rows, "next_cursor": None}
+        )
+        page = BaseService._page(rows, 1, lambda row: (row["rank"], row["id"]))
+        self.assertEqual(page["results"], rows[:1])
+        self.assertEqual(decode_cursor(page["next_cursor"]), [0.5, 1])
+        self.assertEqual(decode_cursor(BaseService._page(rows, 1)["next_cursor"]), [1])
+
+    # 🏷️ Test fieldsets are canonical: ID is added, a full set means no narrowing
+    def test_resolve_fields(self):
+        self.assertIsNone(self.service.resolve_fields(None))
+        self.assertEqual(self.service.resolve_fields(["name"]), ("id", "name"))
+        self.assertIsNone(self.service.resolve_fields(list(PART_FIELDS)))
+        self.assertEqual(
+            self.service.resolve_fields(["sku"], required=("id", "name")),
+            ("id", "name", "sku"),
+        )
+        with self.assertRaises(ValueError):
+            self.service.resolve_fields(["name", "price"])
+
+    # 📄 Test a page with more rows available returns a next cursor
+    @patch(
+        "core.services.base_service.get_versioned_cache",
+        return_value=("part:v1:key", None),
+    )
+    @patch("core.services.base_service.set_cache")
+    def test_find_page_with_next_cursor(self, mock_set, mock_get):
+        self.repo_mock.find_page.return_value = [
+            {"id": i, "name": "p"} for i in (1, 2, 3)
+        ]
+        result = self.service.find_page(2)
+        self.repo_mock.find_page.assert_called_once_with(3, None, PART_FIELDS)
+        self.assertEqual([row["id"] for row in result["results"]], [1, 2])
+        self.assertEqual(decode_cursor(result["next_cursor"]), [2])
+        mock_get.assert_called_once_with("part", "page:0:2")
+
+    # 🏁 Test the last page has no next cursor
+    @patch(
+        "core.services.base_service.get_versioned_cache",
+        return_value=("part:v1:key", None),
+    )
+    @patch("core.services.base_service.set_cache")
+    def test_find_page_last_page(self, mock_set, mock_get):
+        self.repo_mock.find_page.return_value = [{"id": 5, "sku": "S5"}]
+        result = self.service.find_page(2, encode_cursor(4), ["sku"])
+        self.repo_mock.find_page.assert_called_once_with(3, 4, ("id", "sku"))
+        self.assertIsNone(result["next_cursor"])
+        mock_get.assert_called_once_with("part", "page:4:2:fields:id,sku")
+
+    # 🚫 Test an invalid cursor is rejected before touching the repository
+    def test_find_page_invalid_cursor(self):
+        with self.assertRaises(ValueError):
+            self.service.find_page(2, encode_cursor("abc"))
+        self.repo_mock.find_page.assert_not_called()
+
+    # 🔒 Test a lock holder re-checks the cache before loading
+    @patch("core.services.base_service.release_lock")
+    @patch("core.services.base_service.acquire_lock", return_value="token")
+    @patch("core.services.base_service.get_cache", return_value=[{"id": 1}])
+    def test_load_once_holder_rechecks_cache(self, mock_get, mock_acquire, mock_release):
+        loader = MagicMock()
+        result = self.service._load_once("part:v1:all", loader, ttl=60)
+        self.assertEqual(result, [{"id": 1}])
+        loader.assert_not_called()
+        mock_release.assert_called_once_with("part:v1:all", "token")
+
+    # ⏳ Test a waiter reads the value populated by the lock holder
+    @patch("core.services.base_service.time.sleep")
+    @patch("core.services.base_service.acquire_lock", return_value=None)
+    @patch("core.services.base_service.get_cache")
+    def test_load_once_waiter_reads_populated_value(self, mock_get, mock_acquire, mock_sleep):
+        mock_get.side_effect = [None, [{"id": 2}]]
+        loader = MagicMock()
+        result = self.service._load_once("part:v1:all", loader, ttl=60)
+        self.assertEqual(result, [{"id": 2}])
+        loader.assert_not_called()
+
+    # 🥱 Test stale-while-revalidate serves the previous value to waiters
+    @patch("core.services.base_service.acquire_lock", return_value=None)
+    @patch("core.services.base_service.get_cache", return_value=[{"id": 0}])
+    def test_load_once_serves_stale(self, mock_get, mock_acquire):
+        service = BaseService(
+            self.repo_mock, "Part", cache_config={"stale_while_revalidate": True}
+        )
+        loader = MagicMock()
+        result = service._load_once(
+            "part:v2:all", loader, ttl=60, stale_key="part:stale:all"
+        )
+        self.assertEqual(result, [{"id": 0}])
+        mock_get.assert_called_once_with("part:stale:all")
+        loader.assert_not_called()
+
+    # 💾 Test a lock holder stores both the fresh and the stale copy
+    @patch("core.services.base_service.release_lock")
+    @patch("core.services.base_service.acquire_lock", return_value="token")
+    @patch("core.services.base_service.get_cache", return_value=None)
+    @patch("core.services.base_service.set_cache")
+    def test_load_once_holder_loads_and_caches(
+        self, mock_set, mock_get, mock_acquire, mock_release
+    ):
+        service = BaseService(
+            self.repo_mock, "Part", cache_config={"stale_while_revalidate": True}
+        )
+        result = service._load_once(
+            "part:v2:all", lambda: [1], ttl=60, stale_key="part:stale:all"
+        )
+        self.assertEqual(result, [1])
+        mock_set.assert_any_call(
+            "part:v2:all", [1], ttl=60, only_if_missing=False, codec=service.codec
+        )
+        mock_set.assert_any_call(
+            "part:stale:all", [1], ttl=600, codec=service.codec
+        )
+        mock_release.assert_called_once_with("part:v2:all", "token")
+
+    # 🔓 Test the lock is released when the loader fails
+    @patch("core.services.base_service.release_lock")
+    @patch("core.services.base_service.acquire_lock", return_value="token")
+    @patch("core.services.base_service.get_cache", return_value=None)
+    def test_load_once_releases_lock_on_error(self, mock_get, mock_acquire, mock_release):
+        loader = MagicMock(side_effect=Exception("fail"))
+        with self.assertRaises(Exception):
+            self.service._load_once("part:v1:all", loader, ttl=60)
+        mock_release.assert_called_once_with("part:v1:all", "token")
+
+    # 📦 Test derived values are read from the versioned key when cached
+    @patch(
+        "core.services.base_service.get_versioned_cache",
+        return_value=("part:v3:words", [["a", 1]]),
+    )
+    def test_cached_versioned_hit(self, mock_versioned):
+        loader = MagicMock()
+        result = self.service._cached_versioned("words", loader, ttl=60)
+        self.assertEqual(result, [["a", 1]])
+        loader.assert_not_called()
+
+    # 📦 Test a miss is filled through the single-flight loader
+    @patch(
+        "core.services.base_service.get_versioned_cache",
+        return_value=("part:v3:words", None),
+    )
+    def test_cached_versioned_miss(self, mock_versioned):
+        self.service._load_once = MagicMock(return_value=[["a", 1]])
+        loader = MagicMock()
+        self.assertEqual(
+            self.service._cached_versioned("words", loader, ttl=60), [["a", 1]]
+        )
+        self.service._load_once.assert_called_once_with(
+            "part:v3:words", loader, ttl=60, stale_key="part:stale:words"
+        )
+
+    # 🔎 Test filtered pages are cached per filter shape
+    @patch("core.services.base_service.admit_to_bounded_set", return_value=True)
+    @patch("core.services.base_service.get_versioned_cache")
+    def test_find_filtered_page_cached(self, mock_versioned, mock_admit):
+        mock_versioned.return_value = ("part:v1:filter:x", None)
+        self.service._load_once = MagicMock(return_value={"results": []})
+        page = self.service.find_filtered_page({"is_active": True}, "-name", 5)
+        self.assertEqual(page, {"results": []})
+        suffix = mock_versioned.call_args[0][1]
+        self.assertRegex(suffix, r"^filter:[0-9a-f]{16}:0:5$")
+        self.service._load_once.assert_called_once()
+
+        # 🔁 Same filters produce the same key regardless of dict order
+        self.service.find_filtered_page({"is_active": True}, "-name", 5)
+        self.assertEqual(mock_versioned.call_args[0][1], suffix)
+
+    # 🎟️ Test shapes over the budget bypass the cache
+    @patch("core.services.base_service.admit_to_bounded_set", return_value=False)
+    @patch(
+        "core.services.base_service.get_versioned_cache",
+        return_value=("part:v1:filter:x", None),
+    )
+    def test_find_filtered_page_over_shape_budget(self, mock_versioned, mock_admit):
+        self.service._load_once = MagicMock()
+        self.repo_mock.find_filtered_page.return_value = [
+            {"id": 1, "name": "a"},
+            {"id": 2, "name": "b"},
+        ]
+        page = self.service.find_filtered_page({}, "name", 1, fields=["id"])
+        self.service._load_once.assert_not_called()
+        self.assertEqual(decode_cursor(page["next_cursor"]), ["a", 1])
+        # 🏷️ The ordering field is selected even when not requested
+        self.repo_mock.find_filtered_page.assert_called_once_with(
+            {}, "name", 2, None, ("id", "name")
+        )
+
+    # 🚫 Test malformed filtered cursors raise ValueError
+    def test_find_filtered_page_invalid_cursor(self):
+        self.repo_mock.model = Part
+        for cursor in (encode_cursor(1), encode_cursor("x", 1), encode_cursor(None, 1)):
+            with self.assertRaises(ValueError):
+                self.service.find_filtered_page({}, "weight_ounces", 5, cursor)
 
     # ➕ Test successful entity creation
-    def test_create_success(self):
-        self.repo_mock.create.return_value = MagicMock()
+    @patch("core.services.base_service.bump_model_version")
+    @patch("core.services.base_service.set_cache")
+    @patch("core.services.base_service.model_to_dict", return_value={"id": 1})
+    def test_create_success(self, mock_to_dict, mock_set, mock_bump):
+        self.repo_mock.create.return_value = MagicMock(pk=1)
         self.assertIsNotNone(self.service.create({"name": "test"}))
+        mock_set.assert_called_once_with(
+            "part:id:1",
+            {"id": 1},
+            ttl=60,
+            broadcast=True,
+            codec=self.service.codec,
+        )
+        mock_bump.assert_called_once_with("part")
 
     # ❌ Test failure scenario for entity creation
     def test_create_failure(self):
@@ -66,12 +388,41 @@ class BaseServiceTests(TestCase):
         with self.assertRaises(EntityCreateException):
             self.service.create({"bad": "data"})
 
-    # 📝 Test successful entity update
-    def test_update_success(self):
-        instance = MagicMock()
+    # 📦 Test a bulk create bumps the list version exactly once
+    @patch("core.services.base_service.bump_model_version")
+    def test_bulk_create_success(self, mock_bump):
+        rows = [{"name": "a"}, {"name": "b"}]
+        self.repo_mock.bulk_create.return_value = [MagicMock(), MagicMock()]
+        created = self.service.bulk_create(rows, batch_size=1)
+        self.assertEqual(len(created), 2)
+        self.repo_mock.bulk_create.assert_called_once_with(rows, 1)
+        mock_bump.assert_called_once_with("part")
+
+    # ❌ Test failure scenario for bulk create
+    @patch("core.services.base_service.bump_model_version")
+    def test_bulk_create_failure(self, mock_bump):
+        self.repo_mock.bulk_create.side_effect = Exception("fail")
+        with self.assertRaises(EntityCreateException):
+            self.service.bulk_create([{"name": "a"}])
+        mock_bump.assert_not_called()
+
+    # 📝 Test an update writes through to only that entity's entry
+    @patch("core.services.base_service.bump_model_version")
+    @patch("core.services.base_service.set_cache")
+    @patch("core.services.base_service.model_to_dict", return_value={"id": 7})
+    def test_update_success(self, mock_to_dict, mock_set, mock_bump):
+        instance = MagicMock(pk=7)
         self.repo_mock.update.return_value = instance
         result = self.service.update(instance, {"name": "updated"})
         self.assertEqual(result, instance)
+        mock_set.assert_called_once_with(
+            "part:id:7",
+            {"id": 7},
+            ttl=60,
+            broadcast=True,
+            codec=self.service.codec,
+        )
+        mock_bump.assert_called_once_with("part")
 
     # ❌ Test failure scenario for entity update
     def test_update_failure(self):
@@ -80,11 +431,55 @@ class BaseServiceTests(TestCase):
         with self.assertRaises(EntityUpdateException):
             self.service.update(instance, {"name": "fail"})
 
-    # 🗑️ Test successful entity deletion
-    def test_delete_success(self):
-        instance = MagicMock()
+    # 🗑️ Test a delete tombstones only that entity's entry
+    @patch("core.services.base_service.bump_model_version")
+    @patch("core.services.base_service.set_cache")
+    def test_delete_success(self, mock_set, mock_bump):
+        instance = MagicMock(pk=9)
         self.repo_mock.delete.return_value = True
         self.assertTrue(self.service.delete(instance))
+        mock_set.assert_called_once_with(
+            "part:id:9", TOMBSTONE, ttl=60, broadcast=True
+        )
+        mock_bump.assert_called_once_with("part")
+
+    # 🏁 Test a read that loaded the row before a delete cannot cache it
+    # again afterwards (its SET NX fill loses to the tombstone)
+    @patch("core.services.base_service.bump_model_version")
+    def test_delete_beats_in_flight_read(self, mock_bump):
+        instance = MagicMock(pk=7)
+        self.repo_mock.delete.return_value = True
+        # 🧹 Real Redis: start and finish without an entry for part:id:7
+        delete_cache("part:id:7")
+        self.addCleanup(delete_cache, "part:id:7")
+
+        def load_then_delete(pk):
+            # 📖 The reader has its row; the delete commits before it caches
+            self.service.delete(instance)
+            return {"id": 7}
+
+        self.repo_mock.find_row_by_id.side_effect = load_then_delete
+        self.service.find_by_id(7)  # 🐢 Returns the row it already read
+
+        self.repo_mock.find_row_by_id.side_effect = None
+        with self.assertRaises(EntityNotFoundException):
+            self.service.find_by_id(7)
+
+    # 🪝 Test writes pass before/after rows to the change hook
+    @patch("core.services.base_service.bump_model_version")
+    @patch("core.services.base_service.set_cache")
+    def test_on_change_hook(self, mock_set, mock_bump):
+        self.service.on_change = MagicMock()
+        before = Part(id=3, name="a", sku="S", description="x", weight_ounces=1)
+        after = Part(id=3, name="b", sku="S", description="x", weight_ounces=1)
+        self.repo_mock.update.return_value = after
+
+        self.service.update(before, {"name": "b"})
+        old_rows, new_rows = self.service.on_change.call_args[0]
+        self.assertEqual((old_rows[0]["name"], new_rows[0]["name"]), ("a", "b"))
+
+        self.service.delete(after)
+        self.service.on_change.assert_called_with([new_rows[0]], [])
 
     # ❌ Test failure scenario for entity deletion
     def test_delete_failure(self):
@@ -0,0 +1,29 @@
+from django.test import TestCase
+from core.models import Part
+from core.utils.benchmark import measure, synthetic_catalog, synthetic_part
+
+
+# 🧪 Test class for the shared benchmark helpers
+class BenchmarkUtilsTests(TestCase):
+    # 🧪 Test the catalog grows to each size and is rolled back afterwards
+    def test_synthetic_catalog_rolls_back(self):
+        seen = []
+        for size in synthetic_catalog([5, 2]):
+            seen.append((size, Part.objects.count()))
+        self.assertEqual(seen, [(2, 2), (5, 5)])
+        self.assertEqual(Part.objects.count(), 0)
+
+    # 🛑 Test stopping early still leaves the database untouched
+    def test_synthetic_catalog_rolls_back_on_break(self):
+        catalog = synthetic_catalog([3, 6], lambda i: synthetic_part(i, "x"))
+        for size in catalog:
+            self.assertEqual(Part.objects.get(sku="bench-0").description, "x")
+            break
+        catalog.close()
+        self.assertEqual(Part.objects.count(), 0)
+
+    # 📏 Test measure reports a peak and a wall time
+    def test_measure(self):
+        peak, elapsed = measure(lambda: [0] * 10000)
+        self.assertGreater(peak, 0)
+        self.assertGreaterEqual(elapsed, 0)
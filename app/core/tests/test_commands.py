@@ -33,3 +33,173 @@ class WaitForDbCommandTests(TestCase):
 
         # 🔍 Check that final success message is in output
         self.assertIn("Database is ready!", out.getvalue())
+
+
+class RebuildWordCountsCommandTests(TestCase):
+    """
+    🧪 Test suite for the rebuild_word_counts management command
+    """
+
+    @patch("core.services.part_service.bump_model_version")
+    def test_rebuild_word_counts(self, mock_bump):
+        """
+        ✅ Ensures the index is recomputed from the stored descriptions and
+        the cached word stats are retired.
+        """
+        from core.models import Part, WordCount
+
+        # 📝 Rows written straight to the ORM bypass the maintained index
+        Part.objects.create(
+            name="A", sku="A1", description="bolt Bolt nut", weight_ounces=1
+        )
+
+        out = StringIO()
+        call_command("rebuild_word_counts", stdout=out)
+
+        # 🔍 Verify counts and the success message
+        self.assertEqual(
+            dict(WordCount.objects.values_list("word", "count")),
+            {"bolt": 2, "nut": 1},
+        )
+        self.assertIn("2 distinct words", out.getvalue())
+        mock_bump.assert_called_once_with("part")
+
+
+class BenchmarkWordCountsCommandTests(TestCase):
+    """
+    🧪 Test suite for the benchmark_word_counts management command
+    """
+
+    def test_benchmark_reports_and_rolls_back(self):
+        """
+        ✅ Ensures one row per size is printed and no parts are left behind.
+        """
+        from core.models import Part
+
+        out = StringIO()
+        call_command("benchmark_word_counts", rows="20,10", stdout=out)
+
+        lines = out.getvalue().splitlines()
+        # 🔍 Header plus one line per size, smallest first
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(lines[1].split()[0], "10")
+        self.assertEqual(Part.objects.count(), 0)
+
+
+class CountWordsParallelCommandTests(TestCase):
+    """
+    🧪 Test suite for the count_words_parallel management command
+    """
+
+    @patch("core.management.commands.count_words_parallel.reset_process_pool")
+    def test_count_words_parallel(self, mock_reset):
+        """
+        ✅ Ensures the top words are printed and the pool is torn down.
+        """
+        from core.models import Part
+
+        Part.objects.create(
+            name="A", sku="A1", description="gear gear nut", weight_ounces=1
+        )
+
+        out = StringIO()
+        call_command("count_words_parallel", top_n=1, workers=2, stdout=out)
+
+        # 🔍 Verify the top word and the teardown
+        self.assertIn("2  gear", out.getvalue())
+        self.assertNotIn("nut", out.getvalue())
+        mock_reset.assert_called_once()
+
+
+class ImportPartsCommandTests(TestCase):
+    """
+    🧪 Test suite for the import_parts management command
+    """
+
+    def setUp(self):
+        import tempfile
+
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def write(self, name, text):
+        import os
+
+        path = os.path.join(self.tmpdir.name, name)
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(text)
+        return path
+
+    @patch("core.services.part_service.bump_model_version")
+    def test_import_ndjson(self, mock_bump):
+        """
+        ✅ Ensures valid rows are upserted by SKU, bad ones are counted and
+        the cache version is bumped exactly once.
+        """
+        import json
+        from core.models import Part, WordCount
+
+        Part.objects.create(
+            name="Old", sku="S1", description="old text", weight_ounces=1
+        )
+        rows = [
+            {"name": "Bolt", "sku": "S1", "description": "steel bolt",
+             "weight_ounces": 2},
+            {"name": "Nut", "sku": "S2", "description": "steel nut",
+             "weight_ounces": 1, "is_active": False},
+            {"name": "No SKU", "description": "x", "weight_ounces": 1},
+            {"name": "Nut v2", "sku": "S2", "description": "steel nut",
+             "weight_ounces": 1, "is_active": False},
+        ]
+        text = "\n".join(json.dumps(row) for row in rows) + "\n{broken\n\n[1]\n"
+        path = self.write("parts.ndjson", text)
+
+        # 📊 Word index as seen at the moment the version is bumped
+        indexed_at_bump = []
+        mock_bump.side_effect = lambda name: indexed_at_bump.append(
+            WordCount.objects.filter(word="steel").values_list(
+                "count", flat=True
+            ).first()
+        )
+
+        out, err = StringIO(), StringIO()
+        call_command("import_parts", path, batch_size=2, stdout=out, stderr=err)
+
+        # 🔍 S1 updated, S2 created (last occurrence wins), 3 rejected
+        self.assertEqual(
+            dict(Part.objects.values_list("sku", "name")),
+            {"S1": "Bolt", "S2": "Nut v2"},
+        )
+        self.assertFalse(Part.objects.get(sku="S2").is_active)
+        self.assertIn("3 rejected", out.getvalue())
+        self.assertIn("line 3:", err.getvalue())
+        self.assertIn("line 5:", err.getvalue())
+        mock_bump.assert_called_once_with("part")
+
+        # 📊 The word index is rebuilt from the imported descriptions
+        self.assertEqual(WordCount.objects.get(word="steel").count, 2)
+        # 🔄 ... before the bump, so no read caches the old index as new
+        self.assertEqual(indexed_at_bump, [2])
+
+    def test_import_csv_from_stdin(self):
+        """
+        ✅ Ensures CSV is read from stdin and a blank is_active takes the
+        model default.
+        """
+        from core.models import Part
+
+        text = (
+            "name,sku,description,weight_ounces,is_active\n"
+            'Gear,G1,"cast, iron gear",3,\n'
+            "Bad,G2,desc,heavy,true\n"
+        )
+        out, err = StringIO(), StringIO()
+        with patch("sys.stdin", StringIO(text)):
+            call_command("import_parts", format="csv", stdout=out, stderr=err)
+
+        gear = Part.objects.get(sku="G1")
+        self.assertEqual(gear.description, "cast, iron gear")
+        self.assertTrue(gear.is_active)
+        self.assertFalse(Part.objects.filter(sku="G2").exists())
+        self.assertIn("1 created", out.getvalue())
+        self.assertIn("line 3:", err.getvalue())
@@ -0,0 +1,135 @@
+import gzip
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from unittest.mock import MagicMock, patch
+from core.utils import compression
+from core.utils.redis import bump_model_version, redis_client
+
+
+# 🧪 Test class for Accept-Encoding negotiation
+class ChooseEncodingTests(SimpleTestCase):
+    # 🤝 Test q-values win and ties follow the server's preference order
+    def test_choose_encoding(self):
+        offered = ["br", "gzip"]
+        self.assertEqual(compression.choose_encoding("gzip, br", offered), "br")
+        self.assertEqual(
+            compression.choose_encoding("br;q=0.5, gzip", offered), "gzip"
+        )
+        self.assertEqual(compression.choose_encoding("*", offered), "br")
+        self.assertEqual(
+            compression.choose_encoding("gzip;q=0, deflate", offered), None
+        )
+        self.assertIsNone(compression.choose_encoding(None, offered))
+        self.assertIsNone(compression.choose_encoding("gzip;q=abc", offered))
+
+
+# 🧪 Test class for resolving the configured encodings
+class EnabledEncodingsTests(SimpleTestCase):
+    # ⚠️ Test a missing encoder is skipped and logged once, not per request
+    @override_settings(RESPONSE_COMPRESSION_ENCODINGS=["missing", "gzip"])
+    def test_unavailable_encoding_warned_once(self):
+        compression._installed_encodings.cache_clear()
+        with patch.dict(compression.ENCODERS, {"missing": None}), \
+                patch.object(compression.logger, "warning") as mock_warning:
+            for _ in range(3):
+                self.assertEqual(compression.enabled_encodings(), ("gzip",))
+        mock_warning.assert_called_once()
+
+
+# 🧪 Test class for stored response encodings (uses real Redis)
+@override_settings(
+    RESPONSE_COMPRESSION_ENCODINGS=["gzip"],
+    RESPONSE_COMPRESSION_MIN_BYTES=100,
+    RESPONSE_COMPRESSION_MAX_VARIANTS=10,
+)
+class PrecompressedTests(SimpleTestCase):
+    def setUp(self):
+        bump_model_version("compressiontest")  # 🆕 Fresh versioned keys
+        compression.flush_hits()
+        redis_client.delete(compression.METRICS_KEY)
+        self.factory = RequestFactory()
+        self.body = b'{"data":"' + b"steel bolt " * 50 + b'"}'
+        self.handler = MagicMock(return_value=HttpResponse(self.body))
+        self.view = compression.precompressed("compressiontest", ttl=60)(
+            lambda view_self, request: self.handler(request)
+        )
+
+    def tearDown(self):
+        redis_client.delete(compression.METRICS_KEY)
+
+    def get(self, path="/api/v1/parts", **headers):
+        return self.view(None, self.factory.get(path, **headers))
+
+    # 🗜️ Test the first request compresses and later ones reuse the bytes
+    def test_compresses_once_per_version(self):
+        first = self.get(HTTP_ACCEPT_ENCODING="gzip")
+        second = self.get(HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(first["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(first.content), self.body)
+        self.assertEqual(second.content, first.content)
+        self.assertIn("Accept-Encoding", second["Vary"])
+        self.handler.assert_called_once()
+
+        stats = compression.get_compression_stats()["gzip"]
+        self.assertEqual(stats["compressed"], 1)
+        self.assertEqual(stats["served_cached"], 1)
+        self.assertLess(stats["ratio"], 1)
+
+        # 🔄 A write retires the stored body
+        bump_model_version("compressiontest")
+        self.get(HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(self.handler.call_count, 2)
+
+    # 📊 Test hits are counted in process and flushed in one batch
+    def test_hits_do_not_write_to_redis(self):
+        self.get(HTTP_ACCEPT_ENCODING="gzip")
+        with patch.object(compression, "redis_client") as mock_redis:
+            for _ in range(3):
+                self.get(HTTP_ACCEPT_ENCODING="gzip")
+            mock_redis.hincrby.assert_not_called()
+            mock_redis.pipeline.assert_not_called()
+        self.assertEqual(
+            compression.get_compression_stats()["gzip"]["served_cached"], 3
+        )
+
+        with patch.object(compression, "HIT_FLUSH_EVERY", 2):
+            self.get(HTTP_ACCEPT_ENCODING="gzip")
+            self.get(HTTP_ACCEPT_ENCODING="gzip")  # 🚿 Second hit flushes
+        self.assertEqual(
+            int(redis_client.hget(compression.METRICS_KEY, "gzip:served_cached")),
+            5,
+        )
+
+    # 📏 Test small bodies and clients without gzip get plain responses
+    def test_plain_responses(self):
+        plain = self.get()
+        self.assertFalse(plain.has_header("Content-Encoding"))
+        self.assertIn("Accept-Encoding", plain["Vary"])
+        self.handler.return_value = HttpResponse(b"{}")
+        small = self.get("/small", HTTP_ACCEPT_ENCODING="gzip")
+        self.assertFalse(small.has_header("Content-Encoding"))
+
+    # ⚠️ Test error responses are neither compressed nor stored
+    def test_errors_not_stored(self):
+        self.handler.return_value = HttpResponse(self.body, status=400)
+        self.get(HTTP_ACCEPT_ENCODING="gzip")
+        response = self.get(HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertEqual(self.handler.call_count, 2)
+
+    # 🎟️ Test bodies past the variant budget are served uncompressed, with
+    # no compression work or metrics write per request
+    @override_settings(RESPONSE_COMPRESSION_MAX_VARIANTS=1)
+    def test_variant_budget(self):
+        self.get("/a", HTTP_ACCEPT_ENCODING="gzip")
+        with patch.object(compression, "record_compression") as mock_record, \
+                patch.dict(compression.ENCODERS, {"gzip": MagicMock()}) as encoders:
+            over = self.get("/b", HTTP_ACCEPT_ENCODING="gzip")
+            self.get("/b", HTTP_ACCEPT_ENCODING="gzip")
+            encoders["gzip"].assert_not_called()
+            mock_record.assert_not_called()
+        self.assertFalse(over.has_header("Content-Encoding"))
+        self.assertEqual(over.content, self.body)
+        self.assertIn("Accept-Encoding", over["Vary"])
+        self.assertEqual(self.handler.call_count, 3)
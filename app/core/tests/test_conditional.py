@@ -0,0 +1,56 @@
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase
+from unittest.mock import MagicMock, patch
+from core.utils.conditional import etag_matches, version_etag, versioned_etag
+
+
+# 🧪 Test class for version-derived ETags and conditional GET
+@patch("core.utils.conditional.get_model_version", return_value=7)
+class ConditionalGetTests(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.handler = MagicMock(return_value=HttpResponse("body"))
+        self.view = versioned_etag("Part")(
+            lambda view_self, request: self.handler(request)
+        )
+
+    # 🏷️ Test tags carry the model version and differ per full path
+    def test_version_etag(self, mock_version):
+        tag = version_etag(self.factory.get("/api/v1/parts"), "Part")
+        self.assertRegex(tag, r'^W/"part-v7-[0-9a-f]{16}"$')
+        self.assertNotEqual(
+            tag, version_etag(self.factory.get("/api/v1/parts?fields=sku"), "Part")
+        )
+
+    # 🔍 Test weak comparison, lists and the wildcard
+    def test_etag_matches(self, mock_version):
+        tag = 'W/"part-v7-abc"'
+        self.assertTrue(etag_matches('"part-v7-abc"', tag))
+        self.assertTrue(etag_matches('"x", W/"part-v7-abc"', tag))
+        self.assertTrue(etag_matches("*", tag))
+        self.assertFalse(etag_matches('W/"part-v6-abc"', tag))
+        self.assertFalse(etag_matches(None, tag))
+
+    # 📤 Test a fresh GET runs the handler and gets the tag
+    def test_sets_etag_on_success(self, mock_version):
+        response = self.view(None, self.factory.get("/api/v1/parts"))
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["ETag"].startswith('W/"part-v7-'))
+        self.handler.assert_called_once()
+
+    # 🚫 Test a matching If-None-Match is answered without the handler
+    def test_not_modified_skips_handler(self, mock_version):
+        request = self.factory.get("/api/v1/parts")
+        tag = version_etag(request, "Part")
+        response = self.view(
+            None, self.factory.get("/api/v1/parts", HTTP_IF_NONE_MATCH=tag)
+        )
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], tag)
+        self.handler.assert_not_called()
+
+    # ⚠️ Test error responses are not tagged
+    def test_error_responses_untagged(self, mock_version):
+        self.handler.return_value = HttpResponse(status=400)
+        response = self.view(None, self.factory.get("/api/v1/parts"))
+        self.assertFalse(response.has_header("ETag"))
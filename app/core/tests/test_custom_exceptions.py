@@ -6,6 +6,7 @@ from core.exceptions.custom_exceptions import (
     EntityNotFoundException,
     EntityCreateException,
     EntityUpdateException,
+    EntityUpsertException,
     EntityDeleteException,
     EntityFetchAllException,
     EntityFetchException,
@@ -52,6 +53,15 @@ class CustomExceptionsTest(TestCase):
             "update_failed"
         )
 
+    # 🔁 Test for entity upsert exception
+    def test_entity_upsert_exception(self):
+        self.assert_exception_attrs(
+            EntityUpsertException,
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            "Failed to upsert entities.",
+            "upsert_failed"
+        )
+
     # 🗑️ Test for entity deletion exception
     def test_entity_delete_exception(self):
         self.assert_exception_attrs(
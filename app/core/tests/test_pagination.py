@@ -0,0 +1,42 @@
+from django.test import SimpleTestCase
+from core.utils.pagination import (
+    MAX_PAGE_SIZE,
+    DEFAULT_PAGE_SIZE,
+    encode_cursor,
+    decode_cursor,
+    parse_limit,
+    parse_ids,
+)
+
+
+# 🧪 Test class for keyset pagination helpers
+class PaginationUtilsTests(SimpleTestCase):
+    # 🔁 Test cursors round-trip their values
+    def test_cursor_round_trip(self):
+        token = encode_cursor(42, "abc")
+        self.assertEqual(decode_cursor(token), [42, "abc"])
+
+    # 🚫 Test malformed cursors raise ValueError
+    def test_decode_invalid_cursor(self):
+        for token in ("not-a-cursor", encode_cursor()):
+            with self.assertRaises(ValueError):
+                decode_cursor(token)
+
+    # 📏 Test limit parsing defaults and clamps
+    def test_parse_limit(self):
+        self.assertEqual(parse_limit(None), DEFAULT_PAGE_SIZE)
+        self.assertEqual(parse_limit("10"), 10)
+        self.assertEqual(parse_limit(str(MAX_PAGE_SIZE + 1)), MAX_PAGE_SIZE)
+
+    # ⚠️ Test invalid limits raise ValueError
+    def test_parse_limit_invalid(self):
+        for raw in ("0", "-3", "abc"):
+            with self.assertRaises(ValueError):
+                parse_limit(raw)
+
+    # 🔢 Test ID lists parse in order and reject bad input
+    def test_parse_ids(self):
+        self.assertEqual(parse_ids("3, 1,3"), [3, 1, 3])
+        for raw in (None, "", "1,x", "0", "1,2,3"):
+            with self.assertRaises(ValueError):
+                parse_ids(raw, maximum=2)
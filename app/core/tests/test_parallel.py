@@ -0,0 +1,26 @@
+from unittest import TestCase
+from unittest.mock import patch
+from concurrent.futures.process import BrokenProcessPool
+from core.utils import parallel
+
+
+# 🧪 Test class for the shared process pool helpers
+class ProcessPoolTests(TestCase):
+    # 🧹 Never leave a pool behind between tests
+    def tearDown(self):
+        parallel.reset_process_pool()
+
+    # 🏊 Test the pool is reused until its size changes
+    def test_pool_reused_per_size(self):
+        pool = parallel.get_process_pool(2)
+        self.assertIs(parallel.get_process_pool(2), pool)
+        self.assertIsNot(parallel.get_process_pool(3), pool)
+
+    # 💥 Test a broken pool is dropped so the next call starts fresh
+    @patch.object(parallel, "get_process_pool")
+    def test_broken_pool_is_reset(self, mock_get_pool):
+        mock_get_pool.return_value.submit.side_effect = BrokenProcessPool()
+        with patch.object(parallel, "reset_process_pool") as mock_reset:
+            with self.assertRaises(BrokenProcessPool):
+                parallel.run_in_process_pool(len, [("ab",)], 2)
+        mock_reset.assert_called_once()
@@ -1,6 +1,11 @@
+from collections import Counter
+from unittest import skipUnless
+from unittest.mock import patch
+from django.db import connection
 from django.test import TestCase
 from core.models import Part
-from core.repositories.part_repository import PartRepository
+from core.repositories import part_repository
+from core.repositories.part_repository import PartRepository, split_id_range
 
 
 # 🧪 Test class for Part Repository functionality
@@ -51,3 +56,193 @@ class PartRepositoryTests(TestCase):
         result = self.repo.most_common_words_in_descriptions()
         # 🔍 Verify empty list is returned
         self.assertEqual(result, [])
+
+    # 🔁 Test upsert inserts new SKUs and updates only changed ones
+    def test_bulk_upsert_creates_updates_and_skips(self):
+        rows = [
+            {
+                "name": "Part One", "sku": "SKU1", "weight_ounces": 10,
+                "description": "This is a sample description with common words.",
+            },
+            {
+                "name": "Renamed", "sku": "SKU2", "weight_ounces": 20,
+                "description": "Common words repeat in this second test description.",
+            },
+            {
+                "name": "Part Three", "sku": "SKU3", "weight_ounces": 30,
+                "description": "Brand new.",
+            },
+        ]
+        summary = self.repo.bulk_upsert(rows)
+        # 🔍 Verify counts and that only the changed row was rewritten
+        self.assertEqual(summary["created"], 1)
+        self.assertEqual(summary["updated"], 1)
+        self.assertEqual(summary["unchanged"], 1)
+        self.assertEqual(
+            summary["updated_ids"], [Part.objects.get(sku="SKU2").id]
+        )
+        self.assertEqual(Part.objects.get(sku="SKU2").name, "Renamed")
+        self.assertEqual(Part.objects.count(), 3)
+
+    # 🔁 Test repeating an upsert is a no-op
+    def test_bulk_upsert_is_idempotent(self):
+        rows = [{
+            "name": "Part Three", "sku": "SKU3", "weight_ounces": 30,
+            "description": "Brand new.",
+        }]
+        self.repo.bulk_upsert(rows)
+        summary = self.repo.bulk_upsert(rows)
+        self.assertEqual(
+            (summary["created"], summary["updated"], summary["unchanged"]),
+            (0, 0, 1),
+        )
+
+    # 📥 Batches to import: SKU1 unchanged, SKU2 updated twice (the last
+    # occurrence wins), SKU3 created with the default is_active
+    IMPORT_BATCHES = [
+        [
+            {
+                "name": "Part One", "sku": "SKU1", "weight_ounces": 10,
+                "description": "This is a sample description with common words.",
+            },
+            {
+                "name": "First rename", "sku": "SKU2", "weight_ounces": 20,
+                "description": "x",
+            },
+        ],
+        [
+            {
+                "name": "Renamed", "sku": "SKU2", "weight_ounces": 21,
+                "description": "Quoted, \"comma\" text", "is_active": False,
+            },
+            {
+                "name": "Part Three", "sku": "SKU3", "weight_ounces": 30,
+                "description": "Brand new.",
+            },
+        ],
+    ]
+
+    def assert_imported(self, summary):
+        sku2 = Part.objects.get(sku="SKU2")
+        self.assertEqual(
+            {k: summary[k] for k in ("rows", "created", "updated", "unchanged")},
+            {"rows": 4, "created": 1, "updated": 1, "unchanged": 1},
+        )
+        self.assertEqual(summary["updated_ids"], [sku2.id])
+        self.assertEqual(
+            (sku2.name, sku2.weight_ounces, sku2.description, sku2.is_active),
+            ("Renamed", 21, 'Quoted, "comma" text', False),
+        )
+        self.assertTrue(Part.objects.get(sku="SKU3").is_active)
+
+    # 📥 Test batched import upserts by SKU on the current backend
+    def test_import_batches(self):
+        self.assert_imported(self.repo.import_batches(iter(self.IMPORT_BATCHES)))
+
+    # 🐘 Test the COPY + staging-table merge path
+    @skipUnless(connection.vendor == "postgresql", "PostgreSQL only")
+    def test_import_postgres(self):
+        self.assert_imported(self.repo._import_postgres(iter(self.IMPORT_BATCHES)))
+
+    # 🔎 Test existing SKUs are looked up set-wise
+    def test_find_existing_skus(self):
+        result = self.repo.find_existing_skus(["SKU1", "NOPE"])
+        self.assertEqual(result, {"SKU1"})
+
+    # 🔤 Test ties are ordered by word so every engine agrees
+    def test_most_common_words_ties_by_word(self):
+        result = self.repo.most_common_words_in_descriptions(3)
+        self.assertEqual(
+            result, [("common", 2), ("description", 2), ("this", 2)]
+        )
+
+    # 🐘 Test SQL counting matches the Python tokenizer exactly
+    @skipUnless(connection.vendor == "postgresql", "PostgreSQL only")
+    def test_postgres_engine_matches_python(self):
+        Part.objects.create(
+            name="Tricky", sku="SKU9", weight_ounces=1,
+            description="Über-bolt, über_bolt; M8x1.25 nut's CAFÉ café 2nd!",
+        )
+        self.assertEqual(
+            self.repo._most_common_words_postgres(50),
+            self.repo._most_common_words_python(50),
+        )
+
+    # 🐘 Test SQL tie-breaking matches the Python engine through the
+    # public entry point (ties across case, accents and digits)
+    @skipUnless(connection.vendor == "postgresql", "PostgreSQL only")
+    def test_postgres_engine_ties_match_python(self):
+        Part.objects.create(
+            name="Ties", sku="SKU8", weight_ounces=1,
+            description="zeta Zeta alpha ÄLPHA älpha 10 9 _x _x Alpha",
+        )
+        self.assertEqual(
+            self.repo.most_common_words_in_descriptions(20),
+            self.repo._most_common_words_python(20),
+        )
+
+    # 🗃️ Test other backends fall back to counting in Python
+    @patch.object(connection, "vendor", "sqlite")
+    @patch.object(PartRepository, "_most_common_words_postgres")
+    def test_non_postgres_falls_back_to_python(self, mock_postgres):
+        self.assertEqual(len(self.repo.most_common_words_in_descriptions(2)), 2)
+        mock_postgres.assert_not_called()
+
+    # 🚰 Test chunked counting matches whatever the chunk size
+    def test_most_common_words_streaming_chunk_sizes(self):
+        expected = self.repo.most_common_words_streaming(10)
+        for chunk_size in (1, 2, 1000):
+            self.assertEqual(
+                self.repo.most_common_words_streaming(10, chunk_size), expected
+            )
+        self.assertEqual(expected[0], ("common", 2))
+        self.assertEqual(self.repo.most_common_words_streaming(0), [])
+
+    # ✂️ Test ID ranges cover the span without gaps or overlaps
+    def test_split_id_range(self):
+        self.assertEqual(
+            split_id_range(1, 10, 4), [(1, 4), (4, 7), (7, 10), (10, 11)]
+        )
+        self.assertEqual(split_id_range(5, 5, 8), [(5, 6)])
+
+    # 🗺️ Test the map-reduce engine agrees with the streaming engine
+    def test_most_common_words_parallel_inline(self):
+        self.assertEqual(
+            self.repo.most_common_words_parallel(10, workers=3),
+            self.repo.most_common_words_streaming(10),
+        )
+        Part.objects.all().delete()
+        self.assertEqual(self.repo.most_common_words_parallel(5), [])
+
+    # 🏊 Test ranges go to the process pool on a shareable database
+    @patch.object(connection, "vendor", "postgresql")
+    @patch.object(part_repository, "run_in_process_pool")
+    def test_most_common_words_parallel_uses_pool(self, mock_pool):
+        mock_pool.return_value = [Counter({"bolt": 2}), Counter({"bolt": 1, "nut": 1})]
+        result = self.repo.most_common_words_parallel(5, workers=2)
+        self.assertEqual(result, [("bolt", 3), ("nut", 1)])
+        func, args_list, workers = mock_pool.call_args[0]
+        self.assertEqual(workers, 2)
+        self.assertEqual(len(args_list), 2)  # 🆔 IDs span just two rows
+
+    # 🔎 Test search requires every term and ranks name matches first
+    def test_search_ranks_and_pages(self):
+        Part.objects.create(
+            name="Common gear", sku="SKU3", weight_ounces=5,
+            description="A gear.",
+        )
+        first = self.repo.search(["common"], 2)
+        self.assertEqual(
+            [(row["sku"], row["rank"]) for row in first],
+            [("SKU3", 2), ("SKU1", 1)],
+        )
+        rest = self.repo.search(["common"], 2, after=(1, first[-1]["id"]))
+        self.assertEqual([row["sku"] for row in rest], ["SKU2"])
+        self.assertEqual(self.repo.search(["common", "gear"], 10)[0]["sku"], "SKU3")
+        self.assertEqual(self.repo.search(["missing"], 10), [])
+
+    # 🐘 Test the tsvector path on PostgreSQL
+    @skipUnless(connection.vendor == "postgresql", "PostgreSQL only")
+    def test_search_postgres(self):
+        rows = self.repo._search_postgres(["second"], 10, None)
+        self.assertEqual([row["sku"] for row in rows], ["SKU2"])
@@ -1,48 +1,215 @@
 # 🧪 Test suite for the PartService class
+from django.core.exceptions import ImproperlyConfigured
 from django.test import TestCase
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 from core.services.part_service import PartService
-from core.exceptions.custom_exceptions import EntityFetchException
+from core.utils.redis import bump_model_version
+from core.utils.pagination import decode_cursor, encode_cursor
+from core.exceptions.custom_exceptions import (
+    EntityFetchException,
+    EntityUpsertException,
+)
 
 
 class PartServiceTests(TestCase):
     # 🏗️ Setup method to initialize test environment
     def setUp(self):
         self.service = PartService()
+        # 🔄 Start every test on a fresh cache version
+        bump_model_version("part")
 
-    # 📊 Test successful retrieval of most common words
-    @patch("core.services.part_service.PartRepository")
-    def test_find_most_common_words_success(self, MockRepo):
-        # 🎯 Arrange: Set up mock repository with test data
-        mock_repo_instance = MockRepo.return_value
-        mock_repo_instance.most_common_words_in_descriptions.return_value = [
+    # 📊 Test successful retrieval of most common words from the index
+    @patch("core.services.part_service.WordCountRepository")
+    def test_find_most_common_words_success(self, MockWords):
+        # 🎯 Arrange: Set up mock word-count index with test data
+        mock_words_instance = MockWords.return_value
+        mock_words_instance.top.return_value = [
             ("widget", 5),  # 🔝 Most frequent word
             ("gear", 3),    # 🥈 Second most frequent
             ("bolt", 2),    # 🥉 Third most frequent
         ]
 
-        # 🛠️ Inject mock repository into service
+        # 🛠️ Service picks up the mocked index
         service = PartService()
-        service.repository = mock_repo_instance
 
         # ✅ Act: Call the service method
         result = service.find_most_common_words_in_descriptions(3)
 
-        # 🔍 Assert: Verify results and method calls
+        # 🔍 Assert: Verify results and that the top-K list was read once
         self.assertEqual(result, [("widget", 5), ("gear", 3), ("bolt", 2)])
-        mock_repo_instance.most_common_words_in_descriptions.assert_called_once_with(3)
+        mock_words_instance.top.assert_called_once_with(1000)
 
-    # ⚠️ Test error handling when database operation fails
+    # 🐘 Test the database engine counts per query and skips upkeep
+    @patch("core.services.part_service.WordCountRepository")
     @patch("core.services.part_service.PartRepository")
-    def test_find_most_common_words_raises_exception(self, MockRepo):
+    def test_database_engine(self, MockRepo, MockWords):
+        MockRepo.return_value.most_common_words_in_descriptions.return_value = [
+            ("widget", 5),
+        ]
+        with self.settings(WORD_STATS_ENGINE="database"):
+            service = PartService()
+
+        self.assertEqual(
+            service.find_most_common_words_in_descriptions(1), [("widget", 5)]
+        )
+        service.on_change([], [{"description": "widget"}])
+        MockWords.return_value.top.assert_not_called()
+        MockWords.return_value.apply_delta.assert_not_called()
+
+    # 🚰 Test the stream engine counts per query in bounded memory
+    @patch("core.services.part_service.WordCountRepository")
+    @patch("core.services.part_service.PartRepository")
+    def test_stream_engine(self, MockRepo, MockWords):
+        MockRepo.return_value.most_common_words_streaming.return_value = [
+            ("gear", 2),
+        ]
+        with self.settings(WORD_STATS_ENGINE="stream"):
+            service = PartService()
+
+        self.assertEqual(
+            service.find_most_common_words_in_descriptions(1), [("gear", 2)]
+        )
+        MockRepo.return_value.most_common_words_streaming.assert_called_once_with(1000)
+        MockWords.return_value.top.assert_not_called()
+
+    # 🗺️ Test the parallel engine passes the configured pool size
+    @patch("core.services.part_service.WordCountRepository")
+    @patch("core.services.part_service.PartRepository")
+    def test_parallel_engine(self, MockRepo, MockWords):
+        MockRepo.return_value.most_common_words_parallel.return_value = []
+        with self.settings(WORD_STATS_ENGINE="parallel", WORD_STATS_WORKERS=6):
+            service = PartService()
+
+        service.find_most_common_words_in_descriptions(3)
+        MockRepo.return_value.most_common_words_parallel.assert_called_once_with(
+            1000, workers=6
+        )
+
+    # 🚫 Test an unknown engine is a configuration error
+    def test_unknown_engine(self):
+        with self.settings(WORD_STATS_ENGINE="magic"):
+            with self.assertRaises(ImproperlyConfigured):
+                PartService()
+
+    # 🏆 Test one cached top-K list serves every top_n up to K
+    @patch("core.services.part_service.WordCountRepository")
+    def test_top_k_cached_and_sliced(self, MockWords):
+        MockWords.return_value.top.return_value = [
+            ("widget", 5), ("gear", 3), ("bolt", 2),
+        ]
+        with self.settings(WORD_STATS_TOP_K=3):
+            service = PartService()
+
+        self.assertEqual(
+            service.find_most_common_words_in_descriptions(2),
+            [("widget", 5), ("gear", 3)],
+        )
+        self.assertEqual(
+            service.find_most_common_words_in_descriptions(3),
+            [("widget", 5), ("gear", 3), ("bolt", 2)],
+        )
+        MockWords.return_value.top.assert_called_once_with(3)
+
+        # 🐢 Beyond K is computed directly, every time
+        service.find_most_common_words_in_descriptions(4)
+        MockWords.return_value.top.assert_called_with(4)
+        self.assertEqual(service.find_most_common_words_in_descriptions(0), [])
+
+        # 🔄 A write bumps the version, so the list is recomputed
+        bump_model_version("part")
+        service.find_most_common_words_in_descriptions(1)
+        self.assertEqual(MockWords.return_value.top.call_count, 3)
+
+    # 📐 Test approx mode tracks committed writes within the sketch bound
+    def test_approx_mode_follows_writes(self):
+        with self.settings(WORD_SKETCH_ENABLED=True, WORD_SKETCH_EPSILON=0.01):
+            service = PartService()
+        service.word_sketch.reset()
+        self.addCleanup(service.word_sketch.reset)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            part = service.create({
+                "name": "A", "sku": "X1", "weight_ounces": 1,
+                "description": "gear gear gear bolt",
+            })
+        with self.captureOnCommitCallbacks(execute=True):
+            service.update(part, {"description": "gear bolt bolt nut"})
+
+        result = service.find_most_common_words_approx(2)
+        self.assertTrue(result["approximate"])
+        self.assertEqual(result["words"], [("bolt", 2), ("gear", 1)])
+        self.assertEqual(result["error_bound"], 1)
+        self.assertEqual(result["confidence"], 0.99)
+
+        # 📏 A tighter bound than the sketch offers falls back to exact
+        exact = service.find_most_common_words_approx(2, max_error=0.0001)
+        self.assertFalse(exact["approximate"])
+        self.assertEqual(exact["words"], [("bolt", 2), ("gear", 1)])
+
+    # 💤 Test approx mode without a sketch answers exactly
+    def test_approx_mode_disabled(self):
+        result = self.service.find_most_common_words_approx(3)
+        self.assertFalse(result["approximate"])
+        self.assertEqual(result["error_bound"], 0)
+
+    # 🔎 Test search is cached per normalized query and model version
+    def test_search_cached_per_normalized_query(self):
+        service = PartService()
+        service.repository = MagicMock()
+        service.repository.search.return_value = [
+            {"id": 1, "rank": 0.5}, {"id": 2, "rank": 0.25},
+        ]
+
+        page = service.search("Steel BOLT", limit=1)
+        self.assertEqual(page["results"], [{"id": 1, "rank": 0.5}])
+        self.assertEqual(decode_cursor(page["next_cursor"]), [0.5, 1])
+        service.repository.search.assert_called_once_with(["bolt", "steel"], 2, None)
+
+        # 💾 Same words in another order/case hit the cache
+        self.assertEqual(service.search("bolt, steel!", limit=1), page)
+        self.assertEqual(service.repository.search.call_count, 1)
+
+        # 🔄 A write bumps the version and the next search recomputes
+        bump_model_version("part")
+        service.search("steel bolt", limit=1)
+        self.assertEqual(service.repository.search.call_count, 2)
+
+    # 🚫 Test empty queries and bad cursors are rejected
+    def test_search_invalid_input(self):
+        with self.assertRaises(ValueError):
+            self.service.search("  ?! ")
+        with self.assertRaises(ValueError):
+            self.service.search("bolt", cursor=encode_cursor("x", 1))
+
+    # 🧹 Test list criteria become ORM lookups
+    def test_filter_parts(self):
+        self.service.find_filtered_page = MagicMock(return_value={})
+        self.service.filter_parts(
+            {"is_active": True, "weight_ounces_min": 2, "sku_prefix": "AB"},
+            "-weight_ounces", 10, None, ["sku"],
+        )
+        self.service.find_filtered_page.assert_called_once_with(
+            {
+                "is_active": True,
+                "weight_ounces__gte": 2,
+                "sku__startswith": "AB",
+            },
+            "-weight_ounces", 10, None, ["sku"], False,
+        )
+        with self.assertRaises(ValueError):
+            self.service.filter_parts({}, "description")
+        with self.assertRaises(ValueError):
+            self.service.filter_parts({"color": "red"})
+
+    # ⚠️ Test error handling when database operation fails
+    @patch("core.services.part_service.WordCountRepository")
+    def test_find_most_common_words_raises_exception(self, MockWords):
         # ❌ Arrange: Configure mock to simulate database error
-        mock_repo_instance = MockRepo.return_value
-        mock_repo_instance.most_common_words_in_descriptions.side_effect = \
-            Exception("Database error")
+        mock_words_instance = MockWords.return_value
+        mock_words_instance.top.side_effect = Exception("Database error")
 
-        # 🛠️ Inject mock repository into service
+        # 🛠️ Service picks up the mocked index
         service = PartService()
-        service.repository = mock_repo_instance
 
         # 🚫 Act + Assert: Verify exception handling
         with self.assertRaises(EntityFetchException) as ctx:
@@ -50,3 +217,115 @@ class PartServiceTests(TestCase):
 
         # ✋ Verify error message
         self.assertIn("Database error", str(ctx.exception))
+
+    # 🔢 Test writes through the service keep the word index exact
+    def test_word_index_follows_writes(self):
+        part = self.service.create({
+            "name": "A", "sku": "W1", "weight_ounces": 1,
+            "description": "red bolt red",
+        })
+        self.service.bulk_create([{
+            "name": "B", "sku": "W2", "weight_ounces": 1,
+            "description": "Bolt nut",
+        }])
+        self.assertEqual(
+            self.service.find_most_common_words_in_descriptions(5),
+            [("bolt", 2), ("red", 2), ("nut", 1)],
+        )
+
+        self.service.update(part, {"description": "blue bolt"})
+        self.service.bulk_upsert([{
+            "name": "B", "sku": "W2", "weight_ounces": 1,
+            "description": "nut nut",
+        }])
+        self.assertEqual(
+            self.service.find_most_common_words_in_descriptions(5),
+            [("nut", 2), ("blue", 1), ("bolt", 1)],
+        )
+
+        self.service.delete(part)
+        self.assertEqual(
+            self.service.find_most_common_words_in_descriptions(5),
+            [("nut", 2)],
+        )
+        # 🔄 A rebuild from scratch agrees with the maintained counts
+        self.assertEqual(self.service.rebuild_word_counts(), 1)
+        self.assertEqual(
+            self.service.find_most_common_words_in_descriptions(5),
+            [("nut", 2)],
+        )
+
+    # 🔁 Test upsert writes changed entities through and bumps the version once
+    @patch("core.services.part_service.bump_model_version")
+    @patch("core.services.base_service.set_many_cache")
+    def test_bulk_upsert_refreshes_changed(self, mock_set_many, mock_bump):
+        service = PartService()
+        service.repository = MagicMock()
+        service.repository.bulk_upsert.return_value = {
+            "created": 1, "updated": 2, "unchanged": 0, "updated_ids": [4, 9],
+        }
+        service.repository.find_rows_by_ids.return_value = [
+            {"id": 4, "sku": "A"}, {"id": 9, "sku": "B"},
+        ]
+
+        service.bulk_upsert([{"sku": "A"}])
+
+        service.repository.find_rows_by_ids.assert_called_once_with([4, 9])
+        items = mock_set_many.call_args[0][0]
+        self.assertEqual(list(items), ["part:id:4", "part:id:9"])
+        self.assertTrue(mock_set_many.call_args[1]["broadcast"])
+        mock_bump.assert_called_once_with("part")
+
+    # 🏁 Test a read that loaded the old row before a bulk upsert cannot
+    # cache it again afterwards (its SET NX fill loses to the write-through)
+    def test_bulk_upsert_beats_in_flight_read(self):
+        from core.models import Part
+        from core.utils.redis import delete_cache
+
+        part = Part.objects.create(
+            name="Old", sku="RACE1", description="old", weight_ounces=1
+        )
+        key = self.service._entity_key(part.id)
+        delete_cache(key)
+        self.addCleanup(delete_cache, key)
+        load = self.service.repository.find_row_by_id
+
+        def load_then_upsert(pk, fields=None):
+            # 📖 The reader has the old row; the upsert commits before it caches
+            row = load(pk)
+            self.service.bulk_upsert([{
+                "name": "New", "sku": "RACE1", "description": "old",
+                "weight_ounces": 1,
+            }])
+            return row
+
+        with patch.object(
+            self.service.repository, "find_row_by_id",
+            side_effect=load_then_upsert,
+        ):
+            self.assertEqual(self.service.find_by_id(part.id)["name"], "Old")
+        self.assertEqual(self.service.find_by_id(part.id)["name"], "New")
+
+    # 💤 Test an all-unchanged upsert leaves caches alone
+    @patch("core.services.part_service.bump_model_version")
+    @patch("core.services.base_service.set_many_cache")
+    def test_bulk_upsert_unchanged_skips_invalidation(self, mock_delete, mock_bump):
+        service = PartService()
+        service.repository = MagicMock()
+        service.repository.bulk_upsert.return_value = {
+            "created": 0, "updated": 0, "unchanged": 3, "updated_ids": [],
+        }
+
+        service.bulk_upsert([{"sku": "A"}])
+
+        mock_delete.assert_not_called()
+        mock_bump.assert_not_called()
+
+    # ⚠️ Test upsert failures are wrapped
+    def test_bulk_upsert_raises_exception(self):
+        service = PartService()
+        service.repository = MagicMock()
+        service.repository.bulk_upsert.side_effect = Exception("boom")
+
+        with self.assertRaises(EntityUpsertException):
+            service.bulk_upsert([{"sku": "A"}])
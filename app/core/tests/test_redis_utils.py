@@ -1,9 +1,28 @@
+import asyncio
 import json
 from unittest import TestCase
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
+from django.test import override_settings
 from core.utils import redis as redis_utils
 
 
+# 🧪 Test class for the bounded-set admission script (uses real Redis)
+class BoundedSetTests(TestCase):
+    def setUp(self):
+        self.key = "test:bounded"
+        redis_utils.redis_client.delete(self.key)
+        self.addCleanup(redis_utils.redis_client.delete, self.key)
+
+    # 🎟️ Test members are admitted until the set is full
+    def test_admit_to_bounded_set(self):
+        self.assertTrue(redis_utils.admit_to_bounded_set(self.key, "a", 2, 60))
+        self.assertTrue(redis_utils.admit_to_bounded_set(self.key, "b", 2, 60))
+        self.assertFalse(redis_utils.admit_to_bounded_set(self.key, "c", 2, 60))
+        # 🔁 Existing members are still admitted
+        self.assertTrue(redis_utils.admit_to_bounded_set(self.key, "a", 2, 60))
+        self.assertGreater(redis_utils.redis_client.ttl(self.key), 0)
+
+
 # 🧪 Test class for Redis utility functions
 class RedisUtilsTests(TestCase):
     # ⚙️ Setup test data and keys
@@ -19,6 +38,15 @@ class RedisUtilsTests(TestCase):
         redis_utils.set_cache(self.key, self.sample_data)
         mock_redis.set.assert_called_with(self.key, json.dumps(self.sample_data), ex=60)
 
+    # 🔒 Test a read-populate never overwrites an existing value
+    @patch.object(redis_utils, "redis_client")
+    def test_set_cache_only_if_missing(self, mock_redis):
+        mock_redis.set.return_value = None
+        redis_utils.set_cache(self.key, self.sample_data, only_if_missing=True)
+        mock_redis.set.assert_called_with(
+            self.key, json.dumps(self.sample_data), ex=60, nx=True
+        )
+
     # 📖 Test retrieving cache data successfully
     @patch.object(redis_utils, "redis_client")
     def test_get_cache_returns_data(self, mock_redis):
@@ -39,6 +67,54 @@ class RedisUtilsTests(TestCase):
         redis_utils.delete_cache(self.key)
         mock_redis.delete.assert_called_with(self.key)
 
+    # 🗑️ Test deleting many keys in one round trip
+    @patch.object(redis_utils, "redis_client")
+    def test_delete_many_cache(self, mock_redis):
+        redis_utils.delete_many_cache(["a", "b"])
+        mock_redis.delete.assert_called_once_with("a", "b")
+
+    # 📚 Test many keys are read with one MGET, misses as None
+    @patch.object(redis_utils, "redis_client")
+    def test_get_many_cache(self, mock_redis):
+        mock_redis.mget.return_value = [json.dumps(self.sample_data), None]
+        result = redis_utils.get_many_cache(["a", "b"])
+        self.assertEqual(result, {"a": self.sample_data, "b": None})
+        mock_redis.mget.assert_called_once_with(["a", "b"])
+
+    # 📦 Test many keys are written through one non-transactional pipeline
+    @patch.object(redis_utils, "redis_client")
+    def test_set_many_cache(self, mock_redis):
+        pipe = mock_redis.pipeline.return_value
+        redis_utils.set_many_cache({"a": 1, "b": 2}, ttl=5, only_if_missing=True)
+        mock_redis.pipeline.assert_called_once_with(transaction=False)
+        pipe.set.assert_any_call("a", "1", ex=5, nx=True)
+        pipe.set.assert_any_call("b", "2", ex=5, nx=True)
+        pipe.execute.assert_called_once()
+
+    # 🔒 Test acquiring a free lock returns a token
+    @patch.object(redis_utils, "redis_client")
+    def test_acquire_lock(self, mock_redis):
+        mock_redis.set.return_value = True
+        token = redis_utils.acquire_lock(self.key, 1000)
+        self.assertIsNotNone(token)
+        mock_redis.set.assert_called_with(
+            f"lock:{self.key}", token, nx=True, px=1000
+        )
+
+    # ⛔ Test acquiring a held lock returns None
+    @patch.object(redis_utils, "redis_client")
+    def test_acquire_lock_held(self, mock_redis):
+        mock_redis.set.return_value = None
+        self.assertIsNone(redis_utils.acquire_lock(self.key))
+
+    # 🔓 Test releasing a lock compares the ownership token server-side
+    @patch.object(redis_utils, "redis_client")
+    def test_release_lock(self, mock_redis):
+        redis_utils.release_lock(self.key, "token")
+        mock_redis.evalsha.assert_called_once_with(
+            redis_utils.RELEASE_LOCK_SCRIPT.sha, 1, f"lock:{self.key}", "token"
+        )
+
     # 📊 Test getting existing model version
     @patch.object(redis_utils, "redis_client")
     def test_get_model_version_returns_existing(self, mock_redis):
@@ -51,11 +127,298 @@ class RedisUtilsTests(TestCase):
     def test_get_model_version_initializes(self, mock_redis):
         mock_redis.get.return_value = None
         version = redis_utils.get_model_version(self.model_name)
-        mock_redis.set.assert_called_with(self.version_key, 1)
+        mock_redis.set.assert_called_with(self.version_key, 1, nx=True)
         self.assertEqual(version, 1)
 
+    # 🏁 Test a concurrent initialiser's version wins over ours
+    @patch.object(redis_utils, "redis_client")
+    def test_get_model_version_initialize_race(self, mock_redis):
+        mock_redis.get.side_effect = [None, "2"]
+        version = redis_utils.get_model_version(self.model_name)
+        self.assertEqual(version, 2)
+
+    # ⚡ Test version and data are resolved with one script call
+    @patch.object(redis_utils, "redis_client")
+    def test_get_versioned_cache_hit(self, mock_redis):
+        mock_redis.evalsha.return_value = ["3", json.dumps(self.sample_data)]
+        key, data = redis_utils.get_versioned_cache(self.model_name, "all")
+        self.assertEqual(key, "part:v3:all")
+        self.assertEqual(data, self.sample_data)
+        mock_redis.evalsha.assert_called_once_with(
+            redis_utils.VERSIONED_GET_SCRIPT.sha, 1, self.version_key, "part", "all"
+        )
+        mock_redis.get.assert_not_called()
+
+    # 🚫 Test a versioned miss still returns the key to populate
+    @patch.object(redis_utils, "redis_client")
+    def test_get_versioned_cache_miss(self, mock_redis):
+        mock_redis.evalsha.return_value = ["1", None]
+        key, data = redis_utils.get_versioned_cache(self.model_name, "7")
+        self.assertEqual((key, data), ("part:v1:7", None))
+
+    # 📜 Test the script source is sent when Redis does not know the SHA
+    @patch.object(redis_utils, "redis_client")
+    def test_lua_script_falls_back_to_eval(self, mock_redis):
+        mock_redis.evalsha.side_effect = redis_utils.redis.exceptions.NoScriptError()
+        mock_redis.eval.return_value = ["1", None]
+        redis_utils.get_versioned_cache(self.model_name, "all")
+        mock_redis.eval.assert_called_once()
+
     # ⬆️ Test incrementing model version
     @patch.object(redis_utils, "redis_client")
     def test_bump_model_version(self, mock_redis):
         redis_utils.bump_model_version(self.model_name)
         mock_redis.incr.assert_called_with(self.version_key)
+
+
+# 🧪 Test class for the in-process L1 cache
+class LocalCacheTests(TestCase):
+    # ⚙️ Setup an enabled cache with small bounds
+    def setUp(self):
+        self.cache = redis_utils.LocalCache(
+            enabled=True, max_entries=2, max_bytes=100, ttl=30
+        )
+
+    # 🎯 Test hits and misses are counted
+    def test_get_counts_hits_and_misses(self):
+        self.cache.set("a", {"x": 1}, 10)
+        self.assertEqual(self.cache.get("a"), (True, {"x": 1}))
+        self.assertEqual(self.cache.get("b"), (False, None))
+        stats = self.cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+
+    # 📏 Test least recently used entries are evicted past max_entries
+    def test_evicts_lru_by_entries(self):
+        self.cache.set("a", 1, 10)
+        self.cache.set("b", 2, 10)
+        self.cache.get("a")
+        self.cache.set("c", 3, 10)
+        self.assertFalse(self.cache.get("b")[0])
+        self.assertTrue(self.cache.get("a")[0])
+        self.assertEqual(self.cache.stats()["evictions"], 1)
+
+    # 📦 Test entries are evicted past max_bytes and oversized values skipped
+    def test_evicts_by_bytes(self):
+        self.cache.set("a", 1, 60)
+        self.cache.set("b", 2, 60)
+        self.assertFalse(self.cache.get("a")[0])
+        self.cache.set("huge", 3, 500)
+        self.assertFalse(self.cache.get("huge")[0])
+        self.assertEqual(self.cache.stats()["bytes"], 60)
+
+    # ⏱️ Test expired entries are misses
+    @patch.object(redis_utils.time, "monotonic")
+    def test_expired_entry_is_miss(self, mock_time):
+        mock_time.return_value = 100
+        self.cache.set("a", 1, 10, ttl=5)
+        mock_time.return_value = 106
+        self.assertEqual(self.cache.get("a"), (False, None))
+
+    # 🏷️ Test invalidating a model drops its version and versioned entries
+    def test_invalidate_model(self):
+        self.cache.set_version("part", 3)
+        self.cache.set("part:v3:all", [], 10)
+        self.cache.invalidate_model("part")
+        self.assertIsNone(self.cache.get_version("part"))
+        self.assertFalse(self.cache.get("part:v3:all")[0])
+
+
+# 🧪 Test class for Redis utilities with the L1 cache enabled
+@patch.object(redis_utils, "_ensure_invalidation_listener")
+@patch.object(redis_utils, "redis_client")
+class RedisUtilsWithLocalCacheTests(TestCase):
+    def setUp(self):
+        patcher = patch.object(
+            redis_utils, "local_cache", redis_utils.LocalCache(enabled=True)
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    # 🧠 Test a repeated read is served without touching Redis
+    def test_get_cache_served_from_l1(self, mock_redis, mock_listener):
+        mock_redis.get.return_value = json.dumps({"id": 1})
+        redis_utils.get_cache("k")
+        redis_utils.get_cache("k")
+        self.assertEqual(mock_redis.get.call_count, 1)
+
+    # 🏷️ Test the model version is read from Redis only once
+    def test_model_version_served_from_l1(self, mock_redis, mock_listener):
+        mock_redis.get.return_value = "4"
+        self.assertEqual(redis_utils.get_model_version("Part"), 4)
+        self.assertEqual(redis_utils.get_model_version("Part"), 4)
+        self.assertEqual(mock_redis.get.call_count, 1)
+
+    # 📡 Test bumping a version drops local state and broadcasts it
+    def test_bump_invalidates_and_publishes(self, mock_redis, mock_listener):
+        redis_utils.local_cache.set_version("part", 1)
+        redis_utils.bump_model_version("Part")
+        self.assertIsNone(redis_utils.local_cache.get_version("part"))
+        mock_redis.publish.assert_called_with(
+            redis_utils.INVALIDATION_CHANNEL, "version:part"
+        )
+
+    # 📡 Test a write-through is broadcast so other workers drop the key
+    def test_set_cache_broadcast(self, mock_redis, mock_listener):
+        redis_utils.set_cache("part:id:1", {"id": 1}, broadcast=True)
+        mock_redis.publish.assert_called_with(
+            redis_utils.INVALIDATION_CHANNEL, "key:part:id:1"
+        )
+
+    # 🔒 Test a losing SET NX does not populate the L1 cache
+    def test_set_cache_nx_lost_skips_l1(self, mock_redis, mock_listener):
+        mock_redis.set.return_value = None
+        redis_utils.set_cache("k", {"id": 1}, only_if_missing=True)
+        self.assertFalse(redis_utils.local_cache.get("k")[0])
+
+    # 📨 Test a key broadcast from another worker drops that key only
+    def test_handle_key_invalidation(self, mock_redis, mock_listener):
+        redis_utils.local_cache.set("part:id:1", {"id": 1}, 10)
+        redis_utils.local_cache.set("part:id:2", {"id": 2}, 10)
+        redis_utils._handle_invalidation({"data": "key:part:id:1"})
+        self.assertFalse(redis_utils.local_cache.get("part:id:1")[0])
+        self.assertTrue(redis_utils.local_cache.get("part:id:2")[0])
+
+    # 📡 Test a bulk eviction is broadcast as one message per key chunk,
+    # pipelined, and applied by other workers' listeners
+    def test_delete_many_cache_batches_broadcast(self, mock_redis, mock_listener):
+        keys = [f"part:id:{pk}" for pk in range(5)]
+        with patch.object(redis_utils, "INVALIDATION_KEYS_PER_MESSAGE", 2):
+            redis_utils.delete_many_cache(keys)
+        mock_redis.publish.assert_not_called()
+        pipe = mock_redis.pipeline.return_value
+        messages = [call.args[1] for call in pipe.publish.call_args_list]
+        self.assertEqual(len(messages), 3)
+        pipe.execute.assert_called_once()
+
+        for key in keys:
+            redis_utils.local_cache.set(key, {}, 10)
+        for message in messages:
+            redis_utils._handle_invalidation({"data": message.encode()})
+        self.assertFalse(
+            any(redis_utils.local_cache.get(key)[0] for key in keys)
+        )
+
+    # 📨 Test a broadcast from another worker invalidates this one
+    def test_handle_invalidation_message(self, mock_redis, mock_listener):
+        redis_utils.local_cache.set_version("part", 1)
+        redis_utils._handle_invalidation({"data": "version:part"})
+        self.assertIsNone(redis_utils.local_cache.get_version("part"))
+
+    # ⚡ Test a versioned read is served from L1 after the first script call
+    def test_get_versioned_cache_served_from_l1(self, mock_redis, mock_listener):
+        mock_redis.evalsha.return_value = ["2", json.dumps([1, 2])]
+        redis_utils.get_versioned_cache("Part", "all")
+        key, data = redis_utils.get_versioned_cache("Part", "all")
+        self.assertEqual((key, data), ("part:v2:all", [1, 2]))
+        self.assertEqual(mock_redis.evalsha.call_count, 1)
+
+
+# 🧪 Test class for cache value codecs
+class CacheCodecTests(TestCase):
+    def setUp(self):
+        self.data = {"items": [{"id": i, "name": "part"} for i in range(50)]}
+
+    # 📜 Test the default codec writes plain JSON text (legacy format)
+    def test_default_codec_is_plain_json(self):
+        encoded = redis_utils.DEFAULT_CODEC.encode(self.data)
+        self.assertEqual(encoded, json.dumps(self.data))
+        self.assertEqual(redis_utils.decode_value(encoded.encode()), self.data)
+
+    # 🗜️ Test values above the threshold are compressed and round-trip
+    def test_compressed_round_trip(self):
+        codec = redis_utils.CacheCodec("json", "zlib", compress_min_bytes=100)
+        encoded = codec.encode(self.data)
+        self.assertEqual(encoded[:3], b"\x00jz")
+        self.assertLess(len(encoded), len(json.dumps(self.data)))
+        self.assertEqual(redis_utils.decode_value(encoded), self.data)
+
+    # 📏 Test values below the threshold are stored uncompressed
+    def test_small_values_not_compressed(self):
+        codec = redis_utils.CacheCodec("json", "zlib", compress_min_bytes=10 ** 6)
+        self.assertEqual(codec.encode(self.data)[:3], b"\x00j-")
+
+    # ⚡ Test the orjson codec round-trips (falls back to json if missing)
+    def test_orjson_round_trip(self):
+        codec = redis_utils.CacheCodec("orjson")
+        encoded = codec.encode(self.data)
+        self.assertEqual(redis_utils.decode_value(encoded), self.data)
+
+    # 📝 Test rendered bodies are stored verbatim and read back as RawJson
+    def test_raw_json_round_trip(self):
+        body = redis_utils.RawJson(b'[{"id":1}]')
+        for codec in (
+            redis_utils.DEFAULT_CODEC,
+            redis_utils.CacheCodec("json", "zlib", compress_min_bytes=0),
+        ):
+            decoded = redis_utils.decode_value(codec.encode(body))
+            self.assertIsInstance(decoded, redis_utils.RawJson)
+            self.assertEqual(decoded, body)
+        self.assertEqual(redis_utils.DEFAULT_CODEC.encode(body), b"\x00r-" + body)
+
+    # 📦 Test opaque bytes skip codec compression and round-trip as RawBytes
+    def test_raw_bytes_round_trip(self):
+        body = redis_utils.RawBytes(b"\x1f\x8b" + b"x" * 200)
+        codec = redis_utils.CacheCodec("json", "zlib", compress_min_bytes=0)
+        encoded = codec.encode(body)
+        self.assertEqual(encoded[:3], b"\x00b-")
+        decoded = redis_utils.decode_value(encoded)
+        self.assertIsInstance(decoded, redis_utils.RawBytes)
+        self.assertNotIsInstance(decoded, redis_utils.RawJson)
+        self.assertEqual(decoded, body)
+
+    # 🔁 Test legacy text entries still decode
+    def test_decode_legacy_text(self):
+        self.assertEqual(redis_utils.decode_value('{"a": 1}'), {"a": 1})
+        self.assertEqual(redis_utils.decode_value(b'[1, 2]'), [1, 2])
+
+    # 🚫 Test unknown codec names are rejected
+    def test_unknown_codec(self):
+        with self.assertRaises(ValueError):
+            redis_utils.CacheCodec("yaml")
+        with self.assertRaises(ValueError):
+            redis_utils.CacheCodec("json", "brotli")
+
+    # 💾 Test set_cache writes with the given codec
+    @patch.object(redis_utils, "redis_client")
+    def test_set_cache_uses_codec(self, mock_redis):
+        codec = redis_utils.CacheCodec("json", "zlib", compress_min_bytes=0)
+        redis_utils.set_cache("k", self.data, codec=codec)
+        stored = mock_redis.set.call_args[0][1]
+        self.assertEqual(redis_utils.decode_value(stored), self.data)
+
+
+# 🧪 Test class for the pooled client factory
+class RedisClientPoolTests(TestCase):
+    # ⚙️ Test pool settings are read from Django settings
+    def test_pool_kwargs_from_settings(self):
+        with override_settings(REDIS_MAX_CONNECTIONS=7, REDIS_SOCKET_TIMEOUT=0.5):
+            kwargs = redis_utils._pool_kwargs()
+        self.assertEqual(kwargs["max_connections"], 7)
+        self.assertEqual(kwargs["socket_timeout"], 0.5)
+        self.assertIn("health_check_interval", kwargs)
+        self.assertIn("socket_connect_timeout", kwargs)
+
+    # 🔌 Test the sync client uses a bounded blocking pool
+    def test_sync_client_pool(self):
+        pool = redis_utils.RedisClient.get_client().connection_pool
+        self.assertIsInstance(pool, redis_utils.redis.BlockingConnectionPool)
+        stats = redis_utils.get_pool_stats()["sync"]
+        self.assertEqual(stats["max_connections"], pool.max_connections)
+        self.assertEqual(stats["created"], stats["in_use"] + stats["idle"])
+
+    # ⚡ Test the asyncio client is created lazily, once per event loop
+    def test_async_client_per_loop(self):
+        async def get_twice():
+            first = redis_utils.RedisClient.get_async_client()
+            return first, redis_utils.RedisClient.get_async_client()
+
+        first, second = asyncio.run(get_twice())
+        self.assertIs(first, second)
+        other, _ = asyncio.run(get_twice())
+        self.assertIsNot(first, other)
+
+    # ⚡ Test aget_cache decodes values read through the asyncio client
+    @patch.object(redis_utils.RedisClient, "get_async_client")
+    def test_aget_cache(self, mock_factory):
+        mock_factory.return_value.get = AsyncMock(return_value=b'{"id": 1}')
+        self.assertEqual(asyncio.run(redis_utils.aget_cache("k")), {"id": 1})
@@ -0,0 +1,57 @@
+import json
+from decimal import Decimal
+from django.test import SimpleTestCase
+from core.utils.redis import RawJson
+from core.utils.response import (
+    render_json,
+    success_body,
+    success_response,
+    success_json_response,
+    success_chunks,
+    success_stream_response,
+)
+
+
+# 🧪 Test class for the pre-rendered response helpers
+class ResponseUtilsTests(SimpleTestCase):
+    # ⚡ Test rendering returns RawJson and passes RawJson through untouched
+    def test_render_json(self):
+        rendered = render_json({"id": 1, "weight": Decimal("1.5")})
+        self.assertIsInstance(rendered, RawJson)
+        self.assertEqual(json.loads(rendered), {"id": 1, "weight": "1.5"})
+        body = RawJson(b'{"kept":true}')
+        self.assertIs(render_json(body), body)
+
+    # 🧩 Test the spliced envelope matches success_response exactly
+    def test_success_body_matches_envelope(self):
+        data = [{"id": 1, "name": "Bolt \u00e9"}]
+        expected = success_response(data, "Parts retrieved")
+        for payload in (data, render_json(data)):
+            body = success_body(payload, "Parts retrieved")
+            self.assertEqual(json.loads(body), expected)
+
+    # 📤 Test the HTTP response carries the body and status
+    def test_success_json_response(self):
+        response = success_json_response({"a": 1}, "Created", status_code=201)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(json.loads(response.content)["code"], 201)
+
+    # 🚰 Test the streamed envelope matches success_response for any chunking
+    def test_success_chunks_match_envelope(self):
+        rows = [{"id": i, "name": f"Part {i}"} for i in range(5)]
+        for data in (rows, []):
+            expected = success_response(data, "Parts retrieved")
+            for per_chunk in (1, 2, 500):
+                body = b"".join(success_chunks(
+                    iter(data), "Parts retrieved", rows_per_chunk=per_chunk
+                ))
+                self.assertEqual(json.loads(body), expected)
+
+    # 📤 Test the streaming response carries the content type
+    def test_success_stream_response(self):
+        response = success_stream_response(iter([{"id": 1}]), "Parts retrieved")
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/json")
+        body = b"".join(response.streaming_content)
+        self.assertEqual(json.loads(body)["data"], [{"id": 1}])
@@ -0,0 +1,67 @@
+import random
+from collections import Counter
+from unittest import TestCase
+from core.utils.sketch import CountMinSketch
+
+
+# 🧪 Test class for the Redis-backed Count-Min sketch (uses real Redis)
+class CountMinSketchTests(TestCase):
+    # ⚙️ Small sketch so collisions actually happen
+    def setUp(self):
+        self.sketch = CountMinSketch(
+            "test:words", epsilon=0.01, delta=0.01, capacity=50
+        )
+        self.sketch.reset()
+        # 🎲 Zipf-like vocabulary: a few heavy words and a long tail
+        rng = random.Random(7)
+        self.exact = Counter({
+            f"w{rank}": max(1, int(5000 / rank) + rng.randint(0, 3))
+            for rank in range(1, 2001)
+        })
+
+    def tearDown(self):
+        self.sketch.reset()
+
+    # 📏 Test sizing follows epsilon and delta
+    def test_dimensions(self):
+        self.assertEqual(self.sketch.width, 272)
+        self.assertEqual(self.sketch.depth, 5)
+
+    # 📏 Test estimates never undercount and overcount within epsilon * N
+    def test_error_bound(self):
+        words = list(self.exact.items())
+        for start in range(0, len(words), 700):
+            self.sketch.add(dict(words[start:start + 700]))
+        # ➖ Deletions are applied as negative deltas
+        removed = {word: n // 2 for word, n in words[::3]}
+        self.sketch.add({word: -n for word, n in removed.items()})
+        self.exact.subtract(removed)
+
+        total = sum(self.exact.values())
+        self.assertEqual(self.sketch.total(), total)
+        bound = self.sketch.error_bound()
+        self.assertEqual(bound, -(-total // 100))
+
+        estimates = self.sketch.estimate(self.exact)
+        errors = [estimates[word] - n for word, n in self.exact.items()]
+        self.assertGreaterEqual(min(errors), 0)
+        # 🎯 At most a delta fraction of words may exceed the bound
+        outside = sum(1 for error in errors if error > bound)
+        self.assertLessEqual(outside / len(errors), self.sketch.delta)
+
+    # 🏆 Test the heavy hitters match the exact top words within the bound
+    def test_top_matches_exact(self):
+        self.sketch.add(self.exact)
+        bound = self.sketch.error_bound()
+        top = self.sketch.top(10)
+        exact_top = [word for word, _ in self.exact.most_common(10)]
+        self.assertEqual([word for word, _ in top][:5], exact_top[:5])
+        for word, estimate in top:
+            self.assertLessEqual(0, estimate - self.exact[word])
+            self.assertLessEqual(estimate - self.exact[word], bound)
+
+    # 🧹 Test the candidate set stays within capacity
+    def test_capacity(self):
+        self.sketch.add(self.exact)
+        self.assertEqual(len(self.sketch.top(500)), 50)
+        self.assertEqual(self.sketch.top(0), [])
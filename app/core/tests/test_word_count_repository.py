@@ -0,0 +1,92 @@
+from collections import Counter
+from django.test import TestCase
+from core.models import WordCount
+from core.repositories.word_count_repository import WordCountRepository
+from core.utils.text import (
+    count_words,
+    count_words_in_chunks,
+    normalize_search_query,
+    top_words,
+    word_delta,
+)
+
+
+# 🧪 Test class for the word-frequency index repository
+class WordCountRepositoryTests(TestCase):
+    # 🔧 Set up test data
+    def setUp(self):
+        self.repo = WordCountRepository()
+        self.repo.rebuild({"bolt": 3, "nut": 2, "gear": 2})
+
+    # 🏆 Test top words are ordered by count, then alphabetically
+    def test_top(self):
+        self.assertEqual(self.repo.top(2), [("bolt", 3), ("gear", 2)])
+        self.assertEqual(self.repo.top(0), [])
+
+    # ➕ Test deltas increment, create and prune rows
+    def test_apply_delta(self):
+        touched = self.repo.apply_delta({"bolt": 1, "nut": -2, "washer": 4})
+        self.assertEqual(touched, 3)
+        self.assertEqual(
+            self.repo.top(5), [("bolt", 4), ("washer", 4), ("gear", 2)]
+        )
+        self.assertFalse(WordCount.objects.filter(word="nut").exists())
+
+    # 🔁 Test a word pruned to zero comes back on the next increment, and a
+    # batch of words is one upsert plus the prune (inside a savepoint)
+    def test_apply_delta_after_prune(self):
+        self.repo.apply_delta({"nut": -2})
+        self.repo.apply_delta({"nut": 1})
+        self.assertEqual(WordCount.objects.get(word="nut").count, 1)
+        with self.assertNumQueries(4):
+            self.repo.apply_delta({f"w{i}": 1 for i in range(100)})
+        self.assertEqual(WordCount.objects.filter(word__startswith="w").count(), 100)
+
+    # 💤 Test an empty delta issues no writes
+    def test_apply_empty_delta(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(self.repo.apply_delta({"bolt": 0}), 0)
+
+    # 🔄 Test rebuild replaces all rows
+    def test_rebuild(self):
+        self.assertEqual(self.repo.rebuild({"spring": 1}), 1)
+        self.assertEqual(self.repo.top(5), [("spring", 1)])
+
+
+# 🧪 Test class for the shared tokenizer helpers
+class TextUtilsTests(TestCase):
+    # ✂️ Test words are lowercased and punctuation ignored
+    def test_count_words(self):
+        self.assertEqual(
+            count_words("Red bolt, red NUT!"),
+            Counter({"red": 2, "bolt": 1, "nut": 1}),
+        )
+        self.assertEqual(count_words(None), Counter())
+
+    # ➕➖ Test deltas keep negative counts and drop zeros
+    def test_word_delta(self):
+        self.assertEqual(
+            word_delta(["red bolt"], ["red nut"]),
+            Counter({"nut": 1, "bolt": -1}),
+        )
+
+    # 🚰 Test chunked counting equals counting everything at once
+    def test_count_words_in_chunks(self):
+        texts = ["Red bolt", None, "red NUT", "", "bolt"]
+        expected = count_words(" ".join(filter(None, texts)))
+        for chunk_size in (1, 2, 10):
+            self.assertEqual(count_words_in_chunks(texts, chunk_size), expected)
+
+    # 🏆 Test top words break ties alphabetically
+    def test_top_words(self):
+        counts = Counter({"nut": 2, "bolt": 2, "gear": 5, "rivet": 1})
+        self.assertEqual(
+            top_words(counts, 3), [("gear", 5), ("bolt", 2), ("nut", 2)]
+        )
+
+    # 🔎 Test search queries normalize to sorted unique lowercase words
+    def test_normalize_search_query(self):
+        self.assertEqual(
+            normalize_search_query("Steel BOLT, bolt!"), ["bolt", "steel"]
+        )
+        self.assertEqual(normalize_search_query(None), [])
@@ -0,0 +1,63 @@
+# 📏 Shared helpers for the benchmark_* management commands
+import time
+import tracemalloc
+from django.db import transaction
+from core.models import Part
+
+# 📝 ~1 KB description used by the synthetic parts
+SYNTHETIC_DESCRIPTION = ("steel bolt with zinc coating " * 35)[:1000]
+
+
+def measure(func):
+    # 📏 Peak Python heap allocated while func runs, plus wall time
+    # ⏱️ Timed on a separate untraced run; tracing slows allocation down
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak, elapsed
+
+
+def requests_per_second(view, request, seconds):
+    # ⏱️ Calls the view repeatedly for about `seconds`, after one warm-up call
+    view(request).content
+    calls = 0
+    started = time.perf_counter()
+    while time.perf_counter() - started < seconds:
+        view(request).content
+        calls += 1
+    return calls / (time.perf_counter() - started)
+
+
+def synthetic_part(i, description=SYNTHETIC_DESCRIPTION):
+    # 🧪 Deterministic synthetic part (unsaved)
+    return Part(
+        name=f"Benchmark {i}",
+        sku=f"bench-{i}",
+        description=description,
+        weight_ounces=i % 50,
+    )
+
+
+def synthetic_catalog(sizes, make_part=synthetic_part, batch_size=1000):
+    """
+    🧪 Grows a synthetic catalog to each size in turn (smallest first),
+    yielding the size once that many parts exist. Runs in one transaction
+    that is always rolled back, so the database is left exactly as it was.
+    """
+    with transaction.atomic():
+        try:
+            inserted = 0
+            for size in sorted(sizes):
+                Part.objects.bulk_create(
+                    [make_part(i) for i in range(inserted, size)],
+                    batch_size=batch_size,
+                )
+                inserted = max(inserted, size)
+                yield size
+        finally:
+            # 🧹 Leave the database exactly as it was
+            transaction.set_rollback(True)
@@ -0,0 +1,268 @@
+# 🗜️ Pre-compressed response bodies cached next to the versioned entries
+import functools
+import gzip
+import hashlib
+import threading
+import time
+from collections import Counter
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+from .logger import get_logger
+from .redis import (
+    RawBytes,
+    redis_client,
+    set_cache,
+    get_versioned_cache,
+    get_model_version,
+    build_versioned_key,
+    admit_to_bounded_set,
+)
+
+# 📦 Optional encoders
+try:
+    import brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - depends on the environment
+    zstandard = None
+
+logger = get_logger("ResponseCompression")
+
+# 🗜️ Content-Encoding token -> compress(bytes) (None when not installed).
+# Bodies are compressed once per model version, so slower, denser levels
+# than a per-request middleware could afford are fine.
+ENCODERS = {
+    "br": (lambda body: brotli.compress(body, quality=9)) if brotli else None,
+    "zstd": (
+        (lambda body: zstandard.ZstdCompressor(level=12).compress(body))
+        if zstandard else None
+    ),
+    "gzip": lambda body: gzip.compress(body, compresslevel=9, mtime=0),
+}
+
+# 📊 Redis hash holding compression counters for every worker
+METRICS_KEY = "metrics:compression"
+
+# 📊 Cached-body hits are counted in process and flushed to METRICS_KEY
+# every HIT_FLUSH_EVERY hits or HIT_FLUSH_SECONDS, whichever comes first,
+# so the hit path itself makes no extra Redis round trip
+HIT_FLUSH_EVERY = 100
+HIT_FLUSH_SECONDS = 10
+_hits_lock = threading.Lock()
+_pending_hits = Counter()
+_last_hit_flush = time.monotonic()
+
+
+@functools.lru_cache(maxsize=None)
+def _installed_encodings(configured):
+    # ⚙️ Resolved once per configuration, so a missing encoder is logged
+    # once per process rather than on every request
+    encodings = []
+    for name in configured:
+        if ENCODERS.get(name) is None:
+            logger.warning(
+                "⚠️ Response encoding unavailable, skipping",
+                extra={"encoding": name},
+            )
+            continue
+        encodings.append(name)
+    return tuple(encodings)
+
+
+def enabled_encodings():
+    # ⚙️ Configured encodings that are installed, in preference order
+    return _installed_encodings(tuple(settings.RESPONSE_COMPRESSION_ENCODINGS))
+
+
+def choose_encoding(accept_encoding, offered):
+    """
+    🤝 Picks the encoding to serve from an Accept-Encoding header: the
+    highest q-value wins, ties go to the earlier entry in `offered`.
+    Returns None when the client accepts none of them.
+    """
+    weights = {}
+    for item in (accept_encoding or "").split(","):
+        name, _, params = item.strip().partition(";")
+        if not name:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[name.strip().lower()] = q
+    best, best_q = None, 0.0
+    for name in offered:
+        q = weights.get(name, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = name, q
+    return best
+
+
+def _take_pending_hits():
+    # 📤 Hands over this worker's unflushed hit counts and resets them
+    global _last_hit_flush
+    with _hits_lock:
+        pending = dict(_pending_hits)
+        _pending_hits.clear()
+        _last_hit_flush = time.monotonic()
+    return pending
+
+
+def _queue_hits(pipe, pending):
+    for encoding, count in pending.items():
+        pipe.hincrby(METRICS_KEY, f"{encoding}:served_cached", count)
+
+
+def flush_hits():
+    # 🚿 Writes this worker's pending hit counts (one pipeline)
+    pending = _take_pending_hits()
+    if pending:
+        pipe = redis_client.pipeline(transaction=False)
+        _queue_hits(pipe, pending)
+        pipe.execute()
+
+
+def record_compression(encoding, bytes_in, bytes_out, seconds):
+    # 📊 Counts one compression (ratio and time are derived when read);
+    # pending hits ride along in the same pipeline
+    pipe = redis_client.pipeline(transaction=False)
+    pipe.hincrby(METRICS_KEY, f"{encoding}:compressed", 1)
+    pipe.hincrby(METRICS_KEY, f"{encoding}:bytes_in", bytes_in)
+    pipe.hincrby(METRICS_KEY, f"{encoding}:bytes_out", bytes_out)
+    pipe.hincrbyfloat(METRICS_KEY, f"{encoding}:seconds", seconds)
+    _queue_hits(pipe, _take_pending_hits())
+    pipe.execute()
+
+
+def record_hit(encoding):
+    # 📊 Counts one response served from a stored encoding, in process
+    with _hits_lock:
+        _pending_hits[encoding] += 1
+        due = (
+            sum(_pending_hits.values()) >= HIT_FLUSH_EVERY
+            or time.monotonic() - _last_hit_flush >= HIT_FLUSH_SECONDS
+        )
+    if due:
+        flush_hits()
+
+
+def get_compression_stats():
+    # 📈 Per-encoding counters with compression ratio and mean time
+    # (other workers' hits appear once they flush)
+    flush_hits()
+    raw = {
+        (key.decode() if isinstance(key, bytes) else key): float(value)
+        for key, value in redis_client.hgetall(METRICS_KEY).items()
+    }
+    stats = {}
+    for field, value in raw.items():
+        encoding, _, name = field.partition(":")
+        stats.setdefault(encoding, {})[name] = value
+    for encoding, counters in stats.items():
+        compressed = counters.get("compressed", 0)
+        bytes_in = counters.get("bytes_in", 0)
+        stats[encoding] = {
+            "compressed": int(compressed),
+            "served_cached": int(counters.get("served_cached", 0)),
+            "bytes_in": int(bytes_in),
+            "bytes_out": int(counters.get("bytes_out", 0)),
+            "ratio": (
+                round(counters.get("bytes_out", 0) / bytes_in, 4)
+                if bytes_in else None
+            ),
+            "avg_ms": (
+                round(counters.get("seconds", 0) * 1000 / compressed, 3)
+                if compressed else None
+            ),
+        }
+    return stats
+
+
+def _encoded_response(body, encoding, content_type):
+    # 📤 Response for a stored encoding (no compression work)
+    response = HttpResponse(body, content_type=content_type)
+    response["Content-Encoding"] = encoding
+    patch_vary_headers(response, ("Accept-Encoding",))
+    return response
+
+
+def precompressed(model_name: str, ttl: int = 60,
+                  content_type="application/json"):
+    """
+    🗜️ Decorates an APIView GET handler so large 200 bodies are stored
+    compressed under the model's versioned keys, one entry per encoding
+    and full path. Later requests accepting that encoding are served the
+    stored bytes; a write (version bump) retires them all at once.
+
+    The version is read before the handler runs, so a stored body is never
+    older than the version it is filed under. Only
+    RESPONSE_COMPRESSION_MAX_VARIANTS bodies are stored per version;
+    beyond that, responses are served uncompressed.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, request, *args, **kwargs):
+            encoding = choose_encoding(
+                request.META.get("HTTP_ACCEPT_ENCODING"), enabled_encodings()
+            )
+            if encoding is None:
+                response = method(self, request, *args, **kwargs)
+                patch_vary_headers(response, ("Accept-Encoding",))
+                return response
+
+            # 📖 One round trip: current version + stored body, if any
+            digest = hashlib.sha1(
+                request.get_full_path().encode()
+            ).hexdigest()[:16]
+            key, cached = get_versioned_cache(
+                model_name, f"body:{encoding}:{digest}"
+            )
+            if cached is not None:
+                record_hit(encoding)
+                return _encoded_response(cached, encoding, content_type)
+
+            response = method(self, request, *args, **kwargs)
+            if (
+                response.status_code != 200
+                or response.streaming
+                or response.has_header("Content-Encoding")
+                or len(response.content)
+                < settings.RESPONSE_COMPRESSION_MIN_BYTES
+            ):
+                patch_vary_headers(response, ("Accept-Encoding",))
+                return response
+
+            # 🎟️ Past the variant budget, serve the identity body: compressing
+            # per request is exactly the work stored bodies avoid
+            variants_key = build_versioned_key(
+                model_name, get_model_version(model_name), "body_variants"
+            )
+            if not admit_to_bounded_set(
+                variants_key,
+                f"{encoding}:{digest}",
+                settings.RESPONSE_COMPRESSION_MAX_VARIANTS,
+                ttl,
+            ):
+                patch_vary_headers(response, ("Accept-Encoding",))
+                return response
+
+            # 🗜️ Compress once, then keep it for the rest of this version
+            started = time.perf_counter()
+            body = ENCODERS[encoding](response.content)
+            record_compression(
+                encoding,
+                len(response.content),
+                len(body),
+                time.perf_counter() - started,
+            )
+            set_cache(key, RawBytes(body), ttl=ttl)
+            return _encoded_response(body, encoding, content_type)
+        return wrapper
+    return decorator
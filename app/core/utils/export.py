@@ -0,0 +1,51 @@
+# 📤 Chunked NDJSON / CSV encoders for streaming exports
+import csv
+import io
+from .response import render_json
+
+# 📄 Export format -> Content-Type
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+# 📦 Rows joined into each chunk written to the client
+EXPORT_ROWS_PER_CHUNK = 500
+
+
+def ndjson_chunks(rows, rows_per_chunk=EXPORT_ROWS_PER_CHUNK):
+    # 📝 One JSON object per line, rows_per_chunk lines per yielded chunk
+    lines = []
+    for row in rows:
+        lines.append(render_json(row))
+        if len(lines) >= rows_per_chunk:
+            yield b"\n".join(lines) + b"\n"
+            lines = []
+    if lines:
+        yield b"\n".join(lines) + b"\n"
+
+
+def csv_chunks(rows, fields, rows_per_chunk=EXPORT_ROWS_PER_CHUNK):
+    # 🧾 Header line, then rows_per_chunk CSV rows per yielded chunk
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    pending = 0
+    for row in rows:
+        writer.writerow([row[name] for name in fields])
+        pending += 1
+        if pending >= rows_per_chunk:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def export_chunks(export_format, fields, rows,
+                  rows_per_chunk=EXPORT_ROWS_PER_CHUNK):
+    # 🔀 Encoded chunks for one of EXPORT_FORMATS
+    if export_format == "csv":
+        return csv_chunks(rows, fields, rows_per_chunk)
+    return ndjson_chunks(rows, rows_per_chunk)
@@ -0,0 +1,55 @@
+# 📄 Keyset (cursor) pagination helpers
+import base64
+import json
+
+# 🔢 Page size limits for paginated list endpoints
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+def encode_cursor(*values):
+    # 🔐 Encodes the sort key of the last row into an opaque URL-safe token
+    raw = json.dumps(list(values), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token: str):
+    # 🔓 Decodes a token produced by encode_cursor back into its values
+    # ⚠️ Raises ValueError for malformed or tampered tokens
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if not isinstance(values, list) or not values:
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def parse_limit(raw, default=DEFAULT_PAGE_SIZE, maximum=MAX_PAGE_SIZE):
+    # 📏 Parses the ?limit= query parameter and clamps it to [1, maximum]
+    # ⚠️ Raises ValueError for non-integer input
+    if raw in (None, ""):
+        return default
+    limit = int(raw)
+    if limit < 1:
+        raise ValueError("limit must be a positive integer")
+    return min(limit, maximum)
+
+
+def parse_fields(raw):
+    # 🏷️ Parses the ?fields= query parameter into a list of field names
+    # 📝 None (no narrowing) when the parameter is missing or blank
+    if not raw:
+        return None
+    names = [name.strip() for name in raw.split(",") if name.strip()]
+    return names or None
+
+
+def parse_ids(raw, maximum=MAX_PAGE_SIZE):
+    # 🔢 Parses the ?ids= query parameter (comma-separated positive IDs)
+    # ⚠️ Raises ValueError for empty, non-integer or oversized lists
+    ids = [int(part) for part in (raw or "").split(",") if part.strip()]
+    if not ids or len(ids) > maximum or min(ids) < 1:
+        raise ValueError(f"ids must list between 1 and {maximum} positive IDs")
+    return ids
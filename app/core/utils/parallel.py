@@ -0,0 +1,55 @@
+# ⚙️ Shared process pool for CPU-bound work kept off the request thread
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# 🏊 One pool per process, created on first use and reused afterwards
+_pool = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def _init_worker():
+    # 🚀 Spawned workers import Django afresh and open their own DB connections
+    import django
+
+    django.setup()
+
+
+def get_process_pool(workers: int):
+    # 🏊 Returns the shared pool, recreating it when the size changes
+    # 🧬 "spawn" so workers never inherit the parent's sockets or DB handles
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            _pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+            _pool_workers = workers
+        return _pool
+
+
+def reset_process_pool():
+    # 🧹 Drops the shared pool (after a worker crash, or on shutdown)
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False)
+        _pool, _pool_workers = None, 0
+
+
+def run_in_process_pool(func, args_list, workers: int):
+    # 🗺️ Runs func(*args) for every args tuple in the pool, keeping order
+    # ⚠️ func must be importable at module level so spawned workers find it
+    pool = get_process_pool(workers)
+    try:
+        futures = [pool.submit(func, *args) for args in args_list]
+        return [future.result() for future in futures]
+    except BrokenProcessPool:
+        reset_process_pool()
+        raise
@@ -1,51 +1,656 @@
 # 🔌 --- Imports --- 🔌
+import asyncio
 import redis
 import json
+import hashlib
+import threading
+import time
+import uuid
+import weakref
+import zlib
+from collections import OrderedDict
 from django.conf import settings
+from .logger import get_logger
+
+# 📦 Optional faster serializers / compressors
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - depends on the environment
+    msgpack = None
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # pragma: no cover - depends on the environment
+    lz4_frame = None
+
+logger = get_logger("RedisCache")
 
 
 # 🔄 --- Redis Client Singleton --- 🔄
+def _pool_kwargs():
+    # ⚙️ Connection pool settings shared by the sync and asyncio clients
+    return {
+        "max_connections": getattr(settings, "REDIS_MAX_CONNECTIONS", 50),
+        "timeout": getattr(settings, "REDIS_POOL_TIMEOUT", 2.0),
+        "socket_timeout": getattr(settings, "REDIS_SOCKET_TIMEOUT", 2.0),
+        "socket_connect_timeout": getattr(
+            settings, "REDIS_SOCKET_CONNECT_TIMEOUT", 1.0
+        ),
+        "health_check_interval": getattr(
+            settings, "REDIS_HEALTH_CHECK_INTERVAL", 30
+        ),
+        "socket_keepalive": getattr(settings, "REDIS_SOCKET_KEEPALIVE", True),
+    }
+
+
+def _pool_stats(pool):
+    # 📈 Connection counts for a sync or asyncio blocking pool
+    if hasattr(pool, "_connections") and hasattr(pool, "pool"):
+        created = len(pool._connections)
+        idle = sum(1 for conn in list(pool.pool.queue) if conn is not None)
+    else:
+        idle = len(getattr(pool, "_available_connections", []))
+        created = idle + len(getattr(pool, "_in_use_connections", []))
+    return {
+        "max_connections": pool.max_connections,
+        "created": created,
+        "in_use": created - idle,
+        "idle": idle,
+    }
+
+
 class RedisClient:
     # Singleton instance
     _client = None
+    # 🔁 asyncio clients, one per event loop (asyncio pools are loop-bound)
+    _async_clients = weakref.WeakKeyDictionary()
 
     @classmethod
     def get_client(cls):
         # Returns singleton Redis client instance
-        # Creates new connection if none exists
-        # Uses settings.REDIS_URL for connection
+        # Creates new connection pool if none exists
+        # Uses settings.REDIS_URL and REDIS_* pool/timeout settings
+        # ⏳ A full pool waits REDIS_POOL_TIMEOUT seconds, then raises
+        # Responses stay as bytes so binary codecs round-trip intact
         if cls._client is None:
-            cls._client = redis.Redis.from_url(
-                settings.REDIS_URL, decode_responses=True
+            pool = redis.BlockingConnectionPool.from_url(
+                settings.REDIS_URL, **_pool_kwargs()
             )
+            cls._client = redis.Redis(connection_pool=pool)
         return cls._client
 
+    @classmethod
+    def get_async_client(cls):
+        # ⚡ Returns the redis.asyncio client for the running event loop
+        # 💤 Created lazily on first use, never at import time
+        loop = asyncio.get_running_loop()
+        client = cls._async_clients.get(loop)
+        if client is None:
+            import redis.asyncio as redis_asyncio
+
+            pool = redis_asyncio.BlockingConnectionPool.from_url(
+                settings.REDIS_URL, **_pool_kwargs()
+            )
+            client = redis_asyncio.Redis(connection_pool=pool)
+            cls._async_clients[loop] = client
+        return client
+
+    @classmethod
+    def pool_stats(cls):
+        # 📈 Usage of the sync pool and of every asyncio pool created so far
+        stats = {"sync": _pool_stats(cls.get_client().connection_pool)}
+        stats["async"] = [
+            _pool_stats(client.connection_pool)
+            for client in list(cls._async_clients.values())
+        ]
+        return stats
+
 
 # 🌐 --- Global Instance --- 🌐
 # Global Redis client instance for reuse
 redis_client = RedisClient.get_client()
 
 
+def get_pool_stats():
+    # 📈 Returns Redis connection pool usage for this worker
+    return RedisClient.pool_stats()
+
+
+# 🗜️ --- Cache Value Codecs --- 🗜️
+# Values written with the default codec (stdlib JSON, uncompressed) are plain
+# JSON text, exactly like entries written before codecs existed. Any other
+# codec or compression prefixes the payload with a 3-byte header:
+#   MARKER + serializer id + compression id
+# JSON text can never start with a NUL byte, so both formats coexist.
+CODEC_MARKER = b"\x00"
+
+
+class RawBytes(bytes):
+    """
+    📦 Opaque bytes (e.g. a pre-compressed response body). The codec stores
+    them verbatim (header id "b") and reads them back as RawBytes.
+    """
+
+
+class RawJson(RawBytes):
+    """
+    📝 Already-rendered JSON bytes. The codec stores them verbatim (header
+    id "r") and reads them back as RawJson, so responses can splice a
+    cached body without decoding and re-encoding it.
+    """
+
+
+SERIALIZERS = {
+    # id: (dumps -> bytes, loads(bytes))
+    b"j": (lambda data: json.dumps(data).encode(), json.loads),
+    b"o": (
+        orjson.dumps if orjson else None,
+        orjson.loads if orjson else None,
+    ),
+    b"m": (
+        msgpack.packb if msgpack else None,
+        msgpack.unpackb if msgpack else None,
+    ),
+    b"r": (bytes, RawJson),
+    b"b": (bytes, RawBytes),
+}
+SERIALIZER_IDS = {"json": b"j", "orjson": b"o", "msgpack": b"m"}
+
+COMPRESSORS = {
+    # id: (compress, decompress)
+    b"-": (None, None),
+    b"z": (zlib.compress, zlib.decompress),
+    b"4": (
+        lz4_frame.compress if lz4_frame else None,
+        lz4_frame.decompress if lz4_frame else None,
+    ),
+}
+COMPRESSOR_IDS = {None: b"-", "zlib": b"z", "lz4": b"4"}
+
+
+class CacheCodec:
+    """
+    🗜️ Serializer + optional compression used when writing cache values.
+    Decoding never needs the codec: the header written with the value says
+    how to read it back. Unavailable optional libraries fall back to stdlib
+    JSON / zlib with a warning.
+    """
+
+    def __init__(self, serializer="json", compression=None,
+                 compress_min_bytes=4096):
+        if serializer not in SERIALIZER_IDS:
+            raise ValueError(f"Unknown cache serializer: {serializer}")
+        if compression not in COMPRESSOR_IDS:
+            raise ValueError(f"Unknown cache compression: {compression}")
+        if SERIALIZERS[SERIALIZER_IDS[serializer]][0] is None:
+            logger.warning(
+                "⚠️ Cache serializer unavailable, using json",
+                extra={"serializer": serializer},
+            )
+            serializer = "json"
+        if compression and COMPRESSORS[COMPRESSOR_IDS[compression]][0] is None:
+            logger.warning(
+                "⚠️ Cache compression unavailable, using zlib",
+                extra={"compression": compression},
+            )
+            compression = "zlib"
+        self.serializer = serializer
+        self.compression = compression
+        self.compress_min_bytes = compress_min_bytes
+        self._serializer_id = SERIALIZER_IDS[serializer]
+        self._dumps = SERIALIZERS[self._serializer_id][0]
+        self._compressor_id = COMPRESSOR_IDS[compression]
+        self._compress = COMPRESSORS[self._compressor_id][0]
+
+    def encode(self, data):
+        # 📦 Serializes (and maybe compresses) a value for Redis
+        # 📝 RawJson / RawBytes are kept verbatim whatever the serializer
+        if isinstance(data, RawBytes):
+            serializer_id = b"r" if isinstance(data, RawJson) else b"b"
+            payload = bytes(data)
+        elif self.serializer == "json" and self.compression is None:
+            return json.dumps(data)
+        else:
+            serializer_id, payload = self._serializer_id, self._dumps(data)
+        compressor_id = b"-"
+        # 🗜️ Opaque bytes are usually compressed already; not worth retrying
+        if (
+            self._compress
+            and serializer_id != b"b"
+            and len(payload) >= self.compress_min_bytes
+        ):
+            payload = self._compress(payload)
+            compressor_id = self._compressor_id
+        return CODEC_MARKER + serializer_id + compressor_id + payload
+
+
+# 🌐 Codec used when callers don't choose one (plain JSON, uncompressed)
+DEFAULT_CODEC = CacheCodec()
+
+
+def decode_value(raw):
+    # 📖 Decodes a stored value written by any codec (or legacy plain JSON)
+    if isinstance(raw, str):
+        return json.loads(raw)
+    if raw[:1] != CODEC_MARKER:
+        return json.loads(raw)
+    serializer_id, compressor_id = raw[1:2], raw[2:3]
+    payload = raw[3:]
+    decompress = COMPRESSORS[compressor_id][1]
+    if decompress:
+        payload = decompress(payload)
+    loads = SERIALIZERS[serializer_id][1]
+    if loads is None:
+        raise ValueError(f"Cache serializer {serializer_id!r} unavailable")
+    return loads(payload)
+
+
+# 📜 --- Server-Side Lua Scripts --- 📜
+class LuaScript:
+    # 📜 Runs a Lua script by SHA, loading it on first use (NOSCRIPT)
+    def __init__(self, source: str):
+        self.source = source
+        self.sha = hashlib.sha1(source.encode()).hexdigest()
+
+    def __call__(self, keys=(), args=()):
+        try:
+            return redis_client.evalsha(self.sha, len(keys), *keys, *args)
+        except redis.exceptions.NoScriptError:
+            return redis_client.eval(self.source, len(keys), *keys, *args)
+
+
+# 🔑 Resolves (and initialises) the model version and reads the data key
+# built from it in one atomic round trip. The data key is derived inside
+# the script, which is fine on a single Redis node but not on a cluster.
+VERSIONED_GET_SCRIPT = LuaScript("""
+local version = redis.call('GET', KEYS[1])
+if not version then
+    redis.call('SET', KEYS[1], 1)
+    version = '1'
+end
+local data = redis.call('GET', ARGV[1] .. ':v' .. version .. ':' .. ARGV[2])
+return {version, data}
+""")
+
+
+# 🔓 Deletes a lock only if it is still held by the caller's token
+RELEASE_LOCK_SCRIPT = LuaScript("""
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+""")
+
+
+# 🎟️ Admits a member to a set capped at ARGV[2] members (1 = admitted);
+# the set expires ARGV[3] seconds after it is created
+ADMIT_TO_BOUNDED_SET_SCRIPT = LuaScript("""
+if redis.call('SISMEMBER', KEYS[1], ARGV[1]) == 1 then
+    return 1
+end
+if redis.call('SCARD', KEYS[1]) >= tonumber(ARGV[2]) then
+    return 0
+end
+redis.call('SADD', KEYS[1], ARGV[1])
+if redis.call('TTL', KEYS[1]) < 0 then
+    redis.call('EXPIRE', KEYS[1], ARGV[3])
+end
+return 1
+""")
+
+
+# 🧠 --- In-Process L1 Cache --- 🧠
+class LocalCache:
+    """
+    🧠 Per-worker LRU + TTL cache that sits in front of Redis.
+    Bounded both by entry count and by the size of the serialized payloads.
+    Also remembers model versions so hot reads need no network round trip.
+    ⚠️ Cached values are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, enabled=False, max_entries=1024,
+                 max_bytes=32 * 1024 * 1024, ttl=30, version_ttl=5):
+        self.enabled = enabled
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.version_ttl = version_ttl
+        self._entries = OrderedDict()  # key -> (expires_at, size, value)
+        self._versions = {}  # model_name -> (expires_at, version)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str):
+        # 🔍 Returns (found, value); expired entries count as misses
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[2]
+
+    def set(self, key: str, value, size: int, ttl: int = None):
+        # 💾 Stores a value, evicting least recently used entries when full
+        if size > self.max_bytes:
+            return
+        ttl = min(ttl or self.ttl, self.ttl)
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (time.monotonic() + ttl, size, value)
+            self._bytes += size
+            while (len(self._entries) > self.max_entries
+                   or self._bytes > self.max_bytes):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def delete(self, key: str):
+        # 🗑️ Drops a single entry
+        with self._lock:
+            self._remove(key)
+
+    def invalidate_model(self, model_name: str):
+        # 🏷️ Forgets the model version and every versioned entry for it
+        prefix = f"{model_name}:v"
+        with self._lock:
+            self._versions.pop(model_name, None)
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                self._remove(key)
+
+    def get_version(self, model_name: str):
+        # 📊 Returns the remembered version, or None when unknown/expired
+        with self._lock:
+            entry = self._versions.get(model_name)
+            if entry is None or entry[0] < time.monotonic():
+                return None
+            return entry[1]
+
+    def set_version(self, model_name: str, version: int):
+        # 🏷️ Remembers the model version for version_ttl seconds
+        with self._lock:
+            self._versions[model_name] = (
+                time.monotonic() + self.version_ttl, version
+            )
+
+    def clear(self):
+        # 🧹 Drops every entry and version
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+            self._bytes = 0
+
+    def stats(self):
+        # 📈 Returns hit/miss counters and current usage
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def _remove(self, key: str):
+        # ➖ Removes an entry and its size; caller must hold the lock
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+
+
+# 🌐 Global per-worker L1 cache, disabled unless CACHE_L1_ENABLED is set
+local_cache = LocalCache(
+    enabled=getattr(settings, "CACHE_L1_ENABLED", False),
+    max_entries=getattr(settings, "CACHE_L1_MAX_ENTRIES", 1024),
+    max_bytes=getattr(settings, "CACHE_L1_MAX_BYTES", 32 * 1024 * 1024),
+    ttl=getattr(settings, "CACHE_L1_TTL", 30),
+    version_ttl=getattr(settings, "CACHE_L1_VERSION_TTL", 5),
+)
+
+
+# 📡 --- Cross-Worker Invalidation (Redis Pub/Sub) --- 📡
+INVALIDATION_CHANNEL = "cache:invalidate"
+_listener_lock = threading.Lock()
+_listener_thread = None
+
+
+def _handle_invalidation(message):
+    # 📨 Applies an invalidation broadcast by any worker
+    data = message.get("data")
+    if isinstance(data, bytes):
+        data = data.decode()
+    if data and data.startswith("version:"):
+        local_cache.invalidate_model(data[len("version:"):])
+    elif data and data.startswith("key:"):
+        local_cache.delete(data[len("key:"):])
+    elif data and data.startswith("keys:"):
+        for key in json.loads(data[len("keys:"):]):
+            local_cache.delete(key)
+
+
+def _broadcast_key_invalidation(key: str):
+    # 📡 Tells every worker to drop its L1 copy of a key
+    if local_cache.enabled:
+        redis_client.publish(INVALIDATION_CHANNEL, f"key:{key}")
+
+
+# 📦 Keys carried by one "keys:" invalidation message
+INVALIDATION_KEYS_PER_MESSAGE = 1000
+
+
+def _broadcast_keys_invalidation(keys):
+    # 📡 Tells every worker to drop its L1 copies of many keys: one message
+    # per INVALIDATION_KEYS_PER_MESSAGE keys, all in one pipelined round trip
+    if not local_cache.enabled or not keys:
+        return
+    pipe = redis_client.pipeline(transaction=False)
+    for start in range(0, len(keys), INVALIDATION_KEYS_PER_MESSAGE):
+        chunk = keys[start:start + INVALIDATION_KEYS_PER_MESSAGE]
+        pipe.publish(INVALIDATION_CHANNEL, "keys:" + json.dumps(chunk))
+    pipe.execute()
+
+
+def _ensure_invalidation_listener():
+    # 🎧 Lazily subscribes this worker to invalidation broadcasts
+    # ⚠️ On failure the L1 still works, bounded by its version TTL
+    global _listener_thread
+    if _listener_thread is not None:
+        return
+    with _listener_lock:
+        if _listener_thread is not None:
+            return
+        try:
+            pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(**{INVALIDATION_CHANNEL: _handle_invalidation})
+            _listener_thread = pubsub.run_in_thread(
+                sleep_time=1, daemon=True
+            )
+        except redis.RedisError:
+            _listener_thread = None
+
+
+def get_local_cache_stats():
+    # 📈 Returns the L1 hit/miss counters for this worker
+    return local_cache.stats()
+
+
 # 📦 --- Caching Utilities --- 📦
 def get_cache(key: str):
     # 🔍 Retrieves cached value for given key
     # ⚠️ Returns None if key doesn't exist
+    # 🧠 Served from the L1 cache when enabled and fresh
     # 🔄 Automatically deserializes JSON data
+    if local_cache.enabled:
+        found, value = local_cache.get(key)
+        if found:
+            return value
     value = redis_client.get(key)
-    return json.loads(value) if value else None
+    if not value:
+        return None
+    data = decode_value(value)
+    if local_cache.enabled:
+        local_cache.set(key, data, len(value))
+    return data
 
 
-def set_cache(key: str, data, ttl: int = 60):
+def set_cache(key: str, data, ttl: int = 60, only_if_missing=False,
+              broadcast=False, codec=None):
     # 💾 Stores data in cache with given key and TTL
     # ⏱️ Default TTL is 60 seconds
-    # 🔄 Automatically serializes data to JSON
-    redis_client.set(key, json.dumps(data), ex=ttl)
+    # 🗜️ Serialized with codec (plain JSON by default)
+    # 🔒 only_if_missing (SET NX) keeps a read-populate from overwriting a
+    #    fresher write-through value
+    # 📡 broadcast drops other workers' L1 copies of an overwritten key
+    payload = (codec or DEFAULT_CODEC).encode(data)
+    if only_if_missing:
+        if not redis_client.set(key, payload, ex=ttl, nx=True):
+            return
+    else:
+        redis_client.set(key, payload, ex=ttl)
+    if local_cache.enabled:
+        local_cache.set(key, data, len(payload), ttl)
+    if broadcast:
+        _broadcast_key_invalidation(key)
+
+
+def get_many_cache(keys):
+    # 🔍 Retrieves many keys at once: L1 first, then one MGET for the rest
+    # 📝 Returns {key: value}, with None for keys that are not cached
+    keys = list(keys)
+    found = {}
+    remote = []
+    for key in keys:
+        if local_cache.enabled:
+            hit, value = local_cache.get(key)
+            if hit:
+                found[key] = value
+                continue
+        remote.append(key)
+    if remote:
+        for key, raw in zip(remote, redis_client.mget(remote)):
+            if not raw:
+                found[key] = None
+                continue
+            found[key] = decode_value(raw)
+            if local_cache.enabled:
+                local_cache.set(key, found[key], len(raw))
+    return found
+
+
+def set_many_cache(items: dict, ttl: int = 60, only_if_missing=False,
+                   codec=None, broadcast=False):
+    # 💾 Stores many keys with one pipelined round trip (no MULTI/EXEC)
+    # 🔒 only_if_missing (SET NX) as in set_cache
+    # 📡 broadcast drops other workers' L1 copies (batched key lists)
+    if not items:
+        return
+    codec = codec or DEFAULT_CODEC
+    payloads = {key: codec.encode(data) for key, data in items.items()}
+    pipe = redis_client.pipeline(transaction=False)
+    for key, payload in payloads.items():
+        pipe.set(key, payload, ex=ttl, nx=only_if_missing)
+    stored = pipe.execute()
+    if local_cache.enabled:
+        for (key, payload), ok in zip(payloads.items(), stored):
+            if ok:
+                local_cache.set(key, items[key], len(payload), ttl)
+        if broadcast:
+            _broadcast_keys_invalidation(list(payloads))
 
 
 def delete_cache(key: str):
     # 🗑️ Removes key from cache
     # ⚡ Operation is idempotent
+    # 📡 Other workers drop their L1 copy as well
     redis_client.delete(key)
+    if local_cache.enabled:
+        local_cache.delete(key)
+        _broadcast_key_invalidation(key)
+
+
+def delete_many_cache(keys):
+    # 🗑️ Removes many keys with one DEL per 1000 keys
+    # 📡 Other workers drop their L1 copies as well
+    keys = list(keys)
+    for start in range(0, len(keys), 1000):
+        redis_client.delete(*keys[start:start + 1000])
+    if local_cache.enabled:
+        for key in keys:
+            local_cache.delete(key)
+        _broadcast_keys_invalidation(keys)
+
+
+async def aget_cache(key: str):
+    # ⚡ asyncio variant of get_cache for async views (Redis only, no L1)
+    value = await RedisClient.get_async_client().get(key)
+    return decode_value(value) if value else None
+
+
+async def aset_cache(key: str, data, ttl: int = 60, codec=None):
+    # ⚡ asyncio variant of set_cache for async views (Redis only, no L1)
+    payload = (codec or DEFAULT_CODEC).encode(data)
+    await RedisClient.get_async_client().set(key, payload, ex=ttl)
+
+
+def get_versioned_cache(model_name: str, suffix: str):
+    # 🔍 Resolves the current model version and reads the versioned key
+    # ⚡ One Redis round trip (Lua script) instead of GET version + GET data
+    # 🧠 Zero round trips when both version and value are in the L1 cache
+    # 🔑 Returns (key, data); data is None on a miss
+    model_name = model_name.lower()
+    if local_cache.enabled:
+        _ensure_invalidation_listener()
+        version = local_cache.get_version(model_name)
+        if version is not None:
+            key = build_versioned_key(model_name, version, suffix)
+            found, data = local_cache.get(key)
+            if found:
+                return key, data
+
+    version, value = VERSIONED_GET_SCRIPT(
+        keys=[get_version_key(model_name)], args=[model_name, suffix]
+    )
+    version = int(version)
+    key = build_versioned_key(model_name, version, suffix)
+    data = decode_value(value) if value else None
+    if local_cache.enabled:
+        local_cache.set_version(model_name, version)
+        if data is not None:
+            local_cache.set(key, data, len(value))
+    return key, data
+
+
+# 🔒 --- Short-Lived Locks for Single-Flight Cache Fills --- 🔒
+def acquire_lock(key: str, ttl_ms: int = 5000):
+    # 🔒 Tries to take lock:{key} for ttl_ms milliseconds (SET NX PX)
+    # 🎫 Returns an ownership token, or None if another worker holds it
+    token = uuid.uuid4().hex
+    if redis_client.set(f"lock:{key}", token, nx=True, px=ttl_ms):
+        return token
+    return None
+
+
+def release_lock(key: str, token: str):
+    # 🔓 Releases lock:{key} only if it still belongs to token
+    RELEASE_LOCK_SCRIPT(keys=[f"lock:{key}"], args=[token])
+
+
+def admit_to_bounded_set(key: str, member: str, max_size: int, ttl: int):
+    # 🎟️ Adds member to the set at key unless it already holds max_size
+    # ✅ Returns True if member is (now) in the set
+    return bool(
+        ADMIT_TO_BOUNDED_SET_SCRIPT(keys=[key], args=[member, max_size, ttl])
+    )
 
 
 # 🏷️ --- Versioning for Tag-Based Invalidation --- 🏷️
@@ -55,19 +660,42 @@ def get_version_key(model_name: str):
     return f"version:{model_name.lower()}"
 
 
+def build_versioned_key(model_name: str, version: int, suffix: str):
+    # 🔑 Builds a data key scoped to a model version
+    # 📝 Format: {model_name}:v{version}:{suffix}
+    return f"{model_name}:v{version}:{suffix}"
+
+
 def get_model_version(model_name: str):
     # 📊 Gets current version number for model
     # 🆕 Initializes to 1 if not found
+    # 🧠 Remembered in the L1 cache until invalidated or expired
     # 🔢 Returns integer version number
+    if local_cache.enabled:
+        _ensure_invalidation_listener()
+        version = local_cache.get_version(model_name.lower())
+        if version is not None:
+            return version
     key = get_version_key(model_name)
     version = redis_client.get(key)
     if not version:
-        redis_client.set(key, 1)
-        return 1
-    return int(version)
+        # 🔒 SET NX so a concurrent initialiser cannot reset a bumped version
+        redis_client.set(key, 1, nx=True)
+        version = redis_client.get(key) or 1
+    version = int(version)
+    if local_cache.enabled:
+        local_cache.set_version(model_name.lower(), version)
+    return version
 
 
 def bump_model_version(model_name: str):
     # ⬆️ Increments version number for model
+    # 📋 Orphans every versioned (list/page) key; per-entity keys survive
     # 🔄 Atomic operation using Redis INCR
+    # 📡 Broadcasts the bump so every worker drops its L1 entries
     redis_client.incr(get_version_key(model_name))
+    if local_cache.enabled:
+        local_cache.invalidate_model(model_name.lower())
+        redis_client.publish(
+            INVALIDATION_CHANNEL, f"version:{model_name.lower()}"
+        )
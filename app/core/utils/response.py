@@ -1,3 +1,16 @@
+# 📦 Fast JSON rendering for response bodies
+import json
+from decimal import Decimal
+from django.http import HttpResponse, StreamingHttpResponse
+from django.core.serializers.json import DjangoJSONEncoder
+from .redis import RawJson
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
 # 🎯 Creates a standardized success response format
 def success_response(data=None, message="Success", code=200):
     return {
@@ -21,3 +34,72 @@ def error_response(
         },
         "code": status_code      # 🔢 HTTP status code
     }
+
+
+def _orjson_default(value):
+    # 🔢 Types orjson leaves to the caller, encoded as DjangoJSONEncoder would
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError
+
+
+def render_json(data):
+    # ⚡ Renders data to JSON bytes (orjson when installed, stdlib otherwise)
+    if isinstance(data, RawJson):
+        return data
+    if orjson is not None:
+        return RawJson(orjson.dumps(
+            data, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS
+        ))
+    return RawJson(json.dumps(
+        data, cls=DjangoJSONEncoder, separators=(",", ":")
+    ).encode())
+
+
+def success_body(data=None, message="Success", code=200):
+    # 🧩 The success_response envelope as bytes, with data spliced in as is
+    # when it is already rendered (a cached RawJson body is never re-parsed)
+    return b"".join((
+        b'{"success":true,"message":', render_json(message),
+        b',"data":', render_json(data),
+        b',"code":', str(code).encode(), b"}",
+    ))
+
+
+def success_json_response(data=None, message="Success", status_code=200):
+    # 📤 HTTP response for success_body (same JSON as success_response)
+    return HttpResponse(
+        success_body(data, message, status_code),
+        content_type="application/json",
+        status=status_code,
+    )
+
+
+# 📦 Rows rendered into each streamed chunk
+STREAM_ROWS_PER_CHUNK = 500
+
+
+def success_chunks(rows, message="Success", code=200,
+                   rows_per_chunk=STREAM_ROWS_PER_CHUNK):
+    # 🚰 The success_body envelope in chunks, with data written as a JSON
+    # array rows_per_chunk rows at a time (rows may be a lazy iterator)
+    yield b'{"success":true,"message":' + render_json(message) + b',"data":['
+    rendered, separator = [], b""
+    for row in rows:
+        rendered.append(render_json(row))
+        if len(rendered) >= rows_per_chunk:
+            yield separator + b",".join(rendered)
+            rendered, separator = [], b","
+    if rendered:
+        yield separator + b",".join(rendered)
+    yield b'],"code":' + str(code).encode() + b"}"
+
+
+def success_stream_response(rows, message="Success", status_code=200):
+    # 📤 Streaming HTTP response for success_chunks (same JSON as
+    # success_response, without holding every row in memory)
+    return StreamingHttpResponse(
+        success_chunks(rows, message, status_code),
+        content_type="application/json",
+        status=status_code,
+    )
@@ -0,0 +1,138 @@
+# 📐 Count-Min sketch + heavy-hitter set in Redis for approximate top words
+import hashlib
+import math
+
+from .redis import LuaScript, redis_client
+
+# ➕ Applies signed word deltas to the sketch in one atomic round trip.
+# Each touched word's new estimate (min over its cells) is written to the
+# heavy-hitter zset, which is then trimmed to the configured capacity.
+SKETCH_UPDATE_SCRIPT = LuaScript("""
+local depth = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local total = 0
+local i = 3
+while i <= #ARGV do
+    local word = ARGV[i]
+    local delta = tonumber(ARGV[i + 1])
+    local estimate = nil
+    for row = 1, depth do
+        local field = (row - 1) .. ':' .. ARGV[i + 1 + row]
+        local value = redis.call('HINCRBY', KEYS[1], field, delta)
+        if estimate == nil or value < estimate then
+            estimate = value
+        end
+    end
+    if estimate > 0 then
+        redis.call('ZADD', KEYS[2], estimate, word)
+    else
+        redis.call('ZREM', KEYS[2], word)
+    end
+    total = total + delta
+    i = i + 2 + depth
+end
+local size = redis.call('ZCARD', KEYS[2])
+if size > capacity then
+    redis.call('ZREMRANGEBYRANK', KEYS[2], 0, size - capacity - 1)
+end
+return redis.call('INCRBY', KEYS[3], total)
+""")
+
+# 📦 Words per script call, so one huge delta cannot stall Redis
+SKETCH_BATCH_SIZE = 500
+
+
+class CountMinSketch:
+    """
+    📐 Count-Min sketch over word counts, stored in Redis.
+
+    Estimates never undercount, and overcount by at most epsilon * N
+    (N = total words counted) with probability 1 - delta. Memory is
+    width * depth counters plus `capacity` heavy-hitter candidates,
+    whatever the vocabulary size.
+    """
+
+    def __init__(self, name: str, epsilon=0.001, delta=0.01, capacity=1000):
+        self.epsilon = epsilon
+        self.delta = delta
+        self.width = math.ceil(math.e / epsilon)  # 📏 Counters per row
+        self.depth = math.ceil(math.log(1 / delta))  # 🧮 Independent rows
+        self.capacity = capacity  # 🏆 Heavy-hitter candidates kept
+        self.counters_key = f"sketch:{name}:counters"
+        self.heavy_key = f"sketch:{name}:heavy"
+        self.total_key = f"sketch:{name}:total"
+
+    def _columns(self, word: str):
+        # 🔀 depth column indexes from one digest (double hashing)
+        digest = hashlib.blake2b(word.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + row * h2) % self.width for row in range(self.depth)]
+
+    def add(self, delta):
+        """
+        ➕ Applies signed word deltas (word -> change in occurrences).
+        """
+        items = [(word, n) for word, n in delta.items() if n]
+        for start in range(0, len(items), SKETCH_BATCH_SIZE):
+            args = [self.depth, self.capacity]
+            for word, n in items[start:start + SKETCH_BATCH_SIZE]:
+                args.extend([word, n, *self._columns(word)])
+            SKETCH_UPDATE_SCRIPT(
+                keys=(self.counters_key, self.heavy_key, self.total_key),
+                args=args,
+            )
+
+    def estimate(self, words):
+        """
+        🔢 Current estimates for the given words (one HMGET).
+        """
+        words = list(words)
+        if not words:
+            return {}
+        fields = [
+            f"{row}:{column}"
+            for word in words
+            for row, column in enumerate(self._columns(word))
+        ]
+        values = redis_client.hmget(self.counters_key, fields)
+        estimates = {}
+        for index, word in enumerate(words):
+            cells = values[index * self.depth:(index + 1) * self.depth]
+            estimates[word] = min(int(value or 0) for value in cells)
+        return estimates
+
+    def total(self):
+        # 📊 N: total words counted (the error bound scales with it)
+        return int(redis_client.get(self.total_key) or 0)
+
+    def error_bound(self):
+        # 📏 Maximum overcount of any estimate, with probability 1 - delta
+        return math.ceil(self.epsilon * self.total())
+
+    def top(self, top_n):
+        """
+        🏆 Top N heavy hitters as (word, estimate), re-estimated on read so
+        the bound holds against the current total.
+        """
+        if top_n < 1:
+            return []
+        leaders = redis_client.zrevrange(
+            self.heavy_key, 0, top_n - 1, withscores=True
+        )
+        if not leaders:
+            return []
+        # 🔗 Include every candidate tied with the Nth so ties break by word
+        candidates = [
+            word.decode() if isinstance(word, bytes) else word
+            for word in redis_client.zrevrangebyscore(
+                self.heavy_key, "+inf", leaders[-1][1]
+            )
+        ]
+        estimates = self.estimate(candidates)
+        ranked = sorted(estimates.items(), key=lambda item: (-item[1], item[0]))
+        return [(word, n) for word, n in ranked[:top_n] if n > 0]
+
+    def reset(self):
+        # 🧹 Drops every counter, candidate and the total
+        redis_client.delete(self.counters_key, self.heavy_key, self.total_key)
@@ -0,0 +1,58 @@
+# 🔤 Tokenizer and counting helpers shared by the word-frequency engines
+import hashlib
+import heapq
+import re
+from collections import Counter
+
+# ✂️ A word is a run of word characters; text is lowercased first
+WORD_RE = re.compile(r"\b\w+\b")
+
+
+def count_words(text):
+    # 🔢 Counts the lowercase words in one piece of text
+    return Counter(WORD_RE.findall(text.lower())) if text else Counter()
+
+
+def word_delta(old_texts, new_texts):
+    # ➕➖ Net change in word counts when old_texts are replaced by new_texts
+    # 📝 Unlike Counter subtraction, negative counts are kept
+    delta = Counter()
+    for text in new_texts:
+        delta.update(count_words(text))
+    for text in old_texts:
+        delta.subtract(count_words(text))
+    return Counter({word: n for word, n in delta.items() if n})
+
+
+def count_words_in_chunks(texts, chunk_size=2000):
+    # 🚰 Counts words over an iterable of texts, chunk_size texts at a time
+    # 📏 Memory holds one chunk plus the vocabulary, never all of the text
+    counts = Counter()
+    chunk = []
+    for text in texts:
+        if text:
+            chunk.append(text)
+        if len(chunk) >= chunk_size:
+            counts.update(WORD_RE.findall(" ".join(chunk).lower()))
+            chunk.clear()
+    if chunk:
+        counts.update(WORD_RE.findall(" ".join(chunk).lower()))
+    return counts
+
+
+def top_words(counts, top_n):
+    # 🏆 Top N (word, count) pairs, ties by word, without sorting everything
+    return heapq.nsmallest(
+        top_n, counts.items(), key=lambda item: (-item[1], item[0])
+    )
+
+
+def normalize_search_query(query):
+    # 🔎 Canonical search terms: lowercase words, deduplicated and sorted,
+    # so "Steel BOLT" and "bolt, steel" share one cache entry
+    return sorted(set(WORD_RE.findall((query or "").lower())))
+
+
+def search_query_digest(terms):
+    # 🔑 Short fixed-length cache key component for a normalized query
+    return hashlib.sha1(" ".join(terms).encode()).hexdigest()[:16]
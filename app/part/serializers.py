@@ -2,6 +2,7 @@
 # Handles conversion between Part model instances and JSON/dict data
 from rest_framework import serializers
 from core.models import Part
+from core.services.part_service import PART_ORDERINGS
 
 
 class PartSerializer(serializers.ModelSerializer):
@@ -13,3 +14,77 @@ class PartSerializer(serializers.ModelSerializer):
         # 🎯 Configure serializer metadata
         model = Part  # Model to serialize
         fields = '__all__'  # Include all model fields in serialization
+
+
+class PartBulkSerializer(PartSerializer):
+    """
+    📦 Part serializer for bulk endpoints
+    Drops the per-row unique SKU query; bulk views check SKUs set-wise
+    """
+    class Meta(PartSerializer.Meta):
+        extra_kwargs = {"sku": {"validators": []}}
+
+
+class PartListQuerySerializer(serializers.Serializer):
+    """
+    🧹 Validates the filter and ordering query parameters of the list view
+    """
+    is_active = serializers.BooleanField(required=False)
+    weight_ounces_min = serializers.IntegerField(min_value=0, required=False)
+    weight_ounces_max = serializers.IntegerField(min_value=0, required=False)
+    sku_prefix = serializers.CharField(max_length=30, required=False)
+    ordering = serializers.ChoiceField(
+        choices=PART_ORDERINGS, required=False, default="id"
+    )
+
+    def validate(self, attrs):
+        # ⚖️ An empty weight range is almost certainly a client mistake
+        low = attrs.get("weight_ounces_min")
+        high = attrs.get("weight_ounces_max")
+        if low is not None and high is not None and low > high:
+            raise serializers.ValidationError(
+                "weight_ounces_min must not exceed weight_ounces_max."
+            )
+        return attrs
+
+
+# ✅ Validate a list of payloads, splitting valid rows from per-item errors
+# 📝 Returns ([(index, validated_data), ...], [{"index", "errors"}, ...])
+def validate_many(serializer_class, items):
+    serializer = serializer_class(data=items, many=True)
+    if serializer.is_valid():
+        return list(enumerate(serializer.validated_data)), []
+
+    errors = [
+        {"index": index, "errors": item_errors}
+        for index, item_errors in enumerate(serializer.errors)
+        if item_errors
+    ]
+    failed = {error["index"] for error in errors}
+    valid_indexes = [index for index in range(len(items)) if index not in failed]
+    if not valid_indexes:
+        return [], errors
+
+    # 🔁 Re-validate only the good rows to obtain their validated data
+    valid = serializer_class(
+        data=[items[index] for index in valid_indexes], many=True
+    )
+    valid.is_valid(raise_exception=True)
+    return list(zip(valid_indexes, valid.validated_data)), errors
+
+
+# 🏷️ Reject rows whose SKU already exists or repeats within the payload
+def reject_taken_skus(service, valid, errors):
+    existing = service.find_existing_skus(row["sku"] for _, row in valid)
+    seen, rows = set(), []
+    for index, row in valid:
+        if row["sku"] in existing or row["sku"] in seen:
+            errors.append({
+                "index": index,
+                "errors": {"sku": ["part with this sku already exists."]},
+            })
+            continue
+        seen.add(row["sku"])
+        rows.append(row)
+    errors.sort(key=lambda error: error["index"])
+    return rows, errors
@@ -1,27 +1,156 @@
 # 🔧 Imports for Django REST framework and Django core
 from rest_framework.views import APIView
 from rest_framework import status
-from django.http import JsonResponse
+from django.http import JsonResponse, StreamingHttpResponse
 from django.forms.models import model_to_dict
 
 # 📦 Import services and utilities
 from core.services.part_service import PartService
-from .serializers import PartSerializer
-from core.utils.response import success_response, error_response
+from .serializers import (
+    PartSerializer,
+    PartBulkSerializer,
+    PartListQuerySerializer,
+    validate_many,
+    reject_taken_skus,
+)
+from core.utils.response import (
+    success_response,
+    error_response,
+    success_json_response,
+    success_stream_response,
+)
+from core.utils.conditional import versioned_etag
+from core.utils.compression import precompressed, get_compression_stats
+from core.utils.export import EXPORT_FORMATS, export_chunks
+from core.utils.pagination import parse_limit, parse_fields, parse_ids
+from core.utils.redis import get_pool_stats, get_local_cache_stats
 
 # Initialize part service
 part_service = PartService()
 
+# 📦 Maximum number of parts accepted by one bulk request
+MAX_BULK_ITEMS = 5000
+
+# 🧹 Query parameters that switch the list view to the filtered path
+FILTER_PARAMS = (
+    "is_active", "weight_ounces_min", "weight_ounces_max", "sku_prefix",
+    "ordering",
+)
+
+
+# ⚠️ 400 response for a bulk body whose items all failed validation
+def bulk_validation_error_response(errors):
+    return JsonResponse(
+        error_response(
+            message="Validation failed.",
+            code="validation_error",
+            details=errors,
+            status_code=status.HTTP_400_BAD_REQUEST
+        ),
+        status=status.HTTP_400_BAD_REQUEST
+    )
+
+
+# ⚠️ 400 response for a malformed query parameter
+def invalid_parameter_response(message):
+    return JsonResponse(
+        error_response(
+            message=message,
+            code="invalid_parameter",
+            status_code=status.HTTP_400_BAD_REQUEST
+        ),
+        status=status.HTTP_400_BAD_REQUEST
+    )
+
+
+# ⚠️ 400 response for a bulk body that is not a usable JSON array
+def invalid_bulk_body_response():
+    return JsonResponse(
+        error_response(
+            message=(
+                "Expected a non-empty JSON array of at most "
+                f"{MAX_BULK_ITEMS} parts."
+            ),
+            code="invalid_payload",
+            status_code=status.HTTP_400_BAD_REQUEST
+        ),
+        status=status.HTTP_400_BAD_REQUEST
+    )
+
 
 # 📝 View for handling list operations on Parts
 class PartListView(APIView):
-    # 📋 Get all parts
+    # 📋 Get all parts (keyset-paginated when ?limit= or ?cursor= is given,
+    # filtered and ordered server-side when any FILTER_PARAMS is given,
+    # narrowed to a comma-separated ?fields= list when one is given)
+    @versioned_etag("part")
+    @precompressed("part", ttl=part_service.ttl_config["all"])
     def get(self, request):
-        parts = part_service.find_all()
-        return JsonResponse(
-            success_response(parts, "Parts retrieved"),
-            status=status.HTTP_200_OK
-        )
+        if "ids" in request.GET:
+            return self._by_ids(request)
+        if any(param in request.GET for param in FILTER_PARAMS):
+            return self._filtered(request)
+
+        fields = parse_fields(request.GET.get("fields"))
+        if "limit" in request.GET or "cursor" in request.GET:
+            try:
+                limit = parse_limit(request.GET.get("limit"))
+                page = part_service.find_page(
+                    limit, request.GET.get("cursor"), fields, rendered=True
+                )
+            except ValueError:
+                return invalid_parameter_response(
+                    "Invalid value for limit, cursor or fields"
+                )
+            return success_json_response(page, "Parts retrieved")
+
+        # 🚰 The whole catalog is streamed from a server-side cursor and
+        # never cached; page with ?limit= for cached reads
+        try:
+            parts = part_service.find_all(fields)
+        except ValueError:
+            return invalid_parameter_response("Invalid value for fields")
+        return success_stream_response(parts, "Parts retrieved")
+
+    # 📚 Many parts by ID in one call (?ids=1,2,3), in request order
+    def _by_ids(self, request):
+        try:
+            parts = part_service.find_many_by_ids(
+                parse_ids(request.GET.get("ids")),
+                parse_fields(request.GET.get("fields")),
+            )
+        except ValueError:
+            return invalid_parameter_response("Invalid value for ids or fields")
+        return success_json_response(parts, "Parts retrieved")
+
+    # 🧹 One filtered, ordered keyset page
+    def _filtered(self, request):
+        # 📝 Plain dict: a QueryDict would turn a missing boolean into False
+        query = PartListQuerySerializer(data=request.GET.dict())
+        if not query.is_valid():
+            return JsonResponse(
+                error_response(
+                    message="Validation failed.",
+                    code="validation_error",
+                    details=query.errors,
+                    status_code=status.HTTP_400_BAD_REQUEST
+                ),
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        criteria = dict(query.validated_data)
+        ordering = criteria.pop("ordering")
+        try:
+            limit = parse_limit(request.GET.get("limit"))
+            page = part_service.filter_parts(
+                criteria, ordering, limit, request.GET.get("cursor"),
+                parse_fields(request.GET.get("fields")), rendered=True,
+            )
+        except ValueError:
+            return invalid_parameter_response(
+                "Invalid value for limit, cursor or fields"
+            )
+        return success_json_response(page, "Parts retrieved")
 
     # ➕ Create new part
     def post(self, request):
@@ -45,11 +174,117 @@ class PartListView(APIView):
         )
 
 
+# 📦 View for bulk operations on Parts
+class PartBulkView(APIView):
+    # ➕ Create many parts; invalid items are reported, valid ones inserted
+    def post(self, request):
+        items = request.data
+        if not isinstance(items, list) or not 0 < len(items) <= MAX_BULK_ITEMS:
+            return invalid_bulk_body_response()
+
+        valid, errors = validate_many(PartBulkSerializer, items)
+        rows, errors = reject_taken_skus(part_service, valid, errors)
+        if not rows:
+            return bulk_validation_error_response(errors)
+
+        created = part_service.bulk_create(rows)
+        data = {
+            "created": len(created),
+            # 🆔 IDs are only known on databases that return them (Postgres)
+            "ids": [part.id for part in created if part.id is not None],
+            "errors": errors,
+        }
+        return JsonResponse(
+            success_response(data, "Parts created"),
+            status=status.HTTP_201_CREATED
+        )
+
+    # 🔁 Idempotent insert-or-update keyed by SKU; unchanged rows are skipped
+    def put(self, request):
+        items = request.data
+        if not isinstance(items, list) or not 0 < len(items) <= MAX_BULK_ITEMS:
+            return invalid_bulk_body_response()
+
+        valid, errors = validate_many(PartBulkSerializer, items)
+        if not valid:
+            return bulk_validation_error_response(errors)
+
+        summary = part_service.bulk_upsert([row for _, row in valid])
+        data = {
+            "created": summary["created"],
+            "updated": summary["updated"],
+            "unchanged": summary["unchanged"],
+            "errors": errors,
+        }
+        return JsonResponse(
+            success_response(data, "Parts upserted"),
+            status=status.HTTP_200_OK
+        )
+
+
+# 🔎 View for full-text search over Parts
+class PartSearchView(APIView):
+    # 🔎 Search parts by keyword (?q=), best match first, keyset-paginated
+    @versioned_etag("part")
+    def get(self, request):
+        try:
+            limit = parse_limit(request.GET.get("limit"))
+            page = part_service.search(
+                request.GET.get("q", ""), limit, request.GET.get("cursor")
+            )
+        except ValueError:
+            return invalid_parameter_response(
+                "Invalid value for q, limit or cursor"
+            )
+        return JsonResponse(
+            success_response(page, "Parts found"),
+            status=status.HTTP_200_OK
+        )
+
+
+# 📤 View for streaming the whole catalog to ETL jobs
+class PartExportView(APIView):
+    # 🧭 ?format= is ours, not DRF's renderer override: never 404 on it
+    def perform_content_negotiation(self, request, force=False):
+        return super().perform_content_negotiation(request, force=True)
+
+    # 🚰 Stream every part as NDJSON (default) or CSV, in ID order, from a
+    # server-side cursor; ?since_id= resumes after the last ID received
+    def get(self, request):
+        export_format = request.GET.get("format", "ndjson")
+        try:
+            if export_format not in EXPORT_FORMATS:
+                raise ValueError("Unknown export format")
+            since_id = request.GET.get("since_id")
+            fields, rows = part_service.export_rows(
+                int(since_id) if since_id else None,
+                parse_fields(request.GET.get("fields")),
+            )
+        except ValueError:
+            return invalid_parameter_response(
+                "Invalid value for format, since_id or fields"
+            )
+        response = StreamingHttpResponse(
+            export_chunks(export_format, fields, rows),
+            content_type=EXPORT_FORMATS[export_format],
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="parts.{export_format}"'
+        )
+        return response
+
+
 # 🔍 View for handling operations on individual Parts
 class PartDetailView(APIView):
-    # 👀 Get single part by ID
+    # 👀 Get single part by ID (narrowed to ?fields= when given)
+    @versioned_etag("part")
     def get(self, request, pk):
-        part = part_service.find_by_id(pk)
+        try:
+            part = part_service.find_by_id(
+                pk, parse_fields(request.GET.get("fields"))
+            )
+        except ValueError:
+            return invalid_parameter_response("Invalid value for fields")
         return JsonResponse(
             success_response(part, "Part retrieved"),
             status=status.HTTP_200_OK
@@ -106,21 +341,47 @@ class PartDetailView(APIView):
 
 # 📊 View for retrieving statistics about Parts
 class PartStatsView(APIView):
-    # 📈 Get most common words in part descriptions
+    # 📈 Get most common words in part descriptions (?mode=approx for the
+    # sketch, ?max_error= for the tolerated overcount)
+    @versioned_etag("part")
+    @precompressed("part", ttl=part_service.ttl_config["words"])
     def get(self, request):
         top_n = request.GET.get("top_n", 5)
+        mode = request.GET.get("mode", "exact")
         try:
             top_n = int(top_n)
+            max_error = request.GET.get("max_error")
+            max_error = float(max_error) if max_error is not None else None
         except ValueError:
             return JsonResponse(
                 error_response(
-                    message="Invalid value for top_n",
+                    message="Invalid value for top_n or max_error",
                     code="invalid_parameter",
                     status_code=status.HTTP_400_BAD_REQUEST
                 ),
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+        if mode not in ("exact", "approx"):
+            return JsonResponse(
+                error_response(
+                    message="mode must be 'exact' or 'approx'",
+                    code="invalid_parameter",
+                    status_code=status.HTTP_400_BAD_REQUEST
+                ),
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        # 📐 Approximate heavy hitters with an error bound
+        if mode == "approx":
+            result = part_service.find_most_common_words_approx(
+                top_n, max_error
+            )
+            return JsonResponse(
+                success_response(result, "Most common words estimated"),
+                status=status.HTTP_200_OK
+            )
+
         common_words = part_service.find_most_common_words_in_descriptions(
             top_n
         )
@@ -128,3 +389,19 @@ class PartStatsView(APIView):
             success_response(common_words, "Most common words retrieved"),
             status=status.HTTP_200_OK
         )
+
+
+# 📈 View exposing this worker's cache and connection pool statistics
+class CacheStatsView(APIView):
+    # 📊 Get Redis pool usage, L1 cache hit/miss counters and response
+    # compression ratio/time per encoding
+    def get(self, request):
+        stats = {
+            "redis_pool": get_pool_stats(),
+            "local_cache": get_local_cache_stats(),
+            "response_compression": get_compression_stats(),
+        }
+        return JsonResponse(
+            success_response(stats, "Cache statistics retrieved"),
+            status=status.HTTP_200_OK
+        )
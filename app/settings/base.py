@@ -9,6 +9,66 @@ SECRET_KEY = os.getenv("DJANGO_SECRET_KEY", "insecure-key")
 DEBUG = os.getenv("DJANGO_DEBUG", "True") == "True"
 REDIS_URL = os.getenv("REDIS_URL", "redis://redis:6379/0")
 
+# 🔌 Redis connection pool and timeouts (seconds)
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+REDIS_POOL_TIMEOUT = float(os.getenv("REDIS_POOL_TIMEOUT", "2"))
+REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", "2"))
+REDIS_SOCKET_CONNECT_TIMEOUT = float(os.getenv("REDIS_SOCKET_CONNECT_TIMEOUT", "1"))
+REDIS_HEALTH_CHECK_INTERVAL = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", "30"))
+REDIS_SOCKET_KEEPALIVE = os.getenv("REDIS_SOCKET_KEEPALIVE", "True") == "True"
+
+# 🧠 Optional per-worker L1 cache in front of Redis
+CACHE_L1_ENABLED = os.getenv("CACHE_L1_ENABLED", "False") == "True"
+CACHE_L1_MAX_ENTRIES = int(os.getenv("CACHE_L1_MAX_ENTRIES", "1024"))
+CACHE_L1_MAX_BYTES = int(os.getenv("CACHE_L1_MAX_BYTES", str(32 * 1024 * 1024)))
+CACHE_L1_TTL = int(os.getenv("CACHE_L1_TTL", "30"))
+CACHE_L1_VERSION_TTL = int(os.getenv("CACHE_L1_VERSION_TTL", "5"))
+
+# 🥱 Serve the previous list/page value while one worker refreshes a miss
+CACHE_STALE_WHILE_REVALIDATE = (
+    os.getenv("CACHE_STALE_WHILE_REVALIDATE", "False") == "True"
+)
+
+# 🗜️ Codec for cached parts: json | orjson | msgpack, compression zlib | lz4
+PART_CACHE_SERIALIZER = os.getenv("PART_CACHE_SERIALIZER", "orjson")
+PART_CACHE_COMPRESSION = os.getenv("PART_CACHE_COMPRESSION", "zlib") or None
+PART_CACHE_COMPRESS_MIN_BYTES = int(
+    os.getenv("PART_CACHE_COMPRESS_MIN_BYTES", "16384")
+)
+# 🎟️ Distinct filter sets whose list pages are cached per model version
+PART_CACHE_MAX_FILTER_SHAPES = int(
+    os.getenv("PART_CACHE_MAX_FILTER_SHAPES", "256")
+)
+
+# 🗜️ Encodings stored for large list/stats bodies, in preference order:
+# br | zstd (when brotli / zstandard are installed) | gzip
+RESPONSE_COMPRESSION_ENCODINGS = [
+    name.strip()
+    for name in os.getenv("RESPONSE_COMPRESSION_ENCODINGS", "br,gzip").split(",")
+    if name.strip()
+]
+RESPONSE_COMPRESSION_MIN_BYTES = int(
+    os.getenv("RESPONSE_COMPRESSION_MIN_BYTES", "1024")
+)
+# 🎟️ Compressed bodies stored per model version (path x encoding)
+RESPONSE_COMPRESSION_MAX_VARIANTS = int(
+    os.getenv("RESPONSE_COMPRESSION_MAX_VARIANTS", "512")
+)
+
+# 📊 Most-common-words engine:
+# index (maintained table) | database | stream | parallel (per query)
+WORD_STATS_ENGINE = os.getenv("WORD_STATS_ENGINE", "index")
+# ⚙️ Worker processes used by the parallel engine and count_words_parallel
+WORD_STATS_WORKERS = int(os.getenv("WORD_STATS_WORKERS", "4"))
+# 🏆 Size of the cached top-K list that serves every top_n <= K
+WORD_STATS_TOP_K = int(os.getenv("WORD_STATS_TOP_K", "1000"))
+
+# 📐 Count-Min sketch for ?mode=approx (overcount <= EPSILON * N w.p. 1 - DELTA)
+WORD_SKETCH_ENABLED = os.getenv("WORD_SKETCH_ENABLED", "False") == "True"
+WORD_SKETCH_EPSILON = float(os.getenv("WORD_SKETCH_EPSILON", "0.001"))
+WORD_SKETCH_DELTA = float(os.getenv("WORD_SKETCH_DELTA", "0.01"))
+WORD_SKETCH_CAPACITY = int(os.getenv("WORD_SKETCH_CAPACITY", "1000"))
+
 INSTALLED_APPS = [
     'django.contrib.admin',
     'django.contrib.auth',
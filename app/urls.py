@@ -5,7 +5,15 @@ from rest_framework import permissions
 from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
 # 📝 Import views for parts functionality
-from part.views import PartListView, PartDetailView, PartStatsView
+from part.views import (
+    PartListView,
+    PartBulkView,
+    PartSearchView,
+    PartExportView,
+    PartDetailView,
+    PartStatsView,
+    CacheStatsView,
+)
 
 # 📚 Configure Swagger/OpenAPI documentation
 schema_view = get_schema_view(
@@ -34,9 +42,15 @@ urlpatterns = [
 
     # 🔍 API endpoints for parts
     path('api/v1/parts', PartListView.as_view()),
+    path('api/v1/parts/bulk', PartBulkView.as_view()),
+    path('api/v1/parts/search', PartSearchView.as_view()),
+    path('api/v1/parts/export', PartExportView.as_view()),
     path('api/v1/parts/<int:pk>', PartDetailView.as_view()),
     path('api/v1/parts/most-common-words/', PartStatsView.as_view()),
 
+    # 📈 Cache diagnostics
+    path('api/v1/cache/stats', CacheStatsView.as_view()),
+
     # 📖 API Documentation URLs
     path(
         'swagger',